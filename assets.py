@@ -1,56 +1,58 @@
 #This is assets.py - handles loading and managing game assets for Bomberman
 
+import threading
 import pygame
+from atlas import load_or_build
+from surface_cache import LRUSurfaceCache
 import gamesetting as gs
 
 class Assets:
-    def __init__(self):
+    # Every sprite set the game uses:
+    # name -> (sheet file, coordinate dict, row height, col width, crop width, crop height)
+    # All frames are scaled up to gs.SIZE x gs.SIZE
+    SPRITE_SPECS = {
         # DO NOT SCALE the sprite sheet if it's already the correct size (325x257)
-        # Assuming "owncreation.png" is the 325x257 image
-        self.sprite_sheet = self.load_sprite_sheet("images", "owncreation.png") # Removed hardcoded size | THIS IS FOR CHARACTER
-        #self.sprite_sheet = self.load_sprite_sheet("images","BombermanNES2-tiles.png")
-        self.player_char = self.load_sprite_range(
-            gs.PLAYER, 
-            self.sprite_sheet, 
-            row=gs.SPRITE_HEIGHT, # Use new constants
-            col=gs.SPRITE_WIDTH, 
-            width=gs.SPRITE_WIDTH, 
-            height=gs.SPRITE_HEIGHT,
-            resize=True # Added resize to scale it up to a visible game size, e.g., 32x32
-        )
-
-        #self.sprite_sheet = self.load_sprite_sheet("images", "BombermanPCE-tiles.png") # Removed hardcoded size
-        self.sprite_sheet = self.load_sprite_sheet("images", "sprite_sheet (1).png") # Removed hardcoded size | THIS IS FOR BLOCKS
-        self.hard_block = self.load_sprite_range(
-            gs.HARD_BLOCK, 
-            self.sprite_sheet, 
-            row=gs.TILE_HEIGHT, 
-            col=gs.TILE_WIDTH, 
-            width=gs.TILE_WIDTH - 1,
-            height=gs.TILE_HEIGHT,
-            resize=True            
-        )
-
-        self.soft_block = self.load_sprite_range(
-            gs.SOFT_BLOCK, # Use the coordinates defined in gamesetting
-            self.sprite_sheet, # Use the same sprite sheet
-            row=gs.TILE_HEIGHT, 
-            col=gs.TILE_WIDTH, 
-            width=gs.TILE_WIDTH - 1,
-            height=gs.TILE_HEIGHT,
-            resize=True            
-        )
-
-        self.sprite_sheet = self.load_sprite_sheet("images", "bomb.png")# THIS IS FOR BOMB
-        self.bomb = self.load_sprite_range(
-            gs.BOMB, # Use the coordinates defined in gamesetting
-            self.sprite_sheet, # Use the same sprite sheet
-            row=gs.TILE_HEIGHT, 
-            col=gs.TILE_WIDTH, 
-            width=gs.TILE_WIDTH - 1,
-            height=gs.TILE_HEIGHT,
-            resize=True            
-        )
+        # "owncreation.png" is the 325x257 image | THIS IS FOR CHARACTER
+        "player_char": ("owncreation.png", gs.PLAYER,
+                        gs.SPRITE_HEIGHT, gs.SPRITE_WIDTH, gs.SPRITE_WIDTH, gs.SPRITE_HEIGHT),
+        # THIS IS FOR BLOCKS
+        "hard_block": ("sprite_sheet (1).png", gs.HARD_BLOCK,
+                       gs.TILE_HEIGHT, gs.TILE_WIDTH, gs.TILE_WIDTH - 1, gs.TILE_HEIGHT),
+        "soft_block": ("sprite_sheet (1).png", gs.SOFT_BLOCK,
+                       gs.TILE_HEIGHT, gs.TILE_WIDTH, gs.TILE_WIDTH - 1, gs.TILE_HEIGHT),
+        # THIS IS FOR BOMB
+        "bomb": ("bomb.png", gs.BOMB,
+                 gs.TILE_HEIGHT, gs.TILE_WIDTH, gs.TILE_WIDTH - 1, gs.TILE_HEIGHT),
+        # THIS IS FOR EXPLOSIONS
+        "flame": ("bombFire.png", gs.FLAME,
+                  gs.FLAME_TILE, gs.FLAME_TILE, gs.FLAME_TILE, gs.FLAME_TILE),
+        # THIS IS FOR ENEMIES
+        "enemy": ("enemysmall.png", gs.ENEMY,
+                  gs.ENEMY_STRIDE, gs.ENEMY_STRIDE, gs.ENEMY_TILE, gs.ENEMY_TILE),
+    }
+
+    def __init__(self, image_dir="images", cache_bytes=gs.ASSET_CACHE_BYTES):
+        """
+        CONSTRUCTOR - Set up lazy asset loading (nothing is decoded here)
+
+        PARAMETERS:
+        - image_dir: Folder holding the sprite sheets
+        - cache_bytes: Pixel memory budget of the LRU cache for sheets and
+          frame sets that are not part of the atlas
+
+        NOTES:
+        - The core sets (SPRITE_SPECS) come pre-sliced and pre-scaled from one
+          atlas file cached on disk (see atlas.py), loaded on first access
+        - Any other sheet / registered sprite set is decoded on first access
+          and kept in an LRU cache, so memory stays flat as content grows
+        """
+        self.image_dir = image_dir
+        self.specs = dict(self.SPRITE_SPECS)   # Core sets + register_sprite_set() extras
+        self.atlas = None                      # Loaded on first core set access
+        self.core_sets = {}                    # Core sets handed out so far (small, pinned)
+        self.cache = LRUSurfaceCache(cache_bytes)
+        self.unconverted = set()               # Sheets a prefetch thread put in the cache (not converted yet)
+        self.prefetch_lock = threading.Lock()
 
         #This is from gemini as a test
         # --- ADD THIS CODE BELOW ---
@@ -61,9 +63,134 @@ class Assets:
         # Save it so game.py can find it
         self.background = {"background": [bg_surface]}
 
+    # CORE SPRITE SETS - same attribute names the rest of the game already uses
+    @property
+    def player_char(self):
+        return self.sprite_set("player_char")
+
+    @property
+    def hard_block(self):
+        return self.sprite_set("hard_block")
+
+    @property
+    def soft_block(self):
+        return self.sprite_set("soft_block")
+
+    @property
+    def bomb(self):
+        return self.sprite_set("bomb")
+
+    @property
+    def flame(self):
+        return self.sprite_set("flame")
+
+    @property
+    def enemy(self):
+        return self.sprite_set("enemy")
+
+    def register_sprite_set(self, name, spec):
+        """
+        Add a sprite set that is loaded lazily from its sheet.
+        spec = (sheet file, coordinate dict, row height, col width, crop width, crop height)
+        """
+        self.specs[name] = spec
+        self.cache.discard(("frames", name))
+
+    def sprite_set(self, name):
+        """
+        SPRITE_SET - Return {animation: [Surface, ...]} for a sprite set
+
+        LOOKUP ORDER:
+        1. Core sets: from the atlas (loaded once, never evicted)
+        2. Other sets: from the LRU cache, else sliced + scaled from the sheet
+        """
+        if name in self.SPRITE_SPECS:
+            frames = self.core_sets.get(name)
+            if frames is None:
+                if self.atlas is None:
+                    self.atlas = load_or_build(self.SPRITE_SPECS, self.image_dir, self)
+                frames = self.core_sets[name] = self.atlas.sprite_set(name)
+            return frames
+
+        key = ("frames", name)
+        frames = self.cache.get(key)
+        if frames is None:
+            file_name, coords, row, col, width, height = self.specs[name]
+            frames = self.load_sprite_range(coords, self.sheet(file_name),
+                                            row, col, width, height, resize=True)
+            self.cache.put(key, frames)
+        return frames
+
+    def sheet(self, file_name):
+        """SHEET - Return a decoded sprite sheet (cached, possibly prefetched, or loaded now)"""
+        key = ("sheet", file_name)
+        image = self.cache.get(key)
+        if image is None:
+            return self.cache.put(key, self.load_sprite_sheet(self.image_dir, file_name))
+        if file_name in self.unconverted and self.display_ready():
+            # Prefetch threads only decode; converting must happen on the main thread
+            with self.prefetch_lock:
+                self.unconverted.discard(file_name)
+            image = self.cache.put(key, image.convert_alpha())
+        return image
+
+    def prefetch(self, names):
+        """
+        PREFETCH - Decode the sheets of the given sprite sets on a background thread
+
+        PARAMETERS:
+        - names: Sprite set names (e.g. the next level's) or sheet file names
+
+        RETURNS:
+        - The started daemon thread (join() it to wait), or None if nothing to do
+
+        NOTES:
+        - Decoded sheets go straight into the LRU cache, so they count
+          against its byte budget like any other sheet
+        """
+        files = []
+        for name in names:
+            file_name = self.specs[name][0] if name in self.specs else name
+            if ("sheet", file_name) not in self.cache and file_name not in files:
+                files.append(file_name)
+        if not files:
+            return None
+
+        def worker():
+            for file_name in files:
+                key = ("sheet", file_name)
+                if key in self.cache:
+                    continue
+                image = self.load_sprite_sheet(self.image_dir, file_name)
+                with self.prefetch_lock:
+                    self.unconverted.add(file_name)
+                self.cache.put(key, image)
+
+        thread = threading.Thread(target=worker, name="asset-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def frame_sets(self):
+        """Every frame collection currently loaded (core sets, background, cached sets)."""
+        sets = [self.sprite_set(name) for name in self.SPRITE_SPECS]
+        sets.append(self.background)
+        with self.cache.lock:
+            sets.extend(value for key, (value, _) in self.cache.entries.items() if key[0] == "frames")
+        return sets
+
+    @staticmethod
+    def display_ready():
+        """True when surfaces can be converted: a display exists and we are on the main thread."""
+        return (pygame.display.get_surface() is not None and
+                threading.current_thread() is threading.main_thread())
+
     def load_sprite_sheet(self, path, file_name): # Removed width, height arguments
         """Load a sprite sheet.""" 
-        image = pygame.image.load(f"{path}/{file_name}").convert_alpha()
+        image = pygame.image.load(f"{path}/{file_name}")
+        # convert_alpha() needs a display mode (and the main thread); headless
+        # runs and prefetch threads keep the decoded image as is
+        if self.display_ready():
+            image = image.convert_alpha()
         # image = pygame.transform.scale(image, (width, height)) # REMOVED SCALING
         return image
     
@@ -0,0 +1,206 @@
+#This is atlas.py - packs and caches pre-scaled sprite frames for Bomberman
+import hashlib
+import json
+import math
+import os
+import struct
+import zlib
+import pygame
+import gamesetting as gs
+
+# ============================================================================
+# FILE: atlas.py - SPRITE ATLAS WITH ON-DISK CACHE
+# ============================================================================
+# PURPOSE:
+#   Decoding the PNG sheets and scaling every frame up to gs.SIZE is most of
+#   the startup time. This module does that work once:
+#   - build_atlas(): Slice + scale every frame the game uses and pack them
+#     into one surface, plus an index {sprite set: {animation: [frame ids]}}
+#   - save_atlas()/load_atlas(): Store the atlas as ONE file (header + index
+#     + zlib-compressed RGBA pixels) so startup is a single read
+#   - atlas_key(): Cache key from the source file contents, gs.SIZE and the
+#     frame coordinates, so editing a sheet or a setting rebuilds the atlas
+#
+# FILE FORMAT:
+#   MAGIC (8 bytes) | index length (uint32) | JSON index | zlib(RGBA pixels)
+#
+# DEPENDENCIES:
+#   - pygame: Surfaces, scaling, raw pixel conversion
+#   - hashlib, zlib, json, struct: Cache key and file format
+#   - gamesetting: Tile size and cache folder
+# ============================================================================
+
+MAGIC = b"BMATLAS1"
+LENGTH = struct.Struct("<I")
+ATLAS_VERSION = 1   # Bump when the packing/format changes to invalidate old caches
+
+
+def atlas_key(specs, image_dir):
+  """
+  ATLAS_KEY - Hash everything the atlas depends on
+
+  PARAMETERS:
+  - specs: {set name: (sheet file, coordinate dict, row, col, width, height)}
+  - image_dir: Folder holding the sheets
+
+  NOTES:
+  - Reads the raw sheet bytes (cheap) but never decodes them
+  """
+  digest = hashlib.sha1()
+  digest.update(("%d:%d:" % (ATLAS_VERSION, gs.SIZE)).encode())
+  digest.update(json.dumps(specs, sort_keys=True).encode())
+  for file_name in sorted({spec[0] for spec in specs.values()}):
+    with open(os.path.join(image_dir, file_name), "rb") as file:
+      digest.update(file_name.encode())
+      digest.update(file.read())
+  return digest.hexdigest()[:20]
+
+
+def build_atlas(specs, image_dir, assets):
+  """
+  BUILD_ATLAS - Slice, scale and pack every frame listed in specs
+
+  PARAMETERS:
+  - specs: {set name: (sheet file, coordinate dict, row, col, width, height)}
+  - image_dir: Folder holding the sheets
+  - assets: Assets instance (its load_sprite_sheet/load_sprites do the slicing)
+
+  RETURNS:
+  - (surface, index) where index = {"frame_size", "columns", "count", "sets"}
+
+  NOTES:
+  - Identical frames (same sheet + rect) are stored once and shared
+  - Every frame is scaled to gs.SIZE x gs.SIZE, as Assets did before
+  """
+  sheets = {}
+  frame_ids = {}     # (sheet, x, y, w, h) -> frame id
+  frames = []        # scaled surfaces in frame id order
+  sets = {}
+  for set_name, (file_name, coords, row, col, width, height) in specs.items():
+    if file_name not in sheets:
+      sheets[file_name] = assets.load_sprite_sheet(image_dir, file_name)
+    sets[set_name] = {}
+    for animation, coord_list in coords.items():
+      ids = []
+      for coord in coord_list:
+        key = (file_name, coord[1] * col, coord[0] * row, width, height)
+        if key not in frame_ids:
+          image = assets.load_sprites(sheets[file_name], key[1], key[2], width, height)
+          frames.append(pygame.transform.scale(image, (gs.SIZE, gs.SIZE)))
+          frame_ids[key] = len(frames) - 1
+        ids.append(frame_ids[key])
+      sets[set_name][animation] = ids
+
+  columns = max(1, int(math.ceil(math.sqrt(len(frames)))))
+  rows = max(1, int(math.ceil(len(frames) / columns)))
+  surface = pygame.Surface((columns * gs.SIZE, rows * gs.SIZE), pygame.SRCALPHA)
+  surface.fill((0, 0, 0, 0))
+  for frame_id, frame in enumerate(frames):
+    surface.blit(frame, ((frame_id % columns) * gs.SIZE, (frame_id // columns) * gs.SIZE))
+
+  index = {"frame_size": gs.SIZE, "columns": columns, "count": len(frames), "sets": sets}
+  return surface, index
+
+
+def save_atlas(path, surface, index):
+  """Write the atlas to one file (see FILE FORMAT). Returns False if the disk is not writable."""
+  header = dict(index, width=surface.get_width(), height=surface.get_height())
+  header_bytes = json.dumps(header).encode()
+  pixels = zlib.compress(pygame.image.tobytes(surface, "RGBA"), 1)
+  try:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Write to a temp file first so a crash never leaves a half-written cache
+    with open(path + ".tmp", "wb") as file:
+      file.write(MAGIC + LENGTH.pack(len(header_bytes)) + header_bytes + pixels)
+    os.replace(path + ".tmp", path)
+  except OSError:
+    return False
+  return True
+
+
+def remove_stale_atlases(path):
+  """Delete the other atlas_*.bin files next to 'path' (caches of old sheets/settings)."""
+  folder = os.path.dirname(path) or "."
+  keep = os.path.basename(path)
+  try:
+    names = os.listdir(folder)
+  except OSError:
+    return
+  for name in names:
+    if name.startswith("atlas_") and name.endswith(".bin") and name != keep:
+      try:
+        os.remove(os.path.join(folder, name))
+      except OSError:
+        pass
+
+
+def load_atlas(path):
+  """
+  LOAD_ATLAS - Read an atlas file in one go
+
+  RETURNS:
+  - (surface, index), or None if the file is missing or unreadable
+  """
+  try:
+    with open(path, "rb") as file:
+      data = file.read()
+  except OSError:
+    return None
+  if not data.startswith(MAGIC):
+    return None
+  try:
+    (header_len,) = LENGTH.unpack_from(data, len(MAGIC))
+    start = len(MAGIC) + LENGTH.size
+    index = json.loads(data[start:start + header_len])
+    pixels = zlib.decompress(data[start + header_len:])
+    surface = pygame.image.frombytes(pixels, (index["width"], index["height"]), "RGBA")
+  except (ValueError, zlib.error, KeyError, struct.error):
+    return None
+  return surface, index
+
+
+# ============================================================================
+# CLASS: SpriteAtlas - Hands out the frames stored in an atlas surface
+# ============================================================================
+class SpriteAtlas:
+  def __init__(self, surface, index):
+    """
+    CONSTRUCTOR - Wrap a packed atlas surface and its index
+
+    NOTES:
+    - Frames are subsurfaces: they share the atlas pixels, nothing is copied
+    """
+    if pygame.display.get_surface() is not None:
+      surface = surface.convert_alpha()
+    self.surface = surface
+    self.index = index
+    size = index["frame_size"]
+    columns = index["columns"]
+    self.frames = [
+      surface.subsurface(((frame_id % columns) * size, (frame_id // columns) * size, size, size))
+      for frame_id in range(index["count"])
+    ]
+
+  def sprite_set(self, name):
+    """Return {animation: [Surface, ...]} for one sprite set (same shape as load_sprite_range)."""
+    return {animation: [self.frames[frame_id] for frame_id in ids]
+            for animation, ids in self.index["sets"][name].items()}
+
+
+def load_or_build(specs, image_dir, assets, cache_dir=gs.CACHE_DIR):
+  """
+  LOAD_OR_BUILD - Return a SpriteAtlas, from the disk cache when it is current
+
+  STEPS:
+  1. Compute the cache key from the sheet contents + gs.SIZE + specs
+  2. If .cache/atlas_<key>.bin exists, load it with one read
+  3. Otherwise build the atlas from the sheets and try to save it; older
+     atlas files are deleted so .cache/ does not grow with every change
+  """
+  path = os.path.join(cache_dir, "atlas_%s.bin" % atlas_key(specs, image_dir))
+  loaded = load_atlas(path)
+  if loaded is None:
+    loaded = build_atlas(specs, image_dir, assets)
+    if save_atlas(path, *loaded):
+      remove_stale_atlases(path)
+  return SpriteAtlas(*loaded)
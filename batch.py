@@ -0,0 +1,201 @@
+#This is batch.py - runs many headless Bomberman matches in parallel
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+import numpy as np
+import pygame
+from assets import Assets
+from headless import HeadlessGame
+from gameinput import key_event
+from level_grid import SOFT
+from replay import state_digest
+import gamesetting as gs
+
+# ============================================================================
+# FILE: batch.py - PARALLEL BATCH SIMULATION
+# ============================================================================
+# PURPOSE:
+#   Evaluates input policies and level layouts over many matches:
+#   - Every match is an independent HeadlessGame (own seed, own input policy,
+#     virtual clock), so matches share nothing and run on any core
+#   - Matches are spread over a multiprocessing pool; each worker process
+#     loads the Assets once and then runs match after match
+#   - Results stream back as each match finishes (imap_unordered), one
+#     JSON line per match, followed by a summary
+#
+# RESULT OF A MATCH:
+#   match, seed, policy, ticks, bombs_placed, blocks_destroyed,
+#   game_ms (simulated time), wall_ms, ticks_per_sec, state (digest)
+#
+# POLICIES (input for the player, chosen by name so workers can rebuild them):
+#   - square: Walk a square, plant a bomb every BOMB_EVERY_TICKS, detonate
+#   - random: Seeded random walk with random bomb plants / detonations
+#
+# USAGE:
+#   python batch.py --matches 200 --ticks 3600 --workers 8
+#   python batch.py --policy random --seed 100 --output results.jsonl
+#
+# DEPENDENCIES:
+#   - multiprocessing: Process pool
+#   - HeadlessGame: Display-less game on a virtual clock
+#   - replay.state_digest: Hash of the final state (reproducibility checks)
+# ============================================================================
+
+# Square policy: hold each direction for PATTERN_TICKS ticks
+WALK_PATTERN = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP]
+PATTERN_TICKS = 30
+BOMB_EVERY_TICKS = 90
+DETONATE_AFTER_TICKS = 45
+
+# Random policy: chance per tick of changing direction / planting / detonating
+RANDOM_TURN_CHANCE = 0.05
+RANDOM_BOMB_CHANCE = 0.02
+RANDOM_DETONATE_CHANCE = 0.02
+
+
+def square_policy(seed):
+  """Walk a square, plant a bomb every BOMB_EVERY_TICKS and set it off later."""
+  def script(tick):
+    phase = (tick // PATTERN_TICKS) % len(WALK_PATTERN)
+    events = []
+    if tick % BOMB_EVERY_TICKS == 0:
+      events.append(key_event(pygame.K_SPACE))
+    elif tick % BOMB_EVERY_TICKS == DETONATE_AFTER_TICKS:
+      events.append(key_event(pygame.K_LCTRL))
+    return {WALK_PATTERN[phase]}, events
+  return script
+
+
+def random_policy(seed):
+  """Seeded random walk that plants and detonates bombs at random."""
+  rng = np.random.default_rng(seed)
+  keys = {WALK_PATTERN[0]}
+
+  def script(tick):
+    nonlocal keys
+    turn, bomb, detonate = rng.random(3)
+    if turn < RANDOM_TURN_CHANCE:
+      keys = {WALK_PATTERN[int(rng.integers(len(WALK_PATTERN)))]}
+    events = []
+    if bomb < RANDOM_BOMB_CHANCE:
+      events.append(key_event(pygame.K_SPACE))
+    if detonate < RANDOM_DETONATE_CHANCE:
+      events.append(key_event(pygame.K_LCTRL))
+    return keys, events
+  return script
+
+
+POLICIES = {
+  "square": square_policy,
+  "random": random_policy,
+}
+
+# Assets of this worker process (loaded once by init_worker)
+worker_assets = None
+
+
+def init_worker():
+  """Pool initializer: load the assets once per worker process."""
+  global worker_assets
+  worker_assets = Assets()
+
+
+def soft_blocks(game):
+  """Number of soft blocks left in the level."""
+  return int(np.count_nonzero(game.level_matrix.cells == SOFT))
+
+
+def run_match(spec):
+  """
+  RUN_MATCH - Play one match headlessly and return its result dict
+
+  PARAMETERS:
+  - spec: (match index, seed, policy name, ticks, rows, cols)
+
+  NOTES:
+  - Runs in a worker process; everything in and out is plain data
+  """
+  match, seed, policy, ticks, rows, cols = spec
+  if worker_assets is None:
+    init_worker()
+  start = time.perf_counter()
+  sim = HeadlessGame(seed=seed, assets=worker_assets, rows=rows, cols=cols)
+  game = sim.GAME
+  blocks = soft_blocks(game)
+  done = sim.run(ticks, POLICIES[policy](seed))
+  elapsed = time.perf_counter() - start
+  return {
+    "match": match,
+    "seed": seed,
+    "policy": policy,
+    "ticks": done,
+    "bombs_placed": game.bomb_pool.created + game.bomb_pool.reused,
+    "blocks_destroyed": blocks - soft_blocks(game),
+    "game_ms": game.clock.get_ticks(),
+    "wall_ms": round(elapsed * 1000.0, 2),
+    "ticks_per_sec": round(done / elapsed, 1) if elapsed else 0.0,
+    "state": state_digest(game),
+  }
+
+
+def run_batch(specs, workers):
+  """
+  RUN_BATCH - Yield match results in completion order
+
+  NOTES:
+  - workers <= 1 runs the matches in this process (easier to debug/profile)
+  """
+  if workers <= 1:
+    for spec in specs:
+      yield run_match(spec)
+    return
+  with multiprocessing.Pool(workers, initializer=init_worker) as pool:
+    for result in pool.imap_unordered(run_match, specs):
+      yield result
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Run many headless Bomberman matches in parallel.")
+  parser.add_argument("--matches", type=int, default=32, help="number of matches")
+  parser.add_argument("--seed", type=int, default=1, help="seed of the first match (match i uses seed + i)")
+  parser.add_argument("--policy", default="square", choices=sorted(POLICIES), help="player input policy")
+  parser.add_argument("--ticks", type=int, default=60 * gs.TICK_RATE, help="logic ticks per match")
+  parser.add_argument("--rows", type=int, default=gs.ROWS, help="level rows")
+  parser.add_argument("--cols", type=int, default=gs.COLS, help="level columns")
+  parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+  parser.add_argument("--output", help="also append every result as a JSON line to this file")
+  args = parser.parse_args(argv)
+
+  # Assets are loaded with paths relative to the project folder
+  if args.output:
+    args.output = os.path.abspath(args.output)
+  os.chdir(os.path.dirname(os.path.abspath(__file__)))
+  specs = [(match, args.seed + match, args.policy, args.ticks, args.rows, args.cols)
+           for match in range(args.matches)]
+
+  output = open(args.output, "a") if args.output else None
+  start = time.perf_counter()
+  total_ticks = 0
+  try:
+    for result in run_batch(specs, args.workers):
+      total_ticks += result["ticks"]
+      line = json.dumps(result)
+      print(line, flush=True)
+      if output is not None:
+        output.write(line + "\n")
+        output.flush()
+  finally:
+    if output is not None:
+      output.close()
+  elapsed = time.perf_counter() - start
+  print("%d matches, %d ticks in %.2fs on %d worker(s): %.0f ticks/s" % (
+    len(specs), total_ticks, elapsed, max(1, args.workers),
+    total_ticks / elapsed if elapsed else 0.0), file=sys.stderr)
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
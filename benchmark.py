@@ -0,0 +1,313 @@
+#This is benchmark.py - reproducible performance benchmarks for the Bomberman game loop
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pygame
+from assets import Assets
+from character import Character
+from headless import HeadlessGame
+from gameinput import key_event
+from level_grid import EMPTY
+import gamesetting as gs
+
+try:
+  import resource   # Not available on Windows
+except ImportError:
+  resource = None
+
+# ============================================================================
+# FILE: benchmark.py - GAME LOOP BENCHMARK SUITE
+# ============================================================================
+# PURPOSE:
+#   Runs the game headlessly (no window, virtual clock, scripted input)
+#   over a matrix of cases and measures:
+#   - Level generation time (ms, median of several runs)
+#   - Logic speed: Game.input + Game.update ticks per second
+#   - Render speed: Game.draw frames per second into an off-screen surface,
+#     once scrolling at walking speed (warm caches, like play) and once
+#     jumping to a random spot every frame (cold world layer / chunks)
+#   - Peak traced memory while building and running the game (KiB)
+#   Results are written as JSON so two runs can be compared (--compare) to
+#   gate changes on regressions.
+#
+# CASES:
+#   map size (ROWS x COLS) x bombs on the map x entities (player + bots)
+#
+# USAGE:
+#   python benchmark.py                                   # default matrix
+#   python benchmark.py --sizes 20x40,200x400 --bombs 0,100 --entities 1,50
+#   python benchmark.py --output new.json --compare old.json --tolerance 0.1
+#
+# DEPENDENCIES:
+#   - HeadlessGame: Display-less game driven by a virtual clock
+#   - Character, Game.bomb_pool: Used to populate the map with bots and bombs
+#   - tracemalloc: Peak memory measurement
+# ============================================================================
+
+DEFAULT_SIZES = "20x40,50x100,100x200,200x400"
+DEFAULT_BOMBS = "0,10,100"
+DEFAULT_ENTITIES = "1,10,100"
+
+# Player walking pattern: hold each direction for PATTERN_TICKS ticks
+WALK_PATTERN = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP]
+PATTERN_TICKS = 30
+BOMB_EVERY_TICKS = 90
+
+# Metrics used by --compare and whether bigger is better
+METRICS = {
+  "level_gen_ms": False,
+  "ticks_per_sec": True,
+  "draw_fps": True,
+  "draw_cold_fps": True,
+  "peak_mem_kib": False,
+}
+
+
+def parse_sizes(text):
+  """'20x40,100x200' -> [(20, 40), (100, 200)]"""
+  sizes = []
+  for item in text.split(","):
+    rows, cols = item.lower().split("x")
+    sizes.append((int(rows), int(cols)))
+  return sizes
+
+
+def parse_counts(text):
+  """'0,10,100' -> [0, 10, 100]"""
+  return [int(item) for item in text.split(",")]
+
+
+def empty_cells(game, count, rng):
+  """Pick 'count' distinct empty cells (row, col) of the level, reproducibly."""
+  cells = np.argwhere(game.level_matrix.cells == EMPTY)
+  count = min(count, len(cells))
+  picks = rng.choice(len(cells), size=count, replace=False)
+  return [tuple(int(value) for value in cells[index]) for index in picks]
+
+
+def populate(sim, bombs, entities, seed):
+  """
+  POPULATE - Put bombs and bots on the map
+
+  NOTES:
+  - Bombs are remote bombs so the count stays constant during the run
+  - Bombs come from Game.bomb_pool, the same spawn path as a planted bomb
+  - Bots are extra Character sprites in the player group; the script moves
+    them with Character.move(), the same code path as the player
+  """
+  game = sim.GAME
+  rng = np.random.default_rng(seed)
+  bots = []
+  for row, col in empty_cells(game, max(0, entities - 1), rng):
+    bots.append(Character(game, sim.ASSETS.player_char, game.groups["player"], row, col, gs.SIZE))
+  for row, col in empty_cells(game, bombs, rng):
+    game.bomb_pool.acquire(sim.ASSETS.bomb["bomb"], game.groups["bomb"], row, col, gs.SIZE, True)
+  return bots
+
+
+def make_script(bots):
+  """Return the per-tick input script: player walks a square and plants bombs."""
+  actions = ["walk_right", "walk_down", "walk_left", "walk_up"]
+
+  def script(tick):
+    phase = (tick // PATTERN_TICKS) % len(WALK_PATTERN)
+    for index, bot in enumerate(bots):
+      bot.move(actions[(phase + index) % len(actions)])
+    events = [key_event(pygame.K_SPACE)] if tick % BOMB_EVERY_TICKS == 0 else []
+    return {WALK_PATTERN[phase]}, events
+  return script
+
+
+def bench_level_gen(sim, rows, cols, repeats):
+  """Median time (ms) of Game.generate_level_matrix for this size."""
+  samples = []
+  for _ in range(repeats):
+    start = time.perf_counter()
+    sim.GAME.generate_level_matrix(rows, cols)
+    samples.append((time.perf_counter() - start) * 1000.0)
+  return float(np.median(samples))
+
+
+def bench_update(sim, bots, ticks):
+  """Logic ticks per second (Game.input + Game.update) with the scripted input."""
+  script = make_script(bots)
+  start = time.perf_counter()
+  done = sim.run(ticks, script)
+  elapsed = time.perf_counter() - start
+  return done / elapsed if elapsed else 0.0
+
+
+def ping_pong(distance, limit):
+  """Position after travelling 'distance' back and forth between 0 and 'limit'."""
+  if limit <= 0:
+    return 0
+  distance %= 2 * limit
+  return distance if distance <= limit else 2 * limit - distance
+
+
+def bench_draw(sim, frames, seed):
+  """
+  Frames per second of Game.draw into an off-screen surface
+
+  RETURNS:
+  - (scrolling fps, cold fps)
+    - scrolling: the camera moves diagonally by the player's speed each
+      frame, like following a walking player, so cached chunks are reused
+    - cold: the camera jumps to a random spot every frame, so the visible
+      part of the world layer / the chunks are mostly rebuilt
+  """
+  game = sim.GAME
+  surface = pygame.Surface(sim.MAIN.screen.get_size())
+  max_x = max(0, game.level_matrix.cols * gs.SIZE - surface.get_width())
+  max_y = max(0, game.level_matrix.rows * gs.SIZE - surface.get_height())
+
+  def timed(positions):
+    start = time.perf_counter()
+    for x, y in positions:
+      game.x_camera_offset = game.prev_x_camera_offset = x
+      game.y_camera_offset = game.prev_y_camera_offset = y
+      game.draw(surface)
+    elapsed = time.perf_counter() - start
+    return frames / elapsed if elapsed else 0.0
+
+  game.draw(surface)   # Warm-up: builds the cached world layer
+  speed = game.PLAYER.speed
+  scrolling = timed((ping_pong(frame * speed, max_x), ping_pong(frame * speed, max_y))
+                    for frame in range(frames))
+  rng = np.random.default_rng(seed)
+  cold = timed((float(rng.integers(0, max_x + 1)), float(rng.integers(0, max_y + 1)))
+               for _ in range(frames))
+  return scrolling, cold
+
+
+def bench_memory(assets, rows, cols, bombs, entities, seed, ticks):
+  """Peak traced memory (KiB) while building the game and running 'ticks' ticks."""
+  tracemalloc.start()
+  sim = HeadlessGame(seed=seed, assets=assets, rows=rows, cols=cols)
+  bots = populate(sim, bombs, entities, seed)
+  sim.run(ticks, make_script(bots))
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return peak / 1024.0
+
+
+def run_case(assets, rows, cols, bombs, entities, args):
+  """Run every measurement for one case and return its result dict."""
+  sim = HeadlessGame(seed=args.seed, assets=assets, rows=rows, cols=cols)
+  bots = populate(sim, bombs, entities, args.seed)
+  ticks_per_sec = bench_update(sim, bots, args.ticks)
+  draw_fps, draw_cold_fps = bench_draw(sim, args.frames, args.seed)
+  result = {
+    "rows": rows,
+    "cols": cols,
+    "bombs": bombs,
+    "entities": entities,
+    "level_gen_ms": bench_level_gen(sim, rows, cols, args.gen_repeats),
+    "ticks_per_sec": ticks_per_sec,
+    "draw_fps": draw_fps,
+    "draw_cold_fps": draw_cold_fps,
+    "peak_mem_kib": bench_memory(assets, rows, cols, bombs, entities, args.seed,
+                                 min(args.ticks, 60)),
+  }
+  if resource is not None:
+    result["max_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  return result
+
+
+def case_key(result):
+  return (result["rows"], result["cols"], result["bombs"], result["entities"])
+
+
+def compare(results, baseline_path, tolerance):
+  """
+  COMPARE - Print per-case changes against a previous results file
+
+  RETURNS:
+  - Number of metrics that got worse by more than 'tolerance' (fraction)
+  """
+  with open(baseline_path) as file:
+    baseline = {case_key(result): result for result in json.load(file)["results"]}
+
+  regressions = 0
+  for result in results:
+    old = baseline.get(case_key(result))
+    if old is None:
+      continue
+    for metric, higher_is_better in METRICS.items():
+      if not old.get(metric):
+        continue
+      change = (result[metric] - old[metric]) / old[metric]
+      worse = -change if higher_is_better else change
+      flag = ""
+      if worse > tolerance:
+        regressions += 1
+        flag = "  REGRESSION"
+      print("%-22s %-14s %12.2f -> %12.2f  (%+6.1f%%)%s" % (
+        "%dx%d b%d e%d" % case_key(result), metric, old[metric], result[metric], change * 100, flag))
+  return regressions
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Benchmark the Bomberman game loop headlessly.")
+  parser.add_argument("--sizes", default=DEFAULT_SIZES, help="map sizes as ROWSxCOLS, comma separated")
+  parser.add_argument("--bombs", default=DEFAULT_BOMBS, help="bomb counts, comma separated")
+  parser.add_argument("--entities", default=DEFAULT_ENTITIES, help="entity counts (player + bots), comma separated")
+  parser.add_argument("--ticks", type=int, default=600, help="logic ticks per case")
+  parser.add_argument("--frames", type=int, default=120, help="draw frames per case")
+  parser.add_argument("--gen-repeats", type=int, default=5, help="level generations per case (median is kept)")
+  parser.add_argument("--seed", type=int, default=1, help="level / placement seed")
+  parser.add_argument("--output", default="bench_results.json", help="where to write the JSON results")
+  parser.add_argument("--compare", help="previous results JSON to compare against")
+  parser.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown fraction for --compare")
+  args = parser.parse_args(argv)
+
+  # Assets are loaded with paths relative to the project folder
+  args.output = os.path.abspath(args.output)
+  if args.compare:
+    args.compare = os.path.abspath(args.compare)
+  os.chdir(os.path.dirname(os.path.abspath(__file__)))
+  assets = Assets()
+
+  results = []
+  for rows, cols in parse_sizes(args.sizes):
+    for bombs in parse_counts(args.bombs):
+      for entities in parse_counts(args.entities):
+        result = run_case(assets, rows, cols, bombs, entities, args)
+        results.append(result)
+        print("%4dx%-4d bombs=%-4d entities=%-4d gen=%8.2fms  update=%9.0f t/s  draw=%8.1f fps"
+              "  cold=%8.1f fps  mem=%9.0f KiB" % (
+          rows, cols, bombs, entities, result["level_gen_ms"], result["ticks_per_sec"],
+          result["draw_fps"], result["draw_cold_fps"], result["peak_mem_kib"]))
+
+  report = {
+    "meta": {
+      "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+      "python": platform.python_version(),
+      "pygame": pygame.version.ver,
+      "numpy": np.__version__,
+      "platform": platform.platform(),
+      "ticks": args.ticks,
+      "frames": args.frames,
+      "seed": args.seed,
+    },
+    "results": results,
+  }
+  with open(args.output, "w") as file:
+    json.dump(report, file, indent=2)
+  print("Results written to", args.output)
+
+  if args.compare:
+    regressions = compare(results, args.compare, args.tolerance)
+    if regressions:
+      print(regressions, "metric(s) regressed by more than %.0f%%" % (args.tolerance * 100))
+      return 1
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
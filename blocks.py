@@ -1,129 +1,134 @@
 # ============================================================================
-# FILE: blocks.py - BLOCK/TILE SPRITE CLASSES
+# FILE: blocks.py - BLOCK TYPES (FLYWEIGHTS)
 # ============================================================================
 # PURPOSE:
-#   Defines block/tile classes for the Bomberman game:
-#   - Blocks: Base class for all block types (handles position, rendering)
+#   Defines the block types of the Bomberman game:
+#   - Blocks: Base class for all block types (shared image, passability)
 #   - Hard_block: Indestructible barriers that form the maze
 #   - Soft_Block: Destructible blocks that can be destroyed by bombs
 #
+#   A block on the map is just a cell code in the level matrix. There is
+#   ONE instance per block type (a flyweight, see Game.block_types) holding
+#   everything the blocks of that kind share; the position (row, col) is
+#   passed in by the caller. Large arenas therefore cost one byte per block
+#   instead of one Sprite object each.
+#
 # DEPENDENCIES:
-#   - pygame: Sprite rendering and collision detection
+#   - pygame: Rects for block hitboxes
 #   - gamesetting: Game configuration (tile sizes, offsets)
+#   - level_grid: Cell codes the block types stand for
 # ============================================================================
 
 #This is blocks.py - defines block classes for the Bomberman game
 import pygame
 import gamesetting as gs
+from level_grid import HARD, SOFT
 
 # ============================================================================
 # CLASS: Blocks - Base class for all block types
 # ============================================================================
-class Blocks(pygame.sprite.Sprite):
-  def __init__(self, game, images, group, row_number, col_number):
+class Blocks:
+  __slots__ = ("code", "passable", "image_list", "image_index", "image")
+
+  def __init__(self, code, images, passable):
     """
-    CONSTRUCTOR - Initialize a block at the specified grid position
-    
+    CONSTRUCTOR - Create the shared description of one block type
+
     PARAMETERS:
-    - game: Game object reference for accessing game state
+    - code: level_grid cell code of this block type
     - images: List of sprite images for this block type
-    - group: Pygame sprite group to add this block to
-    - row_number: Grid row position (0-indexed)
-    - col_number: Grid column position (0-indexed)
-    
-    INITIALIZATION:
-    1. Call parent Sprite constructor to add to sprite group
-    2. Calculate world pixel position from grid coordinates
-    3. Create visual sprite and hitbox (collision rectangle)
-    4. Set passable attribute (whether player can walk through)
+    - passable: False means solid wall (blocks all movement)
+
+    NOTES:
+    - Created once per block type by the Game, never per block
     """
-    super().__init__(group)
-    self.GAME = game
-    self.y_offset = gs.Y_OFFSET  # Vertical offset for visual alignment
-    
-    # Block position in grid coordinates
-    self.row = row_number
-    self.col = col_number
-    self.size = gs.SIZE  # Tile size in pixels (64px)
-
-    # Block position in world pixels
-    self.x = self.col * self.size
-    self.y = (self.row * self.size) + self.y_offset
-
-    # Block attributes - passable=False means solid wall (blocks all movement)
-    self.passable = True
-
-    # Block display/sprite
+    self.code = code
+    self.passable = passable
+
+    # Block display/sprite (shared by every block of this type)
     self.image_list = images  # List of animation frames (if any)
     self.image_index = 0      # Current frame index
     self.image = self.image_list[self.image_index]
-    self.rect = self.image.get_rect(topleft=(self.x, self.y))  # Hitbox for collision
 
-  def update(self):
-    """UPDATE - Currently empty (blocks don't animate or move)"""
-    pass
+  @staticmethod
+  def position(row, col):
+    """World pixel position of the block at grid (row, col)."""
+    return col * gs.SIZE, (row * gs.SIZE) + gs.Y_OFFSET
+
+  def rect(self, row, col):
+    """Hitbox (world pixels) of the block at grid (row, col)."""
+    return pygame.Rect(self.position(row, col), self.image.get_size())
 
-  def draw(self, window, x_offset=0, y_offset=0):
+  def draw(self, game, window, row, col, x_offset=0, y_offset=0):
     """
-    DRAW - Render the block sprite with camera offset applied
-    
+    DRAW - Render the block at grid (row, col) with camera offset applied
+
     PARAMETERS:
+    - game: Game object (render scale)
     - window: pygame.Surface to draw on
+    - row, col: Grid position of the block
     - x_offset: Horizontal camera offset (subtracts from x position)
     - y_offset: Vertical camera offset (subtracts from y position)
-    
+
     NOTES:
-    - Camera offsets create the camera follow effect
-    - Block is drawn at world position minus camera offset
+    - The world layer normally bakes blocks; this is for one-off drawing
     """
-    window.blit(self.image, (self.x - x_offset, self.y - y_offset))
+    x, y = self.position(row, col)
+    game.blit_sprite(window, self.image, x - x_offset, y - y_offset)
 
   def __repr__(self):
     """String representation for debugging"""
     return "'#'"
-  
+
 
 class Hard_block(Blocks):
   """
   HARD_BLOCK - Indestructible barriers that form the game maze
-  
+
   PROPERTIES:
   - passable = False (solid, cannot pass through)
   - Static (never moves or changes)
   - Placed in a grid pattern to create maze structure
-  
+
   PLACEMENT PATTERN:
   - Borders: All edges of the map
   - Interior: Every other row/column (creates checkerboard pattern)
   - Purpose: Creates maze layout for gameplay
   """
-  def __init__(self, game, images, group, row_number, col_number):
-    super().__init__(game, images, group, row_number, col_number)
+  __slots__ = ()
+
+  def __init__(self, images):
     # Hard blocks are always solid walls
-    self.passable = False
+    super().__init__(HARD, images, passable=False)
 
 
 
 class Soft_Block(Blocks):
   """
   SOFT_BLOCK - Destructible blocks that can be blown up by bombs
-  
+
   PROPERTIES:
-  - passable = False (solid, cannot pass through until destroyed)
+  - passable = True (matches level_grid.SOLID: only hard blocks stop movement)
   - Can be destroyed by bomb explosions
   - Randomly placed throughout the map (except near player start)
-  
+
   PLACEMENT STRATEGY:
   - Randomly placed in open areas
   - Avoids player starting zone (rows 2-4, cols 1-3)
   - Ensures gameplay progression and exploration
-  
+
   FUTURE FEATURES:
   - Drop power-ups when destroyed
-  - Contribute to bomb explosion propagation
   """
-  def __init__ (self,game,images,group,row_num, col_num):
-        super().__init__(game, images, group, row_num, col_num)
+  __slots__ = ()
+
+  def __init__(self, images):
+    super().__init__(SOFT, images, passable=True)
+
+  def destroy(self, game, row, col):
+    """DESTROY - Remove the soft block at (row, col) from the level matrix"""
+    # Clearing the cell also repaints that tile of the cached world layer
+    game.destroy_soft_block(row, col)
 
   def __repr__(self):
-    return "'@'"
\ No newline at end of file
+    return "'@'"
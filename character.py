@@ -12,11 +12,13 @@
 # DEPENDENCIES:
 #   - pygame: Sprite and rendering
 #   - gamesetting: Game configuration and tile sizes
+#   - level_grid: Cell codes for the level matrix
 # ============================================================================
 
 #This is character.py - defines the Character class for the Bomberman game
 import pygame
 import gamesetting as gs
+from level_grid import BOMB
 
 # ============================================================================
 # CLASS: Character - Player sprite with movement, animation, and collision
@@ -55,8 +57,9 @@ class Character(pygame.sprite.Sprite):
 
         # CHARACTER ATTRIBUTES
         self.alive = True
-        self.speed = 3  # Pixels per frame when moving
+        self.speed = 3  # Pixels per logic tick when moving (gs.TICK_RATE ticks per second)
         self.bomb_limit = 1
+        self.bomb_range = gs.BOMB_RANGE  # Blast length in tiles for each direction
         self.remote = True
 
 
@@ -70,7 +73,7 @@ class Character(pygame.sprite.Sprite):
         # ANIMATION FRAME TRACKING
         self.index = 0  # Current frame in animation sequence
         self.anim_time = 50  # Milliseconds between frame updates
-        self.anim_time_set = pygame.time.get_ticks()  # Last frame switch time
+        self.anim_time_set = self.GAME.clock.get_ticks()  # Last frame switch time
         self.image_dict = image_dict  # Dictionary of all animation sequences
         self.image = self.image_dict[self.action][self.index]
 
@@ -78,6 +81,7 @@ class Character(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(topleft=(self.x, self.y))
         self.rect.inflate_ip(-20, -20)  # Shrink hitbox by 20px (10 on each side)
         self.offset = 10  # Offset to keep the hitbox centered inside the image
+        self.GAME.entities.insert(self)
 
     def input(self, events):
         """
@@ -95,7 +99,8 @@ class Character(pygame.sprite.Sprite):
         
         NOTES:
         - Events are passed from Bomberman.input() via Game.input()
-        - Continuous polling with pygame.key.get_pressed() ensures smooth movement
+        - Continuous polling of Game.input_source ensures smooth movement
+          (pygame.key.get_pressed() in the normal game)
         - Each movement calls self.move() which handles collision detection
         """
         # Process events passed from main (QUIT/ESCAPE)
@@ -107,19 +112,20 @@ class Character(pygame.sprite.Sprite):
                     self.GAME.MAIN.running = False
                 elif event.key == pygame.K_SPACE:
                     row, col, = ((self.rect.centery - gs.Y_OFFSET)//gs.SIZE, self.rect.centerx // gs.SIZE)
-                    if self.GAME.level_matrix[row][col] == "_" and self.bomb_planted < self.bomb_limit:
-                        Bomb(self.GAME, self.GAME.ASSETS.bomb["bomb"], 
-                             self.GAME.groups["bomb"], row, col, gs.SIZE, self.remote)  
-                        print(self.bomb_planted)
+                    if self.GAME.level_matrix.is_empty(row, col) and self.bomb_planted < self.bomb_limit:
+                        self.GAME.bomb_pool.acquire(self.GAME.ASSETS.bomb["bomb"],
+                                                    self.GAME.groups["bomb"], row, col, gs.SIZE,
+                                                    self.remote, self.bomb_range)
                 elif event.key == pygame.K_LCTRL and self.remote :
                     bomb_list = self.GAME.groups["bomb"].sprites()
-                    bomb_list[-1].explode()
+                    if bomb_list:
+                        bomb_list[-1].explode()
 
 
 
 
-        # Continuous key polling for smooth movement
-        keys_pressed = pygame.key.get_pressed() 
+        # Continuous key polling for smooth movement (keyboard, or scripted when headless)
+        keys_pressed = self.GAME.input_source.get_pressed()
         if keys_pressed[pygame.K_d] or keys_pressed[pygame.K_RIGHT]:
             self.move("walk_right")
         elif keys_pressed[pygame.K_a] or keys_pressed[pygame.K_LEFT]:
@@ -147,9 +153,10 @@ class Character(pygame.sprite.Sprite):
         
         NOTES:
         - Camera offsets shift the character position, creating the camera follow effect
+        - Game.blit_sprite scales position and frame to the on-screen tile size
         - Commented debug code shows how to draw the hitbox for debugging
         """
-        window.blit(self.image, (self.x - x_offset, self.y - y_offset))
+        self.GAME.blit_sprite(window, self.image, self.x - x_offset, self.y - y_offset)
         #pygame.draw.rect(window, gs.RED, self.rect, 1)
 
         # Optional: Uncomment to see the red hitbox for debugging
@@ -175,14 +182,14 @@ class Character(pygame.sprite.Sprite):
         - Each direction typically has 3 frames for walking animation
         - This creates smooth sprite animation during movement
         """
-        if pygame.time.get_ticks() - self.anim_time_set > self.anim_time:
+        if self.GAME.clock.get_ticks() - self.anim_time_set > self.anim_time:
             self.index += 1
             if self.index == len(self.image_dict[action]):
                 self.index = 0
 
             #self.index = self.index % len(self.image_dict[action])
             self.image = self.image_dict[action][self.index]
-            self.anim_time_set = pygame.time.get_ticks()
+            self.anim_time_set = self.GAME.clock.get_ticks()
 
     def check_collision(self):
         """
@@ -193,28 +200,33 @@ class Character(pygame.sprite.Sprite):
         - False: No collision detected
         
         COLLISION LOGIC:
-        1. Get all hard blocks the character's hitbox is touching
-        2. Get all soft blocks the character's hitbox is touching
-        3. Combine both lists
-        4. Check each block's 'passable' attribute
-        5. Return True if any block has passable=False (solid wall)
+        1. Convert the hitbox edges into the range of grid rows/cols it overlaps
+           (at most 2x2 = 4 cells, since the hitbox is smaller than a tile)
+        2. Look those cells up directly in the level matrix
+        3. Return True if any of them holds a solid cell code (level_grid.SOLID)
         
         NOTES:
-        - Uses pygame.sprite.spritecollide() for efficient collision detection
+        - Grid lookups cost the same no matter how many blocks the map has,
+          unlike scanning the whole hard/soft block groups
+        - Only blocks count as walls (bomb cells are ignored here),
+          same as checking the hard_block and soft_block groups
         - Hitbox is smaller than the visual sprite (inflated -20px) for better gameplay feel
         - Used in move() to prevent character from walking through walls
         """
-        # 1. Get a list of all blocks we are touching
-        hard_hits = pygame.sprite.spritecollide(self, self.GAME.groups["hard_block"], False)
-        soft_hits = pygame.sprite.spritecollide(self, self.GAME.groups["soft_block"], False)
-        all_hits = hard_hits + soft_hits
+        matrix = self.GAME.level_matrix
+        rect = self.rect
 
-        # 2. Check each block to see if it is passable
-        for block in all_hits:
-            if hasattr(block, 'passable') and block.passable == False:
-                return True  # We hit a solid wall!
-            
-        return False  # No solid collisions found
+        # 1. Grid range covered by the hitbox (right/bottom edges are exclusive,
+        #    matching pygame's Rect.colliderect)
+        first_row = max(0, (rect.top - gs.Y_OFFSET) // gs.SIZE)
+        last_row = min(matrix.rows - 1, (rect.bottom - 1 - gs.Y_OFFSET) // gs.SIZE)
+        first_col = max(0, rect.left // gs.SIZE)
+        last_col = min(matrix.cols - 1, (rect.right - 1) // gs.SIZE)
+        if first_row > last_row or first_col > last_col:
+            return False  # Hitbox is entirely outside the map
+
+        # 2. True if any overlapped cell holds a non-passable block
+        return matrix.any_solid(first_row, last_row, first_col, last_col)
 
 
     def move(self, action):
@@ -244,7 +256,7 @@ class Character(pygame.sprite.Sprite):
         - More forgiving gameplay feel compared to complete rejection on collision
         
         NOTES:
-        - self.speed = 3 pixels per frame
+        - self.speed = 3 pixels per logic tick (fixed timestep, see Bomberman.update)
         - self.offset = 10 pixels to center the hitbox inside the sprite
         - Camera follows smoothly with interpolation (lerp) defined in Game
         """
@@ -287,15 +299,34 @@ class Character(pygame.sprite.Sprite):
 
         # --- FINAL UPDATES ---
         self.animate(action)   
+        # Keep the entity spatial hash in step with the hitbox
+        self.GAME.entities.move(self)
         
-        # Update camera based on the center of the player (x and y)
-        self.GAME.update_camera(self.rect.centerx, self.rect.centery)
+        # Update camera based on the center of the player (x and y);
+        # other characters (benchmark bots) must not drag the camera along
+        if self is self.GAME.PLAYER:
+            self.GAME.update_camera(self.rect.centerx, self.rect.centery)
 
 class Bomb(pygame.sprite.Sprite):
-    def __init__(self,game, image_list, group, row_num, col_num, size, remote):
-        super().__init__(group)
+    def __init__(self,game, image_list, group, row_num, col_num, size, remote,
+                 blast_range=gs.BOMB_RANGE):
+        super().__init__()
         self.GAME = game
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.frame_timer = None
+        self.reset(image_list, group, row_num, col_num, size, remote, blast_range)
+
+    def reset(self, image_list, group, row_num, col_num, size, remote,
+              blast_range=gs.BOMB_RANGE):
+        """
+        RESET - (Re)arm the bomb on a tile
 
+        NOTES:
+        - Called by the constructor and by Game.bomb_pool when a detonated
+          bomb is reused, so both paths start from exactly the same state
+        - The Rect is updated in place instead of being replaced
+        """
+        self.add(group)
 
         # Level matrix position (in grid tiles)
         self.row = row_num
@@ -311,33 +342,33 @@ class Bomb(pygame.sprite.Sprite):
         self.bomb_timer = 12    
         self.passable = True  # Bombs are passable until they explode
         self.remote = remote
+        self.blast_range = blast_range  # Tiles the blast reaches in each direction
+        self.detonating = False         # Queued in the explosion engine
 
 
         # Image
         self.index = 0
         self.image_list = image_list
         self.image = self.image_list[self.index]
-        self.rect = self.image.get_rect(topleft=(self.x, self.y))
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = (self.x, self.y)
+        self.GAME.entities.insert(self)
 
         # Animation Settings
         self.anim_length = len(self.image_list)
         self.anim_frame_time = 200  # milliseconds per frame
-        self.anim_timer = pygame.time.get_ticks()
+        self.anim_timer = self.GAME.clock.get_ticks()
 
-        # Insert into level matrix
+        # Insert into level matrix (and mark its blast on the danger map)
         self.insert_bomb_into_grid()
+        self.GAME.danger.add_bomb(self)
 
-    def update(self):
-        # Keep the collision rect in sync with the bomb's fixed world position.
-        # Do NOT change self.x/self.y here; bombs are stationary after placement.
-        self.animation()
-        self.planted_bomb_player_collision()
-        if self.bomb_counter == self.bomb_timer and not self.remote:
-            self.explode()
-
-
-
-        self.rect.topleft = (int(self.x), int(self.y))
+        # Bombs are event driven: no per-tick update. The next animation frame
+        # (which also counts down the fuse) is a timer on the game scheduler,
+        # and the player is released from the bomb by Game.release_passable_bombs
+        self.frame_timer = self.GAME.scheduler.schedule(
+            self.anim_timer + self.anim_frame_time, self.animation)
+        self.GAME.passable_bombs.add(self)
 
     def draw(self, window, x_offset=0, y_offset=0):
         """
@@ -353,36 +384,70 @@ class Bomb(pygame.sprite.Sprite):
           remains fixed in the world even if the player moves or the camera scrolls.
         - Keep rect synced in update(); draw only uses self.x/self.y for rendering.
         """
-        window.blit(self.image, (int(self.x) - int(x_offset), int(self.y) - int(y_offset)))
+        self.GAME.blit_sprite(window, self.image, int(self.x) - int(x_offset), int(self.y) - int(y_offset))
     def insert_bomb_into_grid(self):
         """Add the bomb object to the level matrix"""
-        self.GAME.level_matrix[self.row][self.col] = self
+        self.GAME.level_matrix.set(self.row, self.col, BOMB, self)
         self.GAME.PLAYER.bomb_planted += 1
         
 
     def animation(self):
-        if pygame.time.get_ticks() - self.anim_timer >= self.anim_frame_time:
-            self.index += 1
-            self.index = self.index % self.anim_length
-            self.image = self.image_list[self.index]
-            self.anim_timer = pygame.time.get_ticks()
-            self.bomb_counter += 1
+        """
+        ANIMATION - Scheduled callback: show the next frame and burn the fuse
+
+        NOTES:
+        - Runs on the logic tick where the frame time has elapsed, then
+          schedules itself anim_frame_time ms after that tick
+        - Non-remote bombs explode when bomb_counter reaches bomb_timer
+        """
+        self.index += 1
+        self.index = self.index % self.anim_length
+        self.image = self.image_list[self.index]
+        self.anim_timer = self.GAME.clock.get_ticks()
+        self.bomb_counter += 1
+        if self.bomb_counter == self.bomb_timer and not self.remote:
+            self.explode()
+            return
+        self.frame_timer = self.GAME.scheduler.schedule(
+            self.anim_timer + self.anim_frame_time, self.animation)
 
     def remove_bomb_from_grid(self):
         """Remove the bomb object from the level matrix"""
-        self.GAME.level_matrix[self.row][self.col] = "_"
-        self.GAME.PLAYER.bomb_planted += 1
+        self.GAME.level_matrix.clear(self.row, self.col)
+        self.GAME.PLAYER.bomb_planted -= 1
 
     def explode(self):
-        """Destroy the bomb and remove from the level matrix"""    
+        """
+        EXPLODE - Set the bomb off
+
+        NOTES:
+        - The blast itself (rays, destroyed blocks, chained bombs) is computed
+          by Game.explosions in one batched pass at the end of the logic tick
+        """
+        self.GAME.explosions.detonate(self)
+
+    def detonate(self):
+        """Called by the explosion engine: cancel the pending timer and remove the bomb"""
+        if not self.alive():
+            return
+        self.GAME.scheduler.cancel(self.frame_timer)
+        self.frame_timer = None
+        self.GAME.passable_bombs.discard(self)
         self.kill()
+        self.GAME.entities.remove(self)
+        self.GAME.danger.remove_bomb(self)
         self.remove_bomb_from_grid()
+        # Hand the sprite back so the next planted bomb reuses it
+        self.GAME.bomb_pool.release(self)
 
     def planted_bomb_player_collision(self):
+        """Once every character has left the bomb's tile, the bomb stops being passable."""
         if not self.passable:
             return
-        if not self.rect.colliderect(self.GAME.PLAYER):
+        # Only characters near the bomb are tested (spatial hash), however many there are
+        if not self.GAME.entities.query(self.rect, self.GAME.groups["player"]):
             self.passable = False
+            self.GAME.passable_bombs.discard(self)
 
 
     def __repr__(self):
@@ -0,0 +1,162 @@
+#This is chunks.py - streams the static world of very large maps in chunks
+from collections import OrderedDict
+import pygame
+import gamesetting as gs
+
+# ============================================================================
+# FILE: chunks.py - CHUNKED WORLD STREAMING
+# ============================================================================
+# PURPOSE:
+#   A map too large to bake into one surface (gs.WORLD_LAYER_MAX_PIXELS) is
+#   split into square chunks of gs.CHUNK_TILES x gs.CHUNK_TILES tiles:
+#   - Only chunks near the camera are rendered and kept, each in its own
+#     cached surface (least recently used chunks are evicted beyond
+#     gs.CHUNK_CACHE_SIZE and simply re-rendered if the camera comes back)
+#   - Chunks on screen are built on demand; chunks around where the deadzone
+#     camera is heading (Game.cam_target_x/y) are prefetched a few per frame
+#   - Level changes repaint only the affected tile of a resident chunk
+#   The level itself stays in the compact level matrix (one byte per cell),
+#   so memory and per-frame work depend on the screen size, not the map size.
+#
+# DEPENDENCIES:
+#   - pygame: Chunk surfaces
+#   - gamesetting: Chunk size, cache size, prefetch budget, Y offset
+#   - WorldLayer: render_tile() paints the tiles of a chunk
+# ============================================================================
+
+
+# ============================================================================
+# CLASS: ChunkCache - LRU set of rendered chunks around the camera
+# ============================================================================
+class ChunkCache:
+  def __init__(self, layer, chunk_tiles=gs.CHUNK_TILES, max_chunks=gs.CHUNK_CACHE_SIZE):
+    """
+    CONSTRUCTOR - Create an empty chunk cache for a world layer
+
+    PARAMETERS:
+    - layer: WorldLayer that paints tiles (and owns the Game reference)
+    - chunk_tiles: Chunk edge length in tiles
+    - max_chunks: Resident chunk surfaces kept (never fewer than on screen)
+    """
+    self.LAYER = layer
+    self.GAME = layer.GAME
+    self.chunk_tiles = chunk_tiles
+    self.max_chunks = max_chunks
+    self.surfaces = OrderedDict()   # (chunk row, chunk col) -> Surface
+    self.dirty = {}                 # (chunk row, chunk col) -> {(row, col), ...}
+    self.builds = 0
+    self.evictions = 0
+
+  def chunk_of(self, row, col):
+    """Chunk key of a tile."""
+    return row // self.chunk_tiles, col // self.chunk_tiles
+
+  def chunk_range(self, cam_x, cam_y, margin=0):
+    """
+    CHUNK_RANGE - Chunks covering the view at camera (cam_x, cam_y)
+
+    RETURNS:
+    - (first chunk row, last chunk row, first chunk col, last chunk col),
+      inclusive, grown by 'margin' chunks and clamped to the map
+    """
+    first_row, last_row, first_col, last_col = self.GAME.visible_tile_range(cam_x, cam_y)
+    matrix = self.GAME.level_matrix
+    size = self.chunk_tiles
+    max_row = (matrix.rows - 1) // size
+    max_col = (matrix.cols - 1) // size
+    return (max(0, first_row // size - margin), min(max_row, max(first_row, last_row - 1) // size + margin),
+            max(0, first_col // size - margin), min(max_col, max(first_col, last_col - 1) // size + margin))
+
+  def mark_dirty(self, row, col):
+    """MARK_DIRTY - Queue a tile repaint if its chunk is resident (others render fresh later)"""
+    key = self.chunk_of(row, col)
+    if key in self.surfaces:
+      self.dirty.setdefault(key, set()).add((row, col))
+
+  def build(self, key):
+    """BUILD - Render every tile of one chunk into a new surface"""
+    matrix = self.GAME.level_matrix
+    tile = self.GAME.tile_size
+    size = self.chunk_tiles
+    first_row = key[0] * size
+    first_col = key[1] * size
+    rows = min(size, matrix.rows - first_row)
+    cols = min(size, matrix.cols - first_col)
+    surface = pygame.Surface((cols * tile, rows * tile))
+    if pygame.display.get_surface() is not None:
+      surface = surface.convert()
+    for row in range(first_row, first_row + rows):
+      for col in range(first_col, first_col + cols):
+        self.LAYER.render_tile(row, col, surface, ((col - first_col) * tile, (row - first_row) * tile))
+    self.builds += 1
+    return surface
+
+  def get(self, key):
+    """GET - Return a chunk surface (most recently used), building or repainting it first"""
+    surface = self.surfaces.get(key)
+    if surface is None:
+      surface = self.surfaces[key] = self.build(key)
+      self.dirty.pop(key, None)
+      return surface
+    self.surfaces.move_to_end(key)
+    tiles = self.dirty.pop(key, None)
+    if tiles:
+      tile = self.GAME.tile_size
+      first_row = key[0] * self.chunk_tiles
+      first_col = key[1] * self.chunk_tiles
+      for row, col in tiles:
+        self.LAYER.render_tile(row, col, surface, ((col - first_col) * tile, (row - first_row) * tile))
+    return surface
+
+  def prefetch(self, cam_x, cam_y, budget):
+    """PREFETCH - Build up to 'budget' missing chunks around a camera position"""
+    first_row, last_row, first_col, last_col = self.chunk_range(cam_x, cam_y, gs.CHUNK_MARGIN)
+    for chunk_row in range(first_row, last_row + 1):
+      for chunk_col in range(first_col, last_col + 1):
+        if budget <= 0:
+          return
+        key = (chunk_row, chunk_col)
+        if key not in self.surfaces:
+          self.surfaces[key] = self.build(key)
+          budget -= 1
+
+  def draw(self, window, cam_x, cam_y):
+    """
+    DRAW - Blit the chunks on screen, then stream in chunks ahead of the camera
+
+    STEPS:
+    1. Build/refresh and blit every chunk intersecting the view
+    2. Prefetch up to gs.CHUNK_PREFETCH_PER_FRAME chunks around the camera
+       target (where the deadzone camera is moving to), but only into the
+       room the visible chunks leave in the cache
+    3. Evict least recently used chunks above the cache size
+
+    NOTES:
+    - Visible chunks were just used, so only older off-screen chunks are
+      in front of them in LRU order; capping the prefetch at the free room
+      means eviction never reaches a chunk on screen
+    """
+    tile = self.GAME.tile_size
+    span = self.chunk_tiles * tile
+    cam_px, origin_y = self.LAYER.screen_origin(cam_x, cam_y)
+    first_row, last_row, first_col, last_col = self.chunk_range(cam_x, cam_y)
+    for chunk_row in range(first_row, last_row + 1):
+      for chunk_col in range(first_col, last_col + 1):
+        surface = self.get((chunk_row, chunk_col))
+        window.blit(surface, (chunk_col * span - cam_px, chunk_row * span + origin_y))
+    on_screen = (last_row - first_row + 1) * (last_col - first_col + 1)
+    capacity = max(self.max_chunks, on_screen)
+    room = capacity - on_screen
+    if room > 0:
+      self.prefetch(int(self.GAME.cam_target_x), int(self.GAME.cam_target_y),
+                    min(gs.CHUNK_PREFETCH_PER_FRAME, room))
+
+    while len(self.surfaces) > capacity:
+      key, _ = self.surfaces.popitem(last=False)
+      self.dirty.pop(key, None)
+      self.evictions += 1
+
+  def clear(self):
+    """Drop every chunk (tile size changed)."""
+    self.surfaces.clear()
+    self.dirty.clear()
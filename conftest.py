@@ -0,0 +1,24 @@
+#This is conftest.py - shared pytest setup for the Bomberman tests
+import os
+
+# No window or sound device is needed (or available) when testing
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+# ============================================================================
+# FILE: conftest.py - PYTEST SETUP
+# ============================================================================
+# PURPOSE:
+#   Tests live in tests/ and run without a window (python -m pytest -q).
+#   Every test runs from the project folder, since images are loaded with
+#   relative paths.
+# ============================================================================
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(autouse=True)
+def project_dir(monkeypatch):
+  monkeypatch.chdir(ROOT)
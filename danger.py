@@ -0,0 +1,193 @@
+#This is danger.py - which tiles will be hit by a blast, and when
+import math
+import numpy as np
+from level_grid import HARD, SOFT, BOMB
+from explosion import DIRECTIONS
+
+# ============================================================================
+# FILE: danger.py - DANGER MAP
+# ============================================================================
+# PURPOSE:
+#   Keeps, for every tile, the game time (ms) at which the earliest bomb
+#   whose blast covers it goes off, so AI and hit tests ask one array cell
+#   instead of scanning every bomb:
+#   - add_bomb(bomb): called when a bomb is placed (Bomb.reset)
+#   - remove_bomb(bomb): called when it detonates (Bomb.detonate)
+#   - Blast shapes follow ExplosionEngine: rays of blast_range tiles that
+#     stop at hard blocks, soft blocks and other bombs
+#   - Chains: a bomb inside another bomb's blast goes off no later than it
+#   - Level changes (a soft block destroyed, a bomb placed in a ray) only
+#     re-trace the bombs whose blast touched that tile
+#   Remote bombs can go off any time: their tiles are dangerous right away.
+#
+# DEPENDENCIES:
+#   - numpy: Per-tile detonation times
+#   - level_grid: Cell codes that stop blast rays
+#   - explosion: Ray directions (same blast shape as the real explosion)
+# ============================================================================
+
+SAFE = math.inf
+
+
+# ============================================================================
+# CLASS: DangerMap - Earliest detonation time per tile
+# ============================================================================
+class DangerMap:
+  def __init__(self, game):
+    """
+    CONSTRUCTOR - Create an empty map (attach() hooks it to a level)
+
+    PARAMETERS:
+    - game: Game object (level matrix, clock)
+    """
+    self.GAME = game
+    self.rows = 0
+    self.cols = 0
+    self.times = None       # (rows, cols) float64 detonation times, SAFE if none
+    self.flat = None        # Flat memoryview of times (fast per-tile access)
+    self.hits = {}          # flat index -> {bomb: detonation time} of blasts covering it
+    self.bombs = {}         # bomb -> (detonation time, [flat indices of its blast])
+
+  def attach(self, matrix):
+    """ATTACH - Follow a (new) level matrix, starting with no bombs"""
+    self.rows = matrix.rows
+    self.cols = matrix.cols
+    self.times = np.full((matrix.rows, matrix.cols), SAFE)
+    self.flat = memoryview(self.times.reshape(-1))
+    self.hits = {}
+    self.bombs = {}
+    matrix.add_listener(self.cell_changed)
+
+  def clear(self):
+    """Forget every bomb (level reload, snapshot restore)."""
+    flat = self.flat
+    for index in self.hits:
+      flat[index] = SAFE
+    self.hits = {}
+    self.bombs = {}
+
+  # ----------------------------------------------------------------------
+  # QUERIES - O(1) per tile
+  # ----------------------------------------------------------------------
+  def detonation_time(self, row, col):
+    """Game time (ms) the tile is next hit by a blast, or SAFE."""
+    if 0 <= row < self.rows and 0 <= col < self.cols:
+      return self.flat[row * self.cols + col]
+    return SAFE
+
+  def time_to_blast(self, row, col):
+    """Milliseconds until the tile is hit (0 = any moment now), or SAFE."""
+    return max(0.0, self.detonation_time(row, col) - self.GAME.clock.get_ticks())
+
+  def is_safe(self, row, col, margin=0):
+    """True if no known blast hits the tile within 'margin' milliseconds."""
+    return self.time_to_blast(row, col) > margin
+
+  # ----------------------------------------------------------------------
+  # UPDATES
+  # ----------------------------------------------------------------------
+  def blast_cells(self, bomb):
+    """Flat indices the bomb's blast would cover on the current level."""
+    matrix = self.GAME.level_matrix
+    cols = self.cols
+    cells = [bomb.row * cols + bomb.col]
+    for row_step, col_step in DIRECTIONS:
+      row = bomb.row
+      col = bomb.col
+      for _ in range(bomb.blast_range):
+        row += row_step
+        col += col_step
+        if not matrix.in_bounds(row, col):
+          break
+        code = matrix.get(row, col)
+        if code == HARD:
+          break
+        cells.append(row * cols + col)
+        if code == SOFT or code == BOMB:
+          break
+    return cells
+
+  def fuse_time(self, bomb):
+    """Game time the bomb's own fuse runs out, to within about a logic tick (now for remote bombs)."""
+    if bomb.remote:
+      return self.GAME.clock.get_ticks()
+    return bomb.anim_timer + (bomb.bomb_timer - bomb.bomb_counter) * bomb.anim_frame_time
+
+  def add_bomb(self, bomb):
+    """
+    ADD_BOMB - Register a placed bomb (or refresh one already registered)
+
+    NOTES:
+    - A bomb already inside another blast inherits its earlier time, and
+      bombs inside this blast are brought forward to this bomb's time
+    """
+    time = self.fuse_time(bomb)
+    index = bomb.row * self.cols + bomb.col
+    for other, other_time in self.hits.get(index, {}).items():
+      if other is not bomb:
+        time = min(time, other_time)
+    self.place(bomb, time)
+
+  def remove_bomb(self, bomb):
+    """REMOVE_BOMB - Forget a bomb (before it leaves the level matrix)"""
+    entry = self.bombs.pop(bomb, None)
+    if entry is not None:
+      self.withdraw(bomb, entry[1])
+
+  def cell_changed(self, row, col):
+    """Level matrix listener: re-trace the blasts that reached this tile."""
+    touching = self.hits.get(row * self.cols + col)
+    if touching:
+      for bomb, time in list(touching.items()):
+        self.place(bomb, time)
+
+  def place(self, bomb, time):
+    """
+    PLACE - (Re)write a bomb's blast with detonation time 'time'
+
+    NOTES:
+    - Chained bombs found in the blast are lowered to 'time' as well
+      (worklist instead of recursion, chains can be long)
+    """
+    work = [(bomb, time)]
+    while work:
+      bomb, time = work.pop()
+      entry = self.bombs.get(bomb)
+      if entry is not None:
+        self.withdraw(bomb, entry[1])
+      cells = self.blast_cells(bomb)
+      self.bombs[bomb] = (time, cells)
+      flat = self.flat
+      hits = self.hits
+      for index in cells:
+        hits.setdefault(index, {})[bomb] = time
+        if time < flat[index]:
+          flat[index] = time
+      # Other bombs caught in this blast go off with it
+      for index in cells[1:]:
+        for other, (other_time, _) in self.chained(index, bomb):
+          if other_time > time:
+            work.append((other, time))
+
+  def chained(self, index, bomb):
+    """Registered bombs (other than 'bomb') standing on flat index 'index'."""
+    row, col = divmod(index, self.cols)
+    other = self.GAME.level_matrix.entity(row, col)
+    if other is not None and other is not bomb and other in self.bombs:
+      return ((other, self.bombs[other]),)
+    return ()
+
+  def withdraw(self, bomb, cells):
+    """Take a bomb's blast off its tiles and recompute their earliest time."""
+    flat = self.flat
+    hits = self.hits
+    for index in cells:
+      touching = hits.get(index)
+      if touching is None:
+        continue
+      touching.pop(bomb, None)
+      if touching:
+        flat[index] = min(touching.values())
+      else:
+        del hits[index]
+        flat[index] = SAFE
@@ -0,0 +1,188 @@
+#This is enemy.py - enemies that hunt the player through the shared distance field
+import numpy as np
+import pygame
+import gamesetting as gs
+from level_grid import EMPTY
+
+# ============================================================================
+# FILE: enemy.py - ENEMY SPRITES
+# ============================================================================
+# PURPOSE:
+#   Enemies walk from tile centre to tile centre. On each tile they pick the
+#   next one:
+#   - Within gs.PATH_MAX_DISTANCE of the player: the neighbour the shared
+#     DistanceField (Game.paths) says is one step closer to the player
+#   - Otherwise: keep walking straight, turning when blocked (no randomness,
+#     so replays and snapshots stay deterministic)
+#   Only EMPTY cells are walkable (DistanceField.walkable); if a bomb lands
+#   on the tile an enemy is heading to, it turns back. Tiles about to be
+#   hit by a blast (Game.danger) are avoided. Enemies die in blasts (Game.burn_enemies).
+#
+# DEPENDENCIES:
+#   - pygame: Sprite base class
+#   - numpy: Seeded spawn positions
+#   - gamesetting: Speed, animation time, spawn rules
+#   - level_grid: Empty cell code (spawn cells)
+# ============================================================================
+
+# Headings as (row step, col step): up, right, down, left (clockwise)
+HEADINGS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+# Extra entropy mixed into the level seed for spawn positions
+SPAWN_STREAM = 0x454E454D
+
+
+def spawn_cells(matrix, count, seed, level, start, min_distance=gs.ENEMY_SPAWN_DISTANCE):
+  """
+  SPAWN_CELLS - Pick 'count' distinct empty cells away from the player start
+
+  PARAMETERS:
+  - matrix: LevelGrid of the level
+  - seed, level: Make the choice reproducible per level
+  - start: (row, col) of the player start
+  - min_distance: Minimum Manhattan distance (tiles) from the start
+
+  RETURNS:
+  - List of (row, col) (fewer than 'count' if the level has no more room)
+  """
+  cells = np.argwhere(matrix.cells == EMPTY)
+  far = np.abs(cells[:, 0] - start[0]) + np.abs(cells[:, 1] - start[1]) >= min_distance
+  cells = cells[far]
+  count = min(count, len(cells))
+  rng = np.random.default_rng([seed, level, SPAWN_STREAM])
+  picks = rng.choice(len(cells), size=count, replace=False)
+  return [tuple(int(value) for value in cells[index]) for index in picks]
+
+
+# ============================================================================
+# CLASS: Enemy - Tile-walking monster
+# ============================================================================
+class Enemy(pygame.sprite.Sprite):
+  def __init__(self, game, image_dict, group, row_num, col_num, size, serial=0):
+    """
+    CONSTRUCTOR - Place an enemy on the centre of a tile
+
+    PARAMETERS:
+    - game: Game object (level matrix, distance field, clock)
+    - image_dict: {"walk": [frames]} animation frames
+    - group: Sprite group to join
+    - row_num, col_num: Starting tile
+    - size: Tile size in pixels
+    - serial: Spawn number; sets the first wandering heading
+    """
+    super().__init__(group)
+    self.GAME = game
+    self.size = size
+    self.serial = serial
+
+    # Tile the enemy stands on / is walking to (equal when it stands still)
+    self.row = self.target_row = row_num
+    self.col = self.target_col = col_num
+    self.heading = serial % len(HEADINGS)
+
+    # WORLD POSITION (pixels, same layout as blocks and the player)
+    self.x = col_num * size
+    self.y = (row_num * size) + gs.Y_OFFSET
+    self.prev_x = self.x
+    self.prev_y = self.y
+    self.speed = gs.ENEMY_SPEED
+    # Walk toward the target tile: pixels per tick on each axis, pixels left
+    self.step_x = 0
+    self.step_y = 0
+    self.remaining = 0
+
+    # ANIMATION
+    self.action = "walk"
+    self.index = 0
+    self.anim_time = gs.ENEMY_FRAME_TIME
+    self.anim_time_set = self.GAME.clock.get_ticks()
+    self.image_dict = image_dict
+    self.image = self.image_dict[self.action][self.index]
+    self.rect = self.image.get_rect(topleft=(self.x, self.y))
+    self.GAME.entities.insert(self)
+
+  def kill(self):
+    """Leave every group and the entity spatial hash."""
+    self.GAME.entities.remove(self)
+    super().kill()
+
+  def set_target(self, row, col):
+    """Start walking (in a straight line) to the centre of tile (row, col)."""
+    self.target_row = row
+    self.target_col = col
+    dx = col * self.size - self.x
+    dy = (row * self.size) + gs.Y_OFFSET - self.y
+    self.step_x = (dx > 0) - (dx < 0)
+    self.step_y = (dy > 0) - (dy < 0)
+    self.remaining = abs(dx) + abs(dy)
+
+  def choose_target(self):
+    """
+    CHOOSE_TARGET - Pick the next tile once the current one is reached
+
+    ORDER:
+    1. One step down the distance field toward the player
+    2. Straight ahead, else the other headings clockwise
+    3. Stay put (boxed in)
+
+    NOTES:
+    - Tiles a bomb blast hits within gs.ENEMY_DANGER_MS (Game.danger) are
+      avoided; an enemy already standing in a blast takes any way out
+    """
+    paths = self.GAME.paths
+    danger = self.GAME.danger
+    step = paths.next_step(self.row, self.col)
+    if step is not None and paths.walkable(*step) and danger.is_safe(*step, gs.ENEMY_DANGER_MS):
+      self.heading = HEADINGS.index((step[0] - self.row, step[1] - self.col))
+      self.set_target(*step)
+      return
+    here_safe = danger.is_safe(self.row, self.col, gs.ENEMY_DANGER_MS)
+    for safe_only in ((True,) if here_safe else (True, False)):
+      for turn in range(len(HEADINGS)):
+        heading = (self.heading + turn) % len(HEADINGS)
+        row = self.row + HEADINGS[heading][0]
+        col = self.col + HEADINGS[heading][1]
+        if paths.walkable(row, col) and (not safe_only or danger.is_safe(row, col, gs.ENEMY_DANGER_MS)):
+          self.heading = heading
+          self.set_target(row, col)
+          return
+
+  def update(self):
+    """
+    UPDATE - Walk toward the target tile (called once per logic tick)
+
+    NOTES:
+    - Turns back if the target tile stopped being walkable (bomb placed)
+    - Costs a few attribute updates per tick; the path decision is made
+      once per tile
+    """
+    if self.remaining and not self.GAME.paths.walkable(self.target_row, self.target_col):
+      self.heading = (self.heading + 2) % len(HEADINGS)
+      self.set_target(self.row, self.col)
+    if not self.remaining:
+      self.row = self.target_row
+      self.col = self.target_col
+      self.choose_target()
+
+    if self.remaining:
+      step = min(self.speed, self.remaining)
+      self.x += self.step_x * step
+      self.y += self.step_y * step
+      self.remaining -= step
+      self.rect.topleft = (int(self.x), int(self.y))
+      self.GAME.entities.move(self)
+
+    # Walk animation, one frame every anim_time milliseconds
+    now = self.GAME.clock.get_ticks()
+    if now - self.anim_time_set > self.anim_time:
+      frames = self.image_dict[self.action]
+      self.index = (self.index + 1) % len(frames)
+      self.image = frames[self.index]
+      self.anim_time_set = now
+
+  def tile(self):
+    """Tile under the centre of the enemy."""
+    return (int(self.y) + self.size // 2 - gs.Y_OFFSET) // self.size, (int(self.x) + self.size // 2) // self.size
+
+  def draw(self, window, x_offset=0, y_offset=0):
+    """DRAW - Render the enemy with camera offsets applied"""
+    self.GAME.blit_sprite(window, self.image, self.x - x_offset, self.y - y_offset)
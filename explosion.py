@@ -0,0 +1,166 @@
+#This is explosion.py - bomb blasts, chain reactions and flames for Bomberman
+from collections import deque
+import pygame
+import gamesetting as gs
+from level_grid import HARD, SOFT, BOMB
+
+# ============================================================================
+# FILE: explosion.py - EXPLOSION PROPAGATION ENGINE
+# ============================================================================
+# PURPOSE:
+#   Turns detonated bombs into blasts on the level grid:
+#   - Each bomb sends a ray up, down, left and right, bomb.blast_range tiles
+#   - A ray stops at a hard block (not burnt), at a soft block (burnt and
+#     destroyed) and at another bomb (which joins the chain)
+#   - All bombs set off during one logic tick are resolved together in one
+#     breadth-first pass over the chain: every bomb is detonated once and
+#     every burning cell gets one flame
+#   - Everything is looked up in the level matrix, so there are no sprite
+#     group scans no matter how many bombs are chained
+#
+# DEPENDENCIES:
+#   - level_grid: Cell codes and bomb entities stored in the matrix
+#   - pygame: Flame sprites
+#   - gamesetting: Tile size, Y offset and flame frame time
+# ============================================================================
+
+# Ray directions as (row step, col step)
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+# ============================================================================
+# CLASS: ExplosionEngine - Batched blast resolution, once per logic tick
+# ============================================================================
+class ExplosionEngine:
+  def __init__(self, game):
+    """
+    CONSTRUCTOR - Create an engine with no pending bombs
+
+    PARAMETERS:
+    - game: Game object (level matrix, scheduler, groups, assets)
+    """
+    self.GAME = game
+    self.pending = []     # Bombs set off since the last process()
+
+  def detonate(self, bomb):
+    """DETONATE - Queue a bomb to blow up at the end of this tick (duplicates ignored)"""
+    if bomb.detonating or not bomb.alive():
+      return
+    bomb.detonating = True
+    self.pending.append(bomb)
+
+  def process(self):
+    """
+    PROCESS - Resolve every queued bomb and the chains they start
+
+    STEPS:
+    1. Breadth-first over the bombs: remove each bomb from the grid, walk its
+       four rays and queue any bomb a ray reaches
+    2. Destroy the soft blocks that were hit (once each)
+    3. Put one flame on every burning cell
+
+    RETURNS:
+    - The set of burning (row, col) cells (empty when nothing exploded)
+
+    NOTES:
+    - Soft blocks are destroyed after the walk, so every ray of this pass
+      stops at the same blocks regardless of processing order
+    """
+    if not self.pending:
+      return set()
+    matrix = self.GAME.level_matrix
+    queue = deque(self.pending)
+    self.pending = []
+    burning = set()
+    soft_hits = set()
+
+    while queue:
+      bomb = queue.popleft()
+      bomb.detonate()
+      burning.add((bomb.row, bomb.col))
+      for row_step, col_step in DIRECTIONS:
+        row = bomb.row
+        col = bomb.col
+        for _ in range(bomb.blast_range):
+          row += row_step
+          col += col_step
+          if not matrix.in_bounds(row, col):
+            break
+          code = matrix.get(row, col)
+          if code == HARD:
+            break
+          burning.add((row, col))
+          if code == SOFT:
+            soft_hits.add((row, col))
+            break
+          if code == BOMB:
+            other = matrix.entity(row, col)
+            if other is not None and not other.detonating:
+              other.detonating = True
+              queue.append(other)
+            break
+
+    for row, col in soft_hits:
+      self.GAME.destroy_soft_block(row, col)
+    self.spawn_flames(burning)
+    return burning
+
+  def spawn_flames(self, cells):
+    """Put one flame sprite on each burning cell."""
+    images = self.GAME.ASSETS.flame["flame"]
+    group = self.GAME.groups["flame"]
+    acquire = self.GAME.flame_pool.acquire
+    for row, col in cells:
+      acquire(images, group, row, col, gs.SIZE)
+
+
+# ============================================================================
+# CLASS: Flame - Short-lived blast animation on one tile
+# ============================================================================
+class Flame(pygame.sprite.Sprite):
+  def __init__(self, game, image_list, group, row_num, col_num, size):
+    """
+    CONSTRUCTOR - Show a flame on one tile; it removes itself after its animation
+
+    NOTES:
+    - Like bombs, flames have no per-tick update: each frame change is a
+      timer on Game.scheduler
+    - Normally created through Game.flame_pool, which recycles finished
+      flames with reset()
+    """
+    super().__init__()
+    self.GAME = game
+    self.rect = pygame.Rect(0, 0, 0, 0)
+    self.reset(image_list, group, row_num, col_num, size)
+
+  def reset(self, image_list, group, row_num, col_num, size):
+    """RESET - (Re)start the flame animation on a tile"""
+    self.add(group)
+    self.row = row_num
+    self.col = col_num
+    self.x = col_num * size
+    self.y = (row_num * size) + gs.Y_OFFSET
+
+    self.index = 0
+    self.image_list = image_list
+    self.image = self.image_list[self.index]
+    self.rect.size = self.image.get_size()
+    self.rect.topleft = (self.x, self.y)
+    self.frame_timer = self.GAME.scheduler.schedule(
+      self.GAME.clock.get_ticks() + gs.FLAME_FRAME_TIME, self.animation)
+
+  def animation(self):
+    """Scheduled callback: next frame, or disappear (back to the pool) after the last one."""
+    self.index += 1
+    if self.index == len(self.image_list):
+      self.frame_timer = None
+      self.kill()
+      self.GAME.flame_pool.release(self)
+      return
+    self.image = self.image_list[self.index]
+    self.frame_timer = self.GAME.scheduler.schedule(
+      self.GAME.clock.get_ticks() + gs.FLAME_FRAME_TIME, self.animation)
+
+  def draw(self, window, x_offset=0, y_offset=0):
+    """DRAW - Render the flame with camera offsets applied"""
+    self.GAME.blit_sprite(window, self.image, int(self.x) - int(x_offset), int(self.y) - int(y_offset))
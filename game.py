@@ -1,8 +1,21 @@
 #This is game.py - the main game logic for Bomberman
 import pygame
-from character import Character
+from character import Character, Bomb
 from blocks import Hard_block, Soft_Block
-from random import choice
+from world_layer import WorldLayer
+from level_grid import generate_level, new_seed, HARD, SOFT
+from level_cache import LevelCache
+from gameclock import WallClock
+from gameinput import KeyboardInput
+from profiler import NullProfiler
+from scaled_frames import ScaledFrameCache
+from scheduler import Scheduler
+from explosion import ExplosionEngine, Flame
+from pool import SpritePool
+from pathfinding import DistanceField
+from danger import DangerMap
+from spatial_hash import SpatialHash
+from enemy import Enemy, spawn_cells
 import gamesetting as gs
 
 # ============================================================================
@@ -14,11 +27,24 @@ import gamesetting as gs
 #   - Game state updates (sprite updates, camera interpolation)
 #   - Camera system with deadzone and smooth following
 #   - Rendering of game world (background, sprites, camera offsets)
+#   - Resolution independence: logic runs in gs.SIZE "world pixels", the
+#     on-screen tile size follows the window size
 #
 # DEPENDENCIES:
 #   - pygame: Sprite groups, rendering
 #   - Character: Player sprite class
-#   - Hard_block, Soft_Block: Block sprite classes
+#   - Hard_block, Soft_Block: Shared (flyweight) block types
+#   - level_grid: Compact cell-code grid and seeded (seed, level) generation
+#   - LevelCache: Generated layouts cached in memory and in .cache/levels
+#   - WallClock, KeyboardInput: Default time and input sources
+#   - NullProfiler: Default (no-op) timing hooks
+#   - ScaledFrameCache: Sprite frames at the current on-screen tile size
+#   - Scheduler: Timed events (bomb animation frames / fuses)
+#   - ExplosionEngine: Blast rays, destroyed blocks and chain reactions
+#   - SpritePool: Recycles bomb and flame sprites
+#   - DistanceField, Enemy: Enemies steered by one shared distance field
+#   - DangerMap: When each tile will be hit by a bomb blast
+#   - SpatialHash: Entity-vs-entity lookups (player, enemies, bombs)
 #   - gamesetting: Game configuration and constants
 # ============================================================================
 
@@ -26,10 +52,22 @@ import gamesetting as gs
 # CLASS: Game - Main game state and logic controller
 # ============================================================================
 class Game:
-  def __init__(self, main, assets):
+  def __init__(self, main, assets, seed=None, clock=None, input_source=None, profiler=None,
+               rows=gs.ROWS, cols=gs.COLS, level_cache=None):
     """
     CONSTRUCTOR - Initialize game state and world
     
+    PARAMETERS:
+    - main: Bomberman instance (owns the screen and the running flag)
+    - assets: Assets instance with all loaded sprites
+    - seed: Level seed; with the level number it fully defines the layout
+      (None = pick a random seed, kept in self.seed so it can be shared)
+    - clock: Time source with get_ticks() (default: WallClock, real time)
+    - input_source: Held-key source with get_pressed() (default: KeyboardInput)
+    - profiler: FrameProfiler timing the draw sections (default: NullProfiler)
+    - rows, cols: Level size in tiles (default: gs.ROWS x gs.COLS)
+    - level_cache: LevelCache to load layouts from (default: memory + disk)
+    
     INITIALIZATION STEPS:
     1. Store references to main Bomberman instance and Assets
     2. Create sprite groups for organizing game objects
@@ -41,21 +79,55 @@ class Game:
     self.MAIN = main
     self.ASSETS = assets
 
+    # TIME AND INPUT SOURCES - swapped for virtual ones in headless mode
+    self.clock = clock if clock is not None else WallClock()
+    self.input_source = input_source if input_source is not None else KeyboardInput()
+    self.profiler = profiler if profiler is not None else NullProfiler()
+
+    # Timed events run against self.clock (bomb frames, fuses); see update()
+    self.scheduler = Scheduler()
+    # Bombs the player is still standing on (walkable until they step off)
+    self.passable_bombs = set()
+
     # Sprite groups for organizing and updating game objects
+    # Blocks are not sprites: they are cell codes in the level matrix, drawn
+    # by the world layer with one shared block type per code (block_types)
     self.groups = {
-      "hard_block": pygame.sprite.Group(),    # Static indestructible barriers
-      "soft_block": pygame.sprite.Group(),    # Destructible blocks
       "bomb": pygame.sprite.Group(),          # Bombs placed by player
+      "flame": pygame.sprite.Group(),         # Blast flames (short lived)
+      "enemy": pygame.sprite.Group(),         # Enemies hunting the player
       "player": pygame.sprite.Group()         # Player character
     }
+    # One flyweight per block cell code, shared by every block of that kind
+    self.block_types = {
+      HARD: Hard_block(self.ASSETS.hard_block["hard_block"]),
+      SOFT: Soft_Block(self.ASSETS.soft_block["soft_block"]),
+    }
+    # Groups driven by scheduler events instead of a per-tick update()
+    self.timed_groups = ("bomb", "flame")
+    # Bombs set off during a tick are resolved together at the end of update()
+    self.explosions = ExplosionEngine(self)
+    # Bombs and flames are recycled instead of re-created (see pool.py)
+    self.bomb_pool = SpritePool(Bomb, self)
+    self.flame_pool = SpritePool(Flame, self)
     
+    # Moving and placed entities (characters, enemies, bombs) by position
+    self.entities = SpatialHash()
+
     # Create player character at starting position (grid: row 3, col 2)
     self.PLAYER = Character(self, self.ASSETS.player_char, self.groups["player"], 3, 2, gs.SIZE)
+    # Distances to the player, shared by every enemy (follows the level matrix)
+    self.paths = DistanceField(self)
+    # Per-tile detonation times of the placed bombs (AI, hit tests)
+    self.danger = DangerMap(self)
 
     # CAMERA SYSTEM - Smooth following with deadzone
     # Current camera offsets (in pixels) - what's actually rendered
     self.x_camera_offset = 0
     self.y_camera_offset = 0
+    # Offsets at the start of the current logic tick (for render interpolation)
+    self.prev_x_camera_offset = 0
+    self.prev_y_camera_offset = 0
     
     # Target camera offsets - where camera wants to be
     self.cam_target_x = 0
@@ -70,19 +142,65 @@ class Game:
     # Camera only moves when player leaves this central area
     self.deadzone_ratio = 0.6
     
-    # LEVEL INFORMATION
+    # RENDER SCALE - on-screen tile size derived from the window size
+    # World coordinates stay in gs.SIZE tiles; only drawing is scaled
+    self.frames = ScaledFrameCache(self.ASSETS.frame_sets)
+    self.tile_size = gs.SIZE
+    self.scale = 1.0
+    self.set_tile_size(self.tile_size_for(self.MAIN.screen))
+
+    # DIRTY RECTANGLES - what changed on screen since the last draw
+    self.dirty_rects = gs.DIRTY_RECTS
+    self.last_view = None         # (cam_x, cam_y, tile size, window size) of the last draw
+    self.drawn_sprites = {}       # id(sprite) -> (screen Rect, image) of the last draw
+    self.changed_tiles = set()    # (row, col) level cells changed since the last draw
+
+    # LEVEL INFORMATION - (seed, level) fully defines the layout
     self.level = 1
-    self.level_matrix = self.generate_level_matrix(gs.ROWS, gs.COLS)
+    self.seed = seed if seed is not None else new_seed()
+    self.level_cache = level_cache if level_cache is not None else LevelCache()
+    self.set_level_matrix(self.level_cache.load(self.seed, self.level, rows, cols))
+    self.spawn_enemies()
 
   def input(self, events):
+    # Start of a logic tick: remember where everything was so draw() can
+    # blend between this tick and the next one
+    self.save_previous_positions()
     # Expect an events list forwarded from main
     self.PLAYER.input(events)
+
+  def save_previous_positions(self):
+    """Store camera and moving sprite positions from before this logic tick."""
+    self.prev_x_camera_offset = self.x_camera_offset
+    self.prev_y_camera_offset = self.y_camera_offset
+    for name, value in self.groups.items():
+      if name in self.timed_groups:
+        continue
+      for item in value:
+        item.prev_x = item.x
+        item.prev_y = item.y
     
   def update(self):
     # self.hard_blocks.update()
     # self.soft_block.update()
     # self.PLAYER.update()
-    for value in self.groups.values():
+    # Timed events first (bombs used to update before the player), then
+    # release bombs the player has walked off
+    self.scheduler.run_due(self.clock.get_ticks())
+    # Every bomb set off this tick (fuse, remote trigger, chain) in one pass
+    burning = self.explosions.process()
+    if burning and self.groups["enemy"]:
+      self.burn_enemies(burning)
+    self.release_passable_bombs()
+    # One distance field for all enemies, rebuilt only when it went stale
+    if self.groups["enemy"]:
+      self.paths.update()
+
+    # Bombs and flames only change on their scheduled events, so only the
+    # remaining groups are updated every tick
+    for name, value in self.groups.items():
+      if name in self.timed_groups:
+        continue
       for item in value:
         item.update()
 
@@ -92,14 +210,19 @@ class Game:
     self.x_camera_offset += dx * self.camera_lerp
     self.y_camera_offset += dy * self.camera_lerp
 
+  def release_passable_bombs(self):
+    """Check only the bombs under the player; every other bomb costs nothing per tick."""
+    if self.passable_bombs:
+      for bomb in list(self.passable_bombs):
+        bomb.planted_bomb_player_collision()
+
   def update_camera(self, centerx, centery):
     """Update camera offsets so the player stays near screen center (both axes)."""
-    total_map_width = gs.COLS * gs.SIZE
-    total_map_height = gs.ROWS * gs.SIZE
+    total_map_width = self.level_matrix.cols * gs.SIZE
+    total_map_height = self.level_matrix.rows * gs.SIZE
 
-    # Use current window size so camera adapts to any screen/device
-    screen_w = self.MAIN.screen.get_width()
-    screen_h = self.MAIN.screen.get_height()
+    # Use current window size (in world pixels) so camera adapts to any screen/device
+    screen_w, screen_h = self.view_size()
     half_screen_w = screen_w // 2
     half_screen_h = screen_h // 2
 
@@ -150,106 +273,269 @@ class Game:
     self.cam_target_x = float(round(desired_x))
     self.cam_target_y = float(round(desired_y))
 
-  def draw(self,window):
+  def draw(self, window, alpha=1.0):
+    """
+    Draw the world and sprites with the camera applied.
+
+    PARAMETERS:
+    - window: pygame.Surface to draw on
+    - alpha: 0..1 blend between the previous logic tick (0) and the current
+      one (1), used to interpolate camera and sprites when rendering faster
+      than the logic tick rate
+
+    RETURNS:
+    - List of screen Rects that changed since the previous draw, or None
+      when the whole window must be pushed (camera scrolled, window resized,
+      first frame, or gs.DIRTY_RECTS off)
+
+    NOTES:
+    - The window is still repainted completely (one world layer blit);
+      only the display update is narrowed to the returned rects
+    """
     #Draw the Green Background squares
     # for row_num, row in enumerate(self.level_matrix): 
     #   for col_num, in enumerate(row):
     #     window.blit(self.ASSETS.background["background"][0],
     #                 (col_num * gs.SIZE, (row_num * gs.SIZE) + gs.Y_OFFSET))
 
+    # Follow the window size: rescale frames / world layer only if it changed
+    self.set_tile_size(self.tile_size_for(window))
+
     #Fill the background entirely
     window.fill(gs.GREY)
     #This is from gemini as a test
 
     # Apply camera offsets to background tiles
     # Use integer offsets for drawing to prevent half-pixel tile cutoffs
-    cam_x = int(round(getattr(self, 'x_camera_offset', 0)))
-    cam_y = int(round(getattr(self, 'y_camera_offset', 0)))
-    for row_num, row in enumerate(self.level_matrix): 
-      for col_num, cell in enumerate(row): 
-        # Now it unpacks correctly: col_num gets the index, 'cell' gets the value ("_" or "@")
-        window.blit(self.ASSETS.background["background"][0],
-                    ((col_num * gs.SIZE) - cam_x, (row_num * gs.SIZE) + gs.Y_OFFSET - cam_y))                
-
+    cam_x = int(round(self.lerp(self.prev_x_camera_offset, self.x_camera_offset, alpha)))
+    cam_y = int(round(self.lerp(self.prev_y_camera_offset, self.y_camera_offset, alpha)))
+    # Background tiles and blocks come from the cached world layer in one blit
+    with self.profiler.section("draw.background"):
+      self.world_layer.draw(window, cam_x, cam_y)
 
     # self.hard_blocks.draw(window)
     # self.soft_block.draw(window)
     # self.PLAYER.draw(window)
-    # Draw all sprite groups, passing the camera offsets so sprites shift properly
-    for value in self.groups.values():
-      for item in value:
-        # Prefer the 2-arg (x,y) draw signature; fall back for compatibility
-        try:
-          item.draw(window, cam_x, cam_y)
-        except TypeError:
+    # Draw the sprite groups, passing the camera offsets so sprites shift properly
+    # Sprites entirely outside the viewport are skipped
+    view = self.viewport_rect(window, cam_x, cam_y)
+    drawn = {}
+    for name, value in self.groups.items():
+      with self.profiler.section("draw." + name):
+        for item in value:
+          if not view.colliderect((int(item.x), int(item.y)) + item.image.get_size()):
+            continue
+          # Sprites draw at (x - offset), so shifting the offset by how far the
+          # interpolated position lags the current one draws them in between ticks
+          draw_x = cam_x + item.x - self.lerp(getattr(item, 'prev_x', item.x), item.x, alpha)
+          draw_y = cam_y + item.y - self.lerp(getattr(item, 'prev_y', item.y), item.y, alpha)
+          if self.dirty_rects:
+            drawn[id(item)] = (self.sprite_screen_rect(item, item.x - draw_x, item.y - draw_y), item.image)
+          # Prefer the 2-arg (x,y) draw signature; fall back for compatibility
           try:
-            item.draw(window, cam_x)
+            item.draw(window, draw_x, draw_y)
           except TypeError:
-            item.draw(window)
+            try:
+              item.draw(window, draw_x)
+            except TypeError:
+              item.draw(window)
+
+    return self.collect_dirty_rects(window, cam_x, cam_y, drawn)
+
+  def request_full_update(self):
+    """Make the next draw() return None so the whole window is pushed (new display mode, expose)."""
+    self.last_view = None
+
+  def tile_changed(self, row, col):
+    """Level matrix listener: remember the cell so its screen area is pushed on the next draw."""
+    if self.dirty_rects:
+      self.changed_tiles.add((row, col))
+
+  def sprite_screen_rect(self, item, x, y):
+    """
+    Screen Rect covered by a sprite drawn at camera-relative world position
+    (x, y). Grown by one pixel on each side to cover rounding of fractional
+    positions.
+    """
+    width, height = item.image.get_size()
+    rect = pygame.Rect(int(x * self.scale), int(y * self.scale),
+                       int(width * self.scale) + 1, int(height * self.scale) + 1)
+    return rect.inflate(2, 2)
+
+  def collect_dirty_rects(self, window, cam_x, cam_y, drawn):
+    """
+    COLLECT_DIRTY_RECTS - Work out which screen areas differ from the last draw
+
+    STEPS:
+    1. Camera, tile size or window size changed -> None (full update)
+    2. Sprites that moved, changed frame, appeared or vanished: old and new rects
+    3. Level cells changed since the last draw (blocks destroyed, bombs placed)
+    """
+    view = (cam_x, cam_y, self.tile_size, window.get_size())
+    previous = self.drawn_sprites
+    self.drawn_sprites = drawn
+    changed_tiles = self.changed_tiles
+    self.changed_tiles = set()
+    if not self.dirty_rects or view != self.last_view:
+      self.last_view = view
+      return None
+
+    rects = []
+    for key, (rect, image) in drawn.items():
+      old = previous.pop(key, None)
+      if old is None:
+        rects.append(rect)
+      elif old[0] != rect or old[1] is not image:
+        rects.append(rect.union(old[0]))
+    # Whatever is left was drawn last time but not now (killed or culled)
+    rects.extend(rect for rect, _ in previous.values())
 
+    tile = self.tile_size
+    cam_px, origin_y = self.world_layer.screen_origin(cam_x, cam_y)
+    for row, col in changed_tiles:
+      rects.append(pygame.Rect(col * tile - cam_px, row * tile + origin_y, tile, tile))
+    return rects
 
+  @staticmethod
+  def lerp(start, end, alpha):
+    """Linear interpolation between start and end (alpha 0..1)."""
+    return start + (end - start) * alpha
 
+  def tile_size_for(self, window):
+    """On-screen tile size (pixels) for a window: keeps gs.VIEW_TILES_HIGH tiles visible vertically."""
+    return max(gs.MIN_TILE_SIZE, int(round(window.get_height() / gs.VIEW_TILES_HIGH)))
+
+  def set_tile_size(self, tile_size):
+    """
+    Switch the on-screen tile size. Scaled frames for that size are built once
+    (and cached), and the world layer is re-rendered at the new size.
+    """
+    if tile_size == self.tile_size:
+      return
+    self.tile_size = tile_size
+    self.scale = tile_size / gs.SIZE
+    self.frames.use(tile_size)
+    world_layer = getattr(self, 'world_layer', None)
+    if world_layer is not None:
+      world_layer.resize()
+
+  def view_size(self):
+    """Window size converted to world pixels (what the camera can see)."""
+    return (self.MAIN.screen.get_width() / self.scale,
+            self.MAIN.screen.get_height() / self.scale)
+
+  def blit_sprite(self, window, image, x, y):
+    """
+    Draw a sprite frame at camera-relative world position (x, y), scaling
+    the position and the frame to the current tile size.
+    """
+    if self.scale != 1:
+      image = self.frames.get(image)
+      x = round(x * self.scale)
+      y = round(y * self.scale)
+    window.blit(image, (x, y))
+
+  def viewport_rect(self, window, cam_x, cam_y):
+    """Return the part of the world (in world pixels) currently shown in the window."""
+    return pygame.Rect(cam_x, cam_y, int(-(-window.get_width() // self.scale)),
+                       int(-(-window.get_height() // self.scale)))
+
+  def visible_tile_range(self, cam_x, cam_y):
+    """
+    Return (first_row, last_row, first_col, last_col) of the tiles that intersect
+    the viewport. The last row/col are exclusive and everything is clamped to the map.
+    """
+    screen_w, screen_h = self.view_size()
+    rows = self.level_matrix.rows
+    cols = self.level_matrix.cols
+
+    # Tiles start at world y = Y_OFFSET, so shift the camera into tile space first
+    top = cam_y - gs.Y_OFFSET
+    first_row = max(0, top // gs.SIZE)
+    last_row = min(rows, int(-(-(top + screen_h) // gs.SIZE)))
+    first_col = max(0, cam_x // gs.SIZE)
+    last_col = min(cols, int(-(-(cam_x + screen_w) // gs.SIZE)))
+    return first_row, max(first_row, last_row), first_col, max(first_col, last_col)
 
   def generate_level_matrix(self,rows,cols):
-    """Generate the basic level matrix"""
-    matrix = []
-    for row in range(rows):
-      line = []
-      for col in range(cols):
-        line.append("_")
-      matrix.append(line)
-    self.insert_hard_block_into_matrix(matrix)  
-    self.insert_soft_block_into_matrix(matrix)
-    for row in matrix:
-      print(row)
-    return matrix
-      
-
-  def insert_hard_block_into_matrix(self,matrix):
-    """Insert all of the Hard Barrier Block into the level of matrix"""
-    LAST_ROW = len(matrix) - 1
-
-    if not matrix or not matrix[0]:
-        return
-    LAST_COL = len(matrix[0]) - 1       
-    
-    for row_num, row in enumerate(matrix):
-       for col_num, col in enumerate(row):
-         
-         if row_num == 0 or row_num == LAST_ROW or \
-             col_num == 0 or col_num == LAST_COL or \
-               (row_num % 2 == 0 and col_num % 2 == 0):
-           matrix[row_num][col_num] = Hard_block(self,
-                                              self.ASSETS.hard_block["hard_block"],
-                                              self.groups["hard_block"],
-                                              row_num, col_num)
-    return
-  
-  def insert_soft_block_into_matrix(self,matrix):
-    """RANDOMLY INSERT SOFT BLOCKS INTO THE LEVEL MATRIX"""
-
-    for row_num, row in enumerate(matrix):
-       for col_num, col in enumerate(row):
-         if row_num == 0 or row_num == len(matrix) - 1 or \
-            col_num == 0 or col_num == len(row) - 1 or \
-            (row_num % 2 == 0 and col_num % 2 == 0):
-            continue
-         elif row_num in [2,3,4] and col_num in [1,2,3]:
-          continue
-         else:
-           cell = choice(["@","_","_","_"])
-           if cell == "@":
-             cell = Soft_Block(self,self.ASSETS.soft_block["soft_block"],
-                               self.groups["soft_block"],row_num,col_num,)
-           matrix[row_num][col_num] = cell
-    return     
-    # for row_num, row in enumerate(matrix):
-    #   for col_num, col in enumerate(row):
-    #     if row_num == 0 or row_num == len(matrix)-1 or \
-    #         col_num == 0 or col_num == len(row)-1 or \
-    #           (row_num % 2 == 0 and col_num % 2 == 0):
-    #      matrix[row_num][col_num] = Hard_block(self, # Pass the Game instance
-    #                                   self.ASSETS.hard_block["hard_block"], 
-    #                                   self.hard_blocks,
-    #                                   row_num, col_num)
-    # return           
\ No newline at end of file
+    """
+    Generate the level matrix (hard block lattice + random soft blocks).
+
+    The whole layout is computed with array operations and depends only on
+    (self.seed, self.level); blocks stay plain cell codes (see block_at()
+    for their shared block type). Bypasses the level cache.
+    """
+    return generate_level(self.seed, self.level, rows, cols)
+
+  def set_level_matrix(self, matrix):
+    """
+    Make 'matrix' the current level: hook up the listeners and start a new
+    world layer (built on the first draw).
+    """
+    self.level_matrix = matrix
+    # Cached background + blocks surface (built on the first draw)
+    # Any change to the level matrix repaints that tile of the layer
+    self.world_layer = WorldLayer(self)
+    self.level_matrix.add_listener(self.world_layer.mark_dirty)
+    self.level_matrix.add_listener(self.tile_changed)
+    self.paths.attach(matrix)
+    self.danger.attach(matrix)
+    self.request_full_update()
+
+  def load_level(self, level):
+    """
+    LOAD_LEVEL - Switch to (or restart) level 'level' of the current seed
+
+    NOTES:
+    - Layouts come from the level cache, so revisiting or restarting a level
+      does not regenerate it
+    - Bombs, flames and their pending timers are dropped, enemies respawn
+    """
+    rows = self.level_matrix.rows
+    cols = self.level_matrix.cols
+    self.scheduler.clear()
+    self.explosions.pending = []
+    self.passable_bombs.clear()
+    for name in self.timed_groups:
+      for sprite in self.groups[name]:
+        self.entities.remove(sprite)
+      self.groups[name].empty()
+    for enemy in self.groups["enemy"].sprites():
+      enemy.kill()
+    self.PLAYER.bomb_planted = 0
+    self.level = level
+    self.set_level_matrix(self.level_cache.load(self.seed, level, rows, cols))
+    self.spawn_enemies()
+
+  def spawn_enemies(self, count=gs.ENEMY_COUNT):
+    """Put 'count' enemies on empty cells away from the player start (same cells for the same seed/level)."""
+    start = (self.PLAYER.row_num, self.PLAYER.col_num)
+    cells = spawn_cells(self.level_matrix, count, self.seed, self.level, start)
+    for serial, (row, col) in enumerate(cells):
+      Enemy(self, self.ASSETS.enemy, self.groups["enemy"], row, col, gs.SIZE, serial)
+
+  def burn_enemies(self, burning):
+    """Kill every enemy standing on one of the burning (row, col) cells."""
+    # Only enemies near a burning tile are looked at (spatial hash)
+    group = self.groups["enemy"]
+    victims = {}
+    for row, col in burning:
+      tile = pygame.Rect(col * gs.SIZE, (row * gs.SIZE) + gs.Y_OFFSET, gs.SIZE, gs.SIZE)
+      for enemy in self.entities.query(tile, group):
+        if enemy.tile() in burning:
+          victims[enemy] = None
+    for enemy in victims:
+      enemy.kill()
+
+  def block_at(self, row, col):
+    """
+    Return the shared Hard_block/Soft_Block type of a block cell, or None
+    for cells without a block. The position is the caller's (row, col).
+    """
+    return self.block_types.get(self.level_matrix.get(row, col))
+
+  def destroy_soft_block(self, row, col):
+    """Remove the soft block at (row, col) from the level matrix."""
+    if self.level_matrix.get(row, col) != SOFT:
+      return
+    self.level_matrix.clear(row, col)
@@ -0,0 +1,53 @@
+#This is gameclock.py - time sources used by the Bomberman game logic
+import pygame
+
+# ============================================================================
+# FILE: gameclock.py - GAME CLOCKS
+# ============================================================================
+# PURPOSE:
+#   Game logic never calls pygame.time directly; it asks Game.clock for the
+#   current time in milliseconds. This lets the same logic run against:
+#   - WallClock: Real time from pygame (normal windowed game)
+#   - VirtualClock: Time that only moves when advanced (headless runs,
+#     simulations, replays)
+#
+# DEPENDENCIES:
+#   - pygame: pygame.time.get_ticks() for the wall clock
+# ============================================================================
+
+# ============================================================================
+# CLASS: WallClock - Real elapsed time since pygame.init()
+# ============================================================================
+class WallClock:
+  def get_ticks(self):
+    """Return milliseconds since pygame.init() (same as pygame.time.get_ticks)."""
+    return pygame.time.get_ticks()
+
+
+# ============================================================================
+# CLASS: VirtualClock - Manually advanced simulation time
+# ============================================================================
+class VirtualClock:
+  def __init__(self, start=0):
+    """
+    CONSTRUCTOR - Create a clock that starts at 'start' milliseconds
+
+    NOTES:
+    - Time only moves when advance() is called, so a simulation can run
+      thousands of ticks per second and still see 'game' time
+    """
+    self.ticks = start
+
+  def get_ticks(self):
+    """
+    Return the current simulated time in whole milliseconds.
+
+    NOTES:
+    - Rounded, not truncated: ticks is a sum of float steps (1000 / 60 ms),
+      which lands a hair below whole values (600 ticks = 9999.999... ms)
+    """
+    return round(self.ticks)
+
+  def advance(self, ms):
+    """Move simulated time forward by 'ms' milliseconds."""
+    self.ticks += ms
@@ -0,0 +1,68 @@
+#This is gameinput.py - input sources used by the Bomberman game logic
+import pygame
+
+# ============================================================================
+# FILE: gameinput.py - INPUT SOURCES
+# ============================================================================
+# PURPOSE:
+#   Character never calls pygame.key directly; it asks Game.input_source for
+#   the currently held keys. Implementations:
+#   - KeyboardInput: Live keyboard state from pygame (needs a window)
+#   - ScriptedInput: Keys set by code (headless runs, bots, tests)
+#
+# INTERFACE:
+#   get_pressed() -> object indexable by pygame key constants, returning
+#   True while that key is held (like pygame.key.get_pressed())
+#
+# DEPENDENCIES:
+#   - pygame: Key constants and live keyboard state
+# ============================================================================
+
+# ============================================================================
+# CLASS: KeyboardInput - Real keyboard
+# ============================================================================
+class KeyboardInput:
+  def get_pressed(self):
+    """Return the live keyboard state from pygame."""
+    return pygame.key.get_pressed()
+
+
+# ============================================================================
+# CLASS: KeyState - Set of held keys that reads like pygame.key.get_pressed()
+# ============================================================================
+class KeyState:
+  def __init__(self, keys=()):
+    self.keys = frozenset(keys)
+
+  def __getitem__(self, key):
+    return key in self.keys
+
+
+# ============================================================================
+# CLASS: ScriptedInput - Keys controlled from code
+# ============================================================================
+class ScriptedInput:
+  def __init__(self, keys=()):
+    """CONSTRUCTOR - Start with the given keys held (default: nothing held)"""
+    self.state = KeyState(keys)
+
+  def set_pressed(self, keys):
+    """Replace the set of held keys."""
+    self.state = KeyState(keys)
+
+  def press(self, key):
+    """Hold one more key."""
+    self.state = KeyState(self.state.keys | {key})
+
+  def release(self, key):
+    """Let go of a key."""
+    self.state = KeyState(self.state.keys - {key})
+
+  def get_pressed(self):
+    """Return the current KeyState."""
+    return self.state
+
+
+def key_event(key):
+  """Build the KEYDOWN event Character.input expects for 'key' (no display needed)."""
+  return pygame.event.Event(pygame.KEYDOWN, key=key)
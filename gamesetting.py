@@ -6,9 +6,35 @@ SCREENHEIGHT = 720
 
 
 
-# GAME FRAMES PER SECONDS
+# GAME FRAMES PER SECONDS (render rate cap, 0 = uncapped)
 FPS = 60
 
+# GAME LOGIC TICKS PER SECOND (fixed timestep, independent of the render rate)
+TICK_RATE = 60
+# Most logic ticks run in one frame after a stall (avoids the "spiral of death")
+MAX_TICKS_PER_FRAME = 5
+# Blend sprites/camera between the last two logic ticks when drawing
+RENDER_INTERPOLATION = True
+# Push only the changed screen regions to the display (full update whenever
+# the camera scrolls or the window is resized)
+DIRTY_RECTS = True
+
+# CACHE FOLDER (sprite atlas, generated levels)
+CACHE_DIR = ".cache"
+# Generated level layouts kept in memory / as files in CACHE_DIR/levels
+LEVEL_CACHE_ENTRIES = 16
+LEVEL_CACHE_FILES = 256
+
+# Memory budget for lazily loaded sheets / frame sets (LRU evicted above it)
+ASSET_CACHE_BYTES = 64 * 1024 * 1024
+
+# PROFILER
+PROFILE_HISTORY = 240        # Frames used for the overlay percentiles
+PROFILE_TRACE_PATH = ""      # e.g. "profile_trace.csv" / ".json" to dump every frame on exit
+
+# INPUT RECORDING (replay headlessly with: python replay.py <file>)
+REPLAY_RECORD_PATH = ""      # e.g. "session.bmr" to record every logic tick's input
+
 # Y COORDINATE OFFSET FOR SPRITES
 Y_OFFSET = 92
 
@@ -28,6 +54,24 @@ SIZE = 64  # SIZE OF EACH TILE IN PIXELS
 ROWS = 20
 COLS = 40
 
+# RESOLUTION INDEPENDENCE
+# Game logic always works in SIZE-pixel tiles ("world pixels"). On screen,
+# the tile size follows the window height so the same part of the world is
+# visible at any resolution (720px high = native 64px tiles).
+VIEW_TILES_HIGH = SCREENHEIGHT / SIZE
+MIN_TILE_SIZE = 16
+# Distinct on-screen tile sizes whose scaled frames are kept cached
+SCALED_FRAME_SETS = 2
+
+# Largest world (in pixels) that is baked into one cached surface.
+# Bigger maps are streamed in chunks around the camera (see chunks.py).
+WORLD_LAYER_MAX_PIXELS = 4096 * 4096
+# CHUNK STREAMING (maps above WORLD_LAYER_MAX_PIXELS)
+CHUNK_TILES = 8                 # Chunk edge in tiles (512px at 64px tiles)
+CHUNK_CACHE_SIZE = 48           # Rendered chunks kept (~1 MiB each at 64px tiles)
+CHUNK_MARGIN = 1                # Ring of chunks prefetched around the camera target
+CHUNK_PREFETCH_PER_FRAME = 2    # Off-screen chunks built per frame at most
+
 
 # COLOURS
 BLACK = (0, 0, 0)
@@ -87,3 +131,27 @@ HARD_BLOCK = {"hard_block":[(0,1)]}
 SOFT_BLOCK = {"soft_block":[(0,7)]} #block for purple soft block [(0,7]}
 BOMB = {"bomb": [(0,0),(0,1),(0,2),(0,1),]} #(0,4),(0,5)]}  #bomb animation frames
 #BOMB = {"bomb": [(0,2)]}  #bomb animation frames
+# bombFire.png holds 4 growing blast crosses of 85x85 pixels
+FLAME_TILE = 85
+FLAME = {"flame": [(0,0),(0,1),(0,2),(0,3),(0,2),(0,1)]}  #flame animation frames
+
+# EXPLOSIONS
+BOMB_RANGE = 2          # Tiles a blast reaches in each direction
+FLAME_FRAME_TIME = 60   # Milliseconds per flame animation frame
+# Idle bomb / flame sprites kept for reuse (see pool.py)
+POOL_MAX_FREE = 1024
+
+# ENEMIES
+# enemysmall.png is a grid of 16x16 sprites, 18 pixels apart
+ENEMY_TILE = 16
+ENEMY_STRIDE = 18
+ENEMY = {"walk": [(0,0),(0,1),(0,2),(0,3)]}  #enemy walk animation frames
+ENEMY_COUNT = 4            # Enemies spawned per level
+ENEMY_SPEED = 2            # Pixels per logic tick (must divide SIZE)
+ENEMY_FRAME_TIME = 150     # Milliseconds per enemy animation frame
+ENEMY_SPAWN_DISTANCE = 6   # Minimum tiles between the player start and a spawn
+PATH_MAX_DISTANCE = 32     # Tiles the shared distance field searches from the player
+ENEMY_DANGER_MS = 3000     # Enemies avoid tiles a known blast hits within this time
+
+# ENTITY COLLISIONS
+SPATIAL_CELL_SIZE = SIZE * 2   # Bucket size (world pixels) of the entity spatial hash
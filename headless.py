@@ -0,0 +1,128 @@
+#This is headless.py - runs the Bomberman game logic without a window
+import pygame
+from assets import Assets
+from game import Game
+from gameclock import VirtualClock
+from gameinput import ScriptedInput
+from level_cache import LevelCache
+from profiler import NullProfiler
+import gamesetting as gs
+
+# ============================================================================
+# FILE: headless.py - HEADLESS SIMULATION MODE
+# ============================================================================
+# PURPOSE:
+#   Steps Game.input/Game.update with no display, no SDL video and no real
+#   time. Used for bots, replays, load tests and CI boxes without a screen.
+#   - HeadlessMain: Stand-in for Bomberman (off-screen 'screen' surface)
+#   - HeadlessGame: Owns a Game wired to a VirtualClock and ScriptedInput
+#
+# USAGE:
+#   sim = HeadlessGame(seed=1)
+#   sim.step(keys={pygame.K_RIGHT})                   # one tick holding RIGHT
+#   sim.step(events=[key_event(pygame.K_SPACE)])      # one tick planting a bomb
+#   sim.run(10000)                                    # many ticks, no input
+#
+# DEPENDENCIES:
+#   - pygame: Surfaces (no display mode is ever set)
+#   - Assets, Game: The normal game objects
+#   - VirtualClock, ScriptedInput: Injected time and input sources
+#   - LevelCache: Memory-only level cache (no files written)
+#   - NullProfiler: Default (no-op) timing hooks
+#   - gamesetting: Default screen size and tick rate
+# ============================================================================
+
+# ============================================================================
+# CLASS: HeadlessMain - Minimal replacement for the Bomberman window class
+# ============================================================================
+class HeadlessMain:
+  def __init__(self, size=(gs.SCREENWIDTH, gs.SCREENHEIGHT)):
+    """
+    CONSTRUCTOR - Provide what Game expects from its 'main' object
+
+    NOTES:
+    - self.screen is a plain off-screen Surface; the camera only reads its size
+    - self.running is cleared by the game logic on QUIT/ESC like the real window
+    """
+    self.screen = pygame.Surface(size)
+    self.running = True
+
+
+# ============================================================================
+# CLASS: HeadlessGame - Game driven by code instead of a window
+# ============================================================================
+class HeadlessGame:
+  def __init__(self, seed=None, size=(gs.SCREENWIDTH, gs.SCREENHEIGHT),
+               tick_ms=1000 / gs.TICK_RATE, assets=None, rows=gs.ROWS, cols=gs.COLS,
+               level_cache=None, profiler=None):
+    """
+    CONSTRUCTOR - Build a Game that runs on virtual time and scripted input
+
+    PARAMETERS:
+    - seed: Level generation seed (None = random level)
+    - size: Size of the off-screen 'screen' (drives the camera)
+    - tick_ms: Simulated milliseconds per tick (default: one gs.TICK_RATE tick)
+    - assets: Optional shared Assets instance (loading is the slow part)
+    - rows, cols: Level size in tiles
+    - level_cache: LevelCache to load levels from (default: memory only, so
+      simulations and benchmarks never write level files)
+    - profiler: FrameProfiler timing step() ("game.input", "game.update")
+      and the Game's draw sections (default: NullProfiler)
+    """
+    self.MAIN = HeadlessMain(size)
+    self.ASSETS = assets if assets is not None else Assets()
+    self.clock = VirtualClock()
+    self.input_source = ScriptedInput()
+    self.profiler = profiler if profiler is not None else NullProfiler()
+    if level_cache is None:
+      level_cache = LevelCache(cache_dir=None)
+    self.GAME = Game(self.MAIN, self.ASSETS, seed=seed,
+                     clock=self.clock, input_source=self.input_source,
+                     rows=rows, cols=cols, level_cache=level_cache, profiler=self.profiler)
+    self.tick_ms = tick_ms
+    self.ticks = 0
+
+  def step(self, keys=None, events=()):
+    """
+    STEP - Advance the game by one tick
+
+    PARAMETERS:
+    - keys: Set of held pygame key constants for this tick (None = keep previous)
+    - events: KEYDOWN (or other) events delivered this tick
+    """
+    if keys is not None:
+      self.input_source.set_pressed(keys)
+    with self.profiler.section("game.input"):
+      self.GAME.input(list(events))
+    with self.profiler.section("game.update"):
+      self.GAME.update()
+    self.clock.advance(self.tick_ms)
+    self.ticks += 1
+
+  def run(self, ticks, script=None):
+    """
+    RUN - Advance up to 'ticks' ticks (stops early if the game quits)
+
+    PARAMETERS:
+    - script: Optional callable(tick) -> (keys, events) supplying the input
+      for each tick; keys may be None to keep the previous keys held
+
+    RETURNS:
+    - Number of ticks actually simulated
+    """
+    for tick in range(ticks):
+      if not self.MAIN.running:
+        return tick
+      if script is None:
+        self.step()
+      else:
+        keys, events = script(self.ticks)
+        self.step(keys, events)
+    return ticks
+
+  def render(self, surface=None):
+    """RENDER - Optionally draw the current state to an off-screen surface"""
+    if surface is None:
+      surface = self.MAIN.screen
+    self.GAME.draw(surface)
+    return surface
@@ -0,0 +1,142 @@
+#This is level_cache.py - keeps generated level layouts in memory and on disk
+import os
+import zlib
+from collections import OrderedDict
+import gamesetting as gs
+from level_grid import LevelGrid, HEADER, generate_level, GENERATOR_VERSION
+
+# ============================================================================
+# FILE: level_cache.py - LEVEL LAYOUT CACHE
+# ============================================================================
+# PURPOSE:
+#   Levels are generated from an explicit (seed, level) pair, so the same
+#   pair always gives the same layout. This cache avoids generating it twice:
+#   - Memory: the last gs.LEVEL_CACHE_ENTRIES layouts as compact bytes
+#     (LevelGrid.to_bytes(): header + one byte per cell)
+#   - Disk: one small zlib-compressed file per layout in .cache/levels/,
+#     so restarting the game loads a level instead of regenerating it
+#   Every load returns a fresh LevelGrid, so playing a level (destroying
+#   blocks, planting bombs) never changes the cached layout.
+#
+# FILE FORMAT:
+#   MAGIC (8 bytes) | zlib(LevelGrid.to_bytes())
+#
+# DEPENDENCIES:
+#   - level_grid: Generation and binary (de)serialisation of grids
+#   - zlib, os: Compressed files written atomically
+#   - gamesetting: Cache folder and sizes
+# ============================================================================
+
+MAGIC = b"BMLEVEL1"
+LEVEL_DIR = os.path.join(gs.CACHE_DIR, "levels")
+
+
+# ============================================================================
+# CLASS: LevelCache - (seed, level, rows, cols) -> level layout
+# ============================================================================
+class LevelCache:
+  def __init__(self, cache_dir=LEVEL_DIR, max_entries=gs.LEVEL_CACHE_ENTRIES,
+               max_files=gs.LEVEL_CACHE_FILES):
+    """
+    CONSTRUCTOR - Create an empty cache
+
+    PARAMETERS:
+    - cache_dir: Folder for cached level files (None = memory only)
+    - max_entries: Layouts kept in memory
+    - max_files: Level files kept on disk (oldest deleted first)
+    """
+    self.cache_dir = cache_dir
+    self.max_entries = max_entries
+    self.max_files = max_files
+    self.entries = OrderedDict()   # key -> to_bytes() data
+    self.memory_hits = 0
+    self.disk_hits = 0
+    self.generated = 0
+
+  @staticmethod
+  def key(seed, level, rows, cols):
+    return (seed, level, rows, cols)
+
+  def path(self, key):
+    """Cache file of one layout (the generator version is part of the name)."""
+    return os.path.join(self.cache_dir, "level_v%d_%d_%d_%dx%d.bin" % ((GENERATOR_VERSION,) + key))
+
+  def load(self, seed, level, rows, cols):
+    """
+    LOAD - Return the layout of (seed, level) as a new LevelGrid
+
+    LOOKUP ORDER:
+    1. Memory cache
+    2. Disk cache (.cache/levels/)
+    3. Generate it, then store it in both caches
+    """
+    key = self.key(seed, level, rows, cols)
+    data = self.entries.get(key)
+    if data is not None:
+      self.entries.move_to_end(key)
+      self.memory_hits += 1
+    else:
+      data = self.read(key)
+      if data is not None:
+        self.disk_hits += 1
+      else:
+        data = generate_level(seed, level, rows, cols).to_bytes()
+        self.generated += 1
+        self.write(key, data)
+      self.entries[key] = data
+      while len(self.entries) > self.max_entries:
+        self.entries.popitem(last=False)
+    return LevelGrid.from_bytes(data)
+
+  def read(self, key):
+    """Level bytes from disk, or None if missing / unreadable / wrong size."""
+    if self.cache_dir is None:
+      return None
+    path = self.path(key)
+    try:
+      with open(path, "rb") as file:
+        raw = file.read()
+      # Mark as recently used, so prune() deletes levels nobody plays first
+      os.utime(path)
+    except OSError:
+      return None
+    if not raw.startswith(MAGIC):
+      return None
+    try:
+      data = zlib.decompress(raw[len(MAGIC):])
+    except zlib.error:
+      return None
+    rows, cols = key[2], key[3]
+    if len(data) != HEADER.size + rows * cols:
+      return None
+    return data
+
+  def write(self, key, data):
+    """Store level bytes on disk (best effort: a read-only disk just means no disk cache)."""
+    if self.cache_dir is None:
+      return False
+    path = self.path(key)
+    try:
+      os.makedirs(self.cache_dir, exist_ok=True)
+      # Write to a temp file first so a crash never leaves a half-written level
+      with open(path + ".tmp", "wb") as file:
+        file.write(MAGIC + zlib.compress(data, 6))
+      os.replace(path + ".tmp", path)
+      self.prune()
+    except OSError:
+      return False
+    return True
+
+  def prune(self):
+    """Delete the oldest level files above max_files."""
+    files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+             if name.startswith("level_") and name.endswith(".bin")]
+    if len(files) <= self.max_files:
+      return
+    files.sort(key=os.path.getmtime)
+    for path in files[:len(files) - self.max_files]:
+      os.remove(path)
+
+  def clear(self):
+    """Forget the in-memory layouts (disk files are kept)."""
+    self.entries.clear()
@@ -0,0 +1,220 @@
+#This is level_grid.py - compact level storage for the Bomberman game
+import struct
+import numpy as np
+
+# ============================================================================
+# FILE: level_grid.py - NUMPY-BACKED LEVEL GRID
+# ============================================================================
+# PURPOSE:
+#   Stores the level as one byte per cell instead of a list of lists of
+#   strings and sprite objects. Handles:
+#   - Cell codes (EMPTY, HARD, SOFT, BOMB) in a uint8 NumPy array
+#   - A side table for the few cells that also need an entity (bomb sprite,
+#     soft block sprite, ...)
+#   - Change notifications so caches (world layer, AI, ...) can update
+#   - Vectorised queries (solid/passable masks) and binary serialisation
+#   - Vectorised level generation (hard block lattice + random soft blocks),
+#     reproducible from an explicit (seed, level) pair
+#
+# DEPENDENCIES:
+#   - numpy: Cell storage and vectorised masks
+#   - struct: Binary header for serialisation
+# ============================================================================
+
+# CELL CODES
+EMPTY = 0
+HARD = 1
+SOFT = 2
+BOMB = 3
+
+# Symbols used when printing a grid (same as the sprites' __repr__)
+SYMBOLS = {EMPTY: "_", HARD: "#", SOFT: "@", BOMB: "!"}
+
+# Lookup table: is the cell a wall for movement? Mirrors the block classes'
+# 'passable' flag: only Hard_block sets passable=False, bombs are walked through
+SOLID = np.array([False, True, False, False], dtype=bool)
+
+# Binary header: rows, cols (little endian unsigned ints)
+HEADER = struct.Struct("<II")
+
+# LEVEL GENERATION DEFAULTS
+SOFT_BLOCK_CHANCE = 0.25          # Same odds as choice(["@","_","_","_"])
+SAFE_ZONE = ((2, 5), (1, 4))      # Player start area kept free: rows 2-4, cols 1-3
+# Bump whenever generate_layout() output changes, so cached levels are rebuilt
+GENERATOR_VERSION = 1
+SEED_RANGE = 1 << 32              # Random seeds stay short enough to share
+
+
+# ============================================================================
+# CLASS: LevelGrid - Typed grid of cell codes plus an entity side table
+# ============================================================================
+class LevelGrid:
+  def __init__(self, rows, cols, cells=None):
+    """
+    CONSTRUCTOR - Create an empty grid (or wrap an existing array of codes)
+
+    PARAMETERS:
+    - rows, cols: Grid size in tiles
+    - cells: Optional (rows, cols) uint8 array of cell codes to adopt
+    """
+    self.rows = rows
+    self.cols = cols
+    if cells is None:
+      cells = np.zeros((rows, cols), dtype=np.uint8)
+    self.cells = cells          # One byte per tile (EMPTY/HARD/SOFT/BOMB)
+    self.entities = {}          # (row, col) -> sprite living in that cell
+    self.listeners = []         # Called as listener(row, col) on every change
+
+  # ----------------------------------------------------------------------
+  # QUERIES
+  # ----------------------------------------------------------------------
+  def in_bounds(self, row, col):
+    """Return True if (row, col) is inside the grid."""
+    return 0 <= row < self.rows and 0 <= col < self.cols
+
+  def get(self, row, col):
+    """Return the cell code at (row, col)."""
+    return int(self.cells[row, col])
+
+  def entity(self, row, col):
+    """Return the entity stored at (row, col), or None."""
+    return self.entities.get((row, col))
+
+  def is_empty(self, row, col):
+    """Return True if nothing occupies (row, col)."""
+    return self.cells[row, col] == EMPTY
+
+  def is_solid(self, row, col):
+    """Return True if (row, col) blocks movement (see SOLID)."""
+    return bool(SOLID[self.cells[row, col]])
+
+  def any_solid(self, first_row, last_row, first_col, last_col):
+    """Return True if any cell in the inclusive row/col range blocks movement."""
+    return bool(SOLID[self.cells[first_row:last_row + 1, first_col:last_col + 1]].any())
+
+  def solid_mask(self):
+    """Return a (rows, cols) boolean array, True where movement is blocked."""
+    return SOLID[self.cells]
+
+  def passable_mask(self):
+    """Return a (rows, cols) boolean array, True where movement is allowed."""
+    return ~SOLID[self.cells]
+
+  # ----------------------------------------------------------------------
+  # CHANGES
+  # ----------------------------------------------------------------------
+  def set(self, row, col, code, entity=None):
+    """
+    SET - Change a cell's code (and the entity stored there)
+
+    PARAMETERS:
+    - row, col: Cell to change
+    - code: New cell code
+    - entity: Sprite that lives in the cell, or None for plain tiles
+    """
+    self.cells[row, col] = code
+    if entity is None:
+      self.entities.pop((row, col), None)
+    else:
+      self.entities[(row, col)] = entity
+    for listener in self.listeners:
+      listener(row, col)
+
+  def clear(self, row, col):
+    """CLEAR - Reset a cell to EMPTY and drop its entity."""
+    self.set(row, col, EMPTY)
+
+  def load_cells(self, cells):
+    """
+    LOAD_CELLS - Overwrite every cell code at once (same grid size)
+
+    NOTES:
+    - Entities are dropped; their owners re-register them with set()
+    - Listeners hear only about the cells whose code actually changed
+    """
+    self.entities.clear()
+    # Usual case for rewinds: nothing changed, one byte compare and done
+    if self.cells.tobytes() == cells.tobytes():
+      return
+    changed = np.argwhere(self.cells != cells)
+    self.cells[...] = cells
+    for row, col in changed.tolist():
+      for listener in self.listeners:
+        listener(row, col)
+
+  def add_listener(self, listener):
+    """Register listener(row, col), called whenever a cell changes."""
+    self.listeners.append(listener)
+
+  # ----------------------------------------------------------------------
+  # SERIALISATION
+  # ----------------------------------------------------------------------
+  def to_bytes(self):
+    """Return the cell codes as a compact header + one byte per cell."""
+    return HEADER.pack(self.rows, self.cols) + self.cells.tobytes()
+
+  @classmethod
+  def from_bytes(cls, data):
+    """Rebuild a grid of cell codes from to_bytes() output (entities are not stored)."""
+    rows, cols = HEADER.unpack_from(data)
+    cells = np.frombuffer(data, dtype=np.uint8, count=rows * cols, offset=HEADER.size)
+    return cls(rows, cols, cells.reshape(rows, cols).copy())
+
+  def __str__(self):
+    """Printable map, one row per line, using SYMBOLS."""
+    return "\n".join("".join(SYMBOLS[code] for code in row) for row in self.cells.tolist())
+
+
+def generate_layout(rows, cols, rng, soft_chance=SOFT_BLOCK_CHANCE, safe_zone=SAFE_ZONE):
+  """
+  GENERATE_LAYOUT - Build a new level grid with whole-array operations
+
+  PARAMETERS:
+  - rows, cols: Grid size in tiles
+  - rng: numpy.random.Generator (seed it for reproducible levels)
+  - soft_chance: Probability that an open cell gets a soft block
+  - safe_zone: ((first_row, end_row), (first_col, end_col)) kept free of soft blocks
+
+  LAYOUT:
+  1. Hard blocks on the border and on every (even row, even col) cell
+  2. Soft blocks on the remaining cells with probability soft_chance,
+     except inside the safe zone around the player start
+
+  RETURNS:
+  - LevelGrid holding cell codes only (no sprites are created)
+  """
+  row_idx = np.arange(rows)[:, None]
+  col_idx = np.arange(cols)[None, :]
+
+  # 1. Border + even/even lattice
+  hard = (row_idx == 0) | (row_idx == rows - 1) | (col_idx == 0) | (col_idx == cols - 1) | \
+         ((row_idx % 2 == 0) & (col_idx % 2 == 0))
+
+  # 2. Random soft blocks everywhere else, minus the safe zone
+  (safe_r0, safe_r1), (safe_c0, safe_c1) = safe_zone
+  safe = (row_idx >= safe_r0) & (row_idx < safe_r1) & (col_idx >= safe_c0) & (col_idx < safe_c1)
+  soft = ~hard & ~safe & (rng.random((rows, cols)) < soft_chance)
+
+  cells = np.zeros((rows, cols), dtype=np.uint8)
+  cells[hard] = HARD
+  cells[soft] = SOFT
+  return LevelGrid(rows, cols, cells)
+
+
+def new_seed():
+  """A fresh random level seed (a plain int that can be shown and shared)."""
+  return int(np.random.SeedSequence().entropy % SEED_RANGE)
+
+
+def level_rng(seed, level):
+  """
+  Random generator for one level of one seed. Every (seed, level) pair has
+  its own independent stream, so level 3 is the same whether or not levels
+  1 and 2 were generated first.
+  """
+  return np.random.default_rng([seed, level])
+
+
+def generate_level(seed, level, rows, cols):
+  """GENERATE_LEVEL - The layout of level 'level' for 'seed' (always the same grid)"""
+  return generate_layout(rows, cols, level_rng(seed, level))
@@ -5,18 +5,27 @@
 #   Initializes and runs the main Bomberman game loop. Handles:
 #   - Window creation and management (resizable, fullscreen toggle)
 #   - Event processing (input, window resize, fullscreen toggle with F11)
+#   - Fixed-timestep game logic, decoupled from the render rate
+#   - Frame-time profiling (F3 overlay, optional trace dump on exit)
+#   - Optional input recording for headless replays (gs.REPLAY_RECORD_PATH)
 #   - Game state updates and rendering
 #
 # DEPENDENCIES:
 #   - pygame: Core game engine
 #   - Assets: Loads and manages sprites, images, and game resources
 #   - Game: Core game logic (player, blocks, level management)
+#   - VirtualClock: Game time that advances exactly one tick per logic step
+#   - FrameProfiler: Per-frame timing of input/update/draw/display
+#   - ReplayWriter: Records the input of every logic tick
 #   - gamesetting: Global game configuration and constants
 # ============================================================================
 
 import pygame
 from assets import Assets  # Class to manage all game assets (images, sounds, sprites)
 from game import Game      # Core game logic (levels, players, blocks, camera)
+from gameclock import VirtualClock  # Deterministic game time (advanced per logic tick)
+from profiler import FrameProfiler  # Per-subsystem frame timings + overlay
+from replay import ReplayWriter     # Per-tick input log for headless replays
 import gamesetting as gs   # Global settings (screen size, FPS, colors, tile sizes, etc.)
 import home
 # ============================================================================
@@ -34,7 +43,8 @@ class Bomberman:
     2. Store windowed size for fullscreen toggle restoration
     3. Load game assets (sprites, images)
     4. Create the Game object (handles logic, camera, level)
-    5. Initialize frame rate clock for consistent 60 FPS
+       - Game time comes from a VirtualClock advanced once per logic tick
+    5. Initialize frame rate clock and the fixed-timestep accumulator
     6. Set running flag to control main loop
     """
     # 1. Initialize Pygame modules (MUST be done first before any display operations)
@@ -60,10 +70,27 @@ class Bomberman:
     self.ASSETS = Assets()
     # 5. Create the main Game object
     #    It passes 'self' (the main Bomberman indstance) and the Assets object for the Game class to use
-    self.GAME = Game(self, self.ASSETS)
-    # 6. Create a Clock object to manage the game's frame rate (FPS)
+    #    Game logic reads time from this clock, so animations and bomb fuses
+    #    advance per logic tick and stay deterministic when frames drop
+    self.game_clock = VirtualClock()
+    #    The profiler times every subsystem of each frame (F3 shows the overlay)
+    self.PROFILER = FrameProfiler()
+    self.GAME = Game(self, self.ASSETS, clock=self.game_clock, profiler=self.PROFILER)
+    # 6. Create a Clock object to measure (and optionally cap) the render rate
     self.FPS = pygame.time.Clock()
 
+    # FIXED TIMESTEP - logic always advances in steps of tick_ms
+    self.tick_ms = 1000 / gs.TICK_RATE
+    # Real time not yet simulated, in ms * gs.TICK_RATE: one tick is exactly
+    # 1000 units, so whole-ms frame times never leave float error behind
+    self.accumulator = 0
+    self.pending_events = []   # Events polled but not yet seen by a logic tick
+    self.overlay_rect = None   # Screen area of the profiler overlay last frame
+    # Input of every logic tick goes to this log when recording is enabled
+    self.recorder = None
+    if gs.REPLAY_RECORD_PATH:
+      self.recorder = ReplayWriter.open(gs.REPLAY_RECORD_PATH, self.GAME, self.tick_ms)
+
     self.running = True
 
   def input(self):
@@ -75,17 +102,19 @@ class Bomberman:
     - Handle ESC key to exit game
     - Handle F11 to toggle fullscreen mode
     - Handle window resize events (VIDEORESIZE)
-    - Forward event list to Game and Character for their processing
+    - Queue the event list for the next logic tick (see update())
     
     KEY EVENTS HANDLED:
     1. QUIT: Exit the game when user closes the window
     2. KEYDOWN + ESCAPE: Exit the game when user presses ESC
-    3. KEYDOWN + F11: Toggle between fullscreen and windowed modes
+    3. KEYDOWN + F3: Show/hide the frame-time profiler overlay
+    4. KEYDOWN + F11: Toggle between fullscreen and windowed modes
        - On fullscreen: hides taskbar, hides mouse cursor
        - On windowed: shows cursor, restores previous window size
-    4. VIDEORESIZE: User resizes the window
+    5. VIDEORESIZE: User resizes the window
        - Clamps new size to display resolution
        - Updates stored windowed size for later restoration
+    6. VIDEOEXPOSE / WINDOWEXPOSED: Window contents lost, push a full frame
     """
     # Poll events centrally so we can handle window resize and forward events
     events = pygame.event.get()
@@ -95,6 +124,8 @@ class Bomberman:
       elif event.type == pygame.KEYDOWN:
         if event.key == pygame.K_ESCAPE:
           self.running = False
+        elif event.key == pygame.K_F3:
+          self.PROFILER.toggle_overlay()
         elif event.key == pygame.K_F11:
           # Toggle fullscreen mode
           info = pygame.display.Info()
@@ -115,6 +146,7 @@ class Bomberman:
             w, h = self.windowed_size
             self.screen = pygame.display.set_mode((w, h), pygame.RESIZABLE)
             pygame.mouse.set_visible(True)
+          self.GAME.request_full_update()
       elif event.type == pygame.VIDEORESIZE:
         # Clamp resize to the current display resolution
         info = pygame.display.Info()
@@ -124,31 +156,62 @@ class Bomberman:
         self.screen = pygame.display.set_mode((new_w, new_h), pygame.RESIZABLE)
         if not getattr(self, 'fullscreen', False):
           self.windowed_size = (new_w, new_h)
+        self.GAME.request_full_update()
+      elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+        # The OS lost the window contents: the next frame must push everything
+        self.GAME.request_full_update()
 
-    # Pass the event list to the Game so it can forward to the Character, etc.
-    self.GAME.input(events)
+    # Queue the events for the next logic tick; update() forwards them to the
+    # Game (and so to the Character) exactly once, whatever the frame rate
+    self.pending_events.extend(events)
         
   def update(self):
     """
-    UPDATE - Advance game state and timing
+    UPDATE - Advance game state in fixed logic ticks
     
     RESPONSIBILITIES:
-    1. Control frame rate to maintain consistent 60 FPS
-    2. Delegate game state updates to Game object
-       - This includes sprite updates, player movement, camera interpolation
+    1. Measure how much real time passed since the last frame
+       (and cap the render rate to gs.FPS, 0 = uncapped)
+    2. Run as many fixed logic ticks (1000 / gs.TICK_RATE ms each) as fit
+       in the accumulated time
+       - Each tick: Game.input() (movement, bombs) then Game.update()
+       - The game clock advances by exactly one tick each time
+    3. Leave the remainder in the accumulator for render interpolation
     
     PARAMETERS:
     - None (operates on internal state)
     
     NOTES:
     - Called once per game loop iteration
+    - Gameplay speed is the same at any render rate: a slow frame runs
+      several ticks, a fast frame may run none
+    - At most gs.MAX_TICKS_PER_FRAME ticks run per frame so a long stall
+      (window drag, breakpoint) does not snowball
     - Camera lerp/smoothing happens inside Game.update()
     """
-    # Control the frame rate to a constant value defined in gamesetting (gs.FPS)
-    # This makes the game run at the same speed regardless of the computer's performance.
-    self.FPS.tick(gs.FPS)
-    # Also update the Game logic (handles smoothing camera interpolation)
-    self.GAME.update()
+    # Time spent sleeping for the render cap is reported separately from real work
+    with self.PROFILER.section("wait"):
+      frame_ms = self.FPS.tick(gs.FPS)
+    self.accumulator = min(self.accumulator + frame_ms * gs.TICK_RATE,
+                           1000 * gs.MAX_TICKS_PER_FRAME)
+
+    while self.accumulator >= 1000:
+      # Events are delivered to the first tick only; held keys are polled every tick
+      if self.recorder is not None:
+        self.recorder.record(self.GAME.input_source.get_pressed(), self.pending_events)
+      with self.PROFILER.section("game.input"):
+        self.GAME.input(self.pending_events)
+      self.pending_events = []
+      with self.PROFILER.section("game.update"):
+        self.GAME.update()
+      self.game_clock.advance(self.tick_ms)
+      self.accumulator -= 1000
+
+  def render_alpha(self):
+    """How far (0..1) real time is between the last logic tick and the next one."""
+    if not gs.RENDER_INTERPOLATION:
+      return 1.0
+    return self.accumulator / 1000
 
   # Method for drawing all game elements to the screen
   def draw(self, window):
@@ -159,7 +222,10 @@ class Bomberman:
     1. Fill screen with black background (gs.BLACK)
     2. Delegate drawing to Game object
        - Game draws background tiles, blocks, sprites with camera offsets applied
-    3. Update the display buffer to show the rendered frame
+       - Sprites and camera are blended between the last two logic ticks
+    3. Draw the profiler overlay (if toggled on with F3)
+    4. Update the display: only the dirty rects Game.draw reports, or the
+       whole window when the camera moved (gs.DIRTY_RECTS)
     
     PARAMETERS:
     - window: pygame.Surface representing the main screen
@@ -169,8 +235,18 @@ class Bomberman:
     - All camera offset calculations are handled inside Game.draw()
     """
     # window.blit(self.ASSETS.sprite_sheet,(0,0))
-    self.GAME.draw(window) # Delegate drawing of game world, sprites, and camera-adjusted visuals
-    pygame.display.update() # Swap buffers and display the rendered frame
+    with self.PROFILER.section("draw"):
+      dirty = self.GAME.draw(window, self.render_alpha()) # Delegate drawing of game world, sprites, and camera-adjusted visuals
+    overlay = self.PROFILER.draw_overlay(window)
+    with self.PROFILER.section("display"):
+      if dirty is None:
+        pygame.display.update() # Swap buffers and display the rendered frame
+      else:
+        # Only push what changed; the overlay redraws every frame, and its old
+        # area must be pushed once more when it is hidden
+        dirty.extend(rect for rect in (overlay, self.overlay_rect) if rect is not None)
+        pygame.display.update(dirty)
+    self.overlay_rect = overlay
 
   # The main game loop method
   def rungame(self):
@@ -179,16 +255,24 @@ class Bomberman:
     
     LOOP SEQUENCE (runs every frame):
     1. input() - Process all user input and window events
-    2. update() - Update game state and advance frame timer
+    2. update() - Run zero or more fixed logic ticks for the elapsed time
     3. draw(screen) - Render all visuals to the screen buffer
     
     The loop continues as long as self.running is True.
     When user closes window or presses ESC, running is set to False and loop exits.
+    Every frame is timed by the profiler; its trace is written out on exit
+    when gs.PROFILE_TRACE_PATH is set, and the input log is closed.
     """
     while self.running == True:
-      self.input()           # 1. Handle user input and window events
+      self.PROFILER.begin_frame()
+      with self.PROFILER.section("input"):
+        self.input()         # 1. Handle user input and window events
       self.update()          # 2. Update game state (position, logic, timing)
       self.draw(self.screen) # 3. Render all game visuals
+      self.PROFILER.end_frame()
+    self.PROFILER.dump()
+    if self.recorder is not None:
+      self.recorder.close()
 
 
 # ============================================================================
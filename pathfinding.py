@@ -0,0 +1,168 @@
+#This is pathfinding.py - shared distance field that steers every enemy toward the player
+from collections import deque
+import numpy as np
+import gamesetting as gs
+from level_grid import EMPTY
+
+# ============================================================================
+# FILE: pathfinding.py - GRID DISTANCE FIELD
+# ============================================================================
+# PURPOSE:
+#   Instead of every enemy searching its own path each frame, one
+#   breadth-first search runs outward from the player's tile and stores the
+#   walking distance of every reachable cell. An enemy then just steps to the
+#   neighbouring cell with a smaller distance: O(1) per enemy, so hundreds of
+#   enemies cost the same pathfinding work as one.
+#   - Walkable cells are EMPTY ones (blocks and bombs stop enemies)
+#   - The search stops at gs.PATH_MAX_DISTANCE tiles: enemies further away
+#     wander, and the work per search stays bounded on huge maps
+#   - The field is only rebuilt when it can have changed: the player entered
+#     another tile, or a level cell inside/next to the searched area changed
+#     (block destroyed, bomb placed or gone). Rebuilds happen at most once
+#     per logic tick, in update()
+#
+# DEPENDENCIES:
+#   - numpy: Distance storage
+#   - collections.deque: BFS queue
+#   - level_grid: Cell codes (listener on the level matrix)
+#   - gamesetting: Search radius, tile size, Y offset
+# ============================================================================
+
+UNREACHED = -1
+
+
+# ============================================================================
+# CLASS: DistanceField - Tiles-to-player distances for the current level
+# ============================================================================
+class DistanceField:
+  def __init__(self, game, max_distance=gs.PATH_MAX_DISTANCE):
+    """
+    CONSTRUCTOR - Create an empty field (attach() hooks it to a level)
+
+    PARAMETERS:
+    - game: Game object (player and level matrix)
+    - max_distance: Search radius in tiles
+    """
+    self.GAME = game
+    self.max_distance = max_distance
+    self.rows = 0
+    self.cols = 0
+    self.dist = None        # (rows, cols) int32 distances, UNREACHED outside the field
+    self.flat = None        # Flat memoryview of dist (fast per-cell access)
+    self.codes = None       # Flat memoryview of the level's cell codes
+    self.visited = []       # Flat indices set by the last search
+    self.target = None      # Player tile the field leads to
+    self.stale = True
+    self.rebuilds = 0
+
+  def attach(self, matrix):
+    """ATTACH - Follow a (new) level matrix"""
+    self.rows = matrix.rows
+    self.cols = matrix.cols
+    self.dist = np.full((matrix.rows, matrix.cols), UNREACHED, dtype=np.int32)
+    self.flat = memoryview(self.dist.reshape(-1))
+    self.codes = memoryview(matrix.cells.reshape(-1))
+    self.visited = []
+    self.target = None
+    self.stale = True
+    matrix.add_listener(self.cell_changed)
+
+  def invalidate(self):
+    """Force a rebuild on the next update() (e.g. after a snapshot restore)."""
+    self.stale = True
+
+  def cell_changed(self, row, col):
+    """Level matrix listener: rebuild only if the cell can affect the searched area."""
+    if self.stale:
+      return
+    flat = self.flat
+    index = row * self.cols + col
+    if flat[index] != UNREACHED:
+      self.stale = True
+    elif ((col > 0 and flat[index - 1] != UNREACHED) or
+          (col < self.cols - 1 and flat[index + 1] != UNREACHED) or
+          (row > 0 and flat[index - self.cols] != UNREACHED) or
+          (row < self.rows - 1 and flat[index + self.cols] != UNREACHED)):
+      self.stale = True
+
+  def player_tile(self):
+    """Tile under the centre of the player's hitbox."""
+    rect = self.GAME.PLAYER.rect
+    return (rect.centery - gs.Y_OFFSET) // gs.SIZE, rect.centerx // gs.SIZE
+
+  def update(self):
+    """UPDATE - Rebuild the field if the player changed tile or the level changed nearby"""
+    target = self.player_tile()
+    if target != self.target:
+      self.target = target
+      self.stale = True
+    if self.stale:
+      self.rebuild()
+
+  def rebuild(self):
+    """
+    REBUILD - Breadth-first search from the player's tile
+
+    NOTES:
+    - Only the cells written by the previous search are reset, so the cost
+      depends on the searched area, not on the map size
+    """
+    flat = self.flat
+    for index in self.visited:
+      flat[index] = UNREACHED
+    self.stale = False
+    self.rebuilds += 1
+    row, col = self.target
+    if not (0 <= row < self.rows and 0 <= col < self.cols):
+      self.visited = []
+      return
+
+    codes = self.codes
+    cols = self.cols
+    last = self.rows * cols
+    start = row * cols + col
+    flat[start] = 0
+    visited = [start]
+    queue = deque(visited)
+    max_distance = self.max_distance
+    while queue:
+      index = queue.popleft()
+      distance = flat[index] + 1
+      if distance > max_distance:
+        continue
+      col = index % cols
+      for neighbour in (index - cols, index + cols,
+                        index - 1 if col > 0 else -1,
+                        index + 1 if col < cols - 1 else -1):
+        if 0 <= neighbour < last and flat[neighbour] == UNREACHED and codes[neighbour] == EMPTY:
+          flat[neighbour] = distance
+          visited.append(neighbour)
+          queue.append(neighbour)
+    self.visited = visited
+
+  def walkable(self, row, col):
+    """True if enemies may enter tile (row, col) (inside the map and EMPTY)."""
+    return 0 <= row < self.rows and 0 <= col < self.cols and self.codes[row * self.cols + col] == EMPTY
+
+  def distance(self, row, col):
+    """Walking distance (tiles) from (row, col) to the player, or UNREACHED."""
+    if 0 <= row < self.rows and 0 <= col < self.cols:
+      return self.flat[row * self.cols + col]
+    return UNREACHED
+
+  def next_step(self, row, col):
+    """
+    NEXT_STEP - Neighbouring tile one step closer to the player
+
+    RETURNS:
+    - (row, col) of the neighbour, or None when (row, col) is outside the
+      field or already the player's tile
+    """
+    best = self.distance(row, col)
+    if best <= 0:
+      return None
+    for step_row, step_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+      distance = self.distance(step_row, step_col)
+      if distance != UNREACHED and distance < best:
+        return step_row, step_col
+    return None
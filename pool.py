@@ -0,0 +1,63 @@
+#This is pool.py - reuses short-lived sprites (bombs, flames) instead of re-creating them
+import gamesetting as gs
+
+# ============================================================================
+# FILE: pool.py - SPRITE OBJECT POOL
+# ============================================================================
+# PURPOSE:
+#   Bombs and flames live for a few hundred milliseconds and are created in
+#   bursts. Building a new sprite each time churns Python objects (and the
+#   garbage collector) in the middle of gameplay. A SpritePool keeps the
+#   finished sprites and re-arms them with reset() instead:
+#   - acquire(*args): a recycled sprite reset with args, or a new one
+#   - release(sprite): give a finished (killed) sprite back
+#   After warm-up the steady state creates no new sprites at all.
+#
+# CONTRACT FOR POOLED CLASSES:
+#   - Constructor: SpriteClass(game, *args)
+#   - reset(*args): restore the exact state the constructor would give,
+#     including re-adding the sprite to its group
+#
+# DEPENDENCIES:
+#   - gamesetting: Maximum number of idle sprites kept per pool
+# ============================================================================
+
+
+# ============================================================================
+# CLASS: SpritePool - Free list of one sprite class
+# ============================================================================
+class SpritePool:
+  def __init__(self, sprite_class, game, max_free=gs.POOL_MAX_FREE):
+    """
+    CONSTRUCTOR - Create an empty pool
+
+    PARAMETERS:
+    - sprite_class: Class to build when the pool is empty (Bomb, Flame)
+    - game: Game object passed to new sprites
+    - max_free: Idle sprites kept for reuse; extras are left to the GC
+    """
+    self.sprite_class = sprite_class
+    self.GAME = game
+    self.max_free = max_free
+    self.free = []
+    self.created = 0
+    self.reused = 0
+
+  def acquire(self, *args):
+    """ACQUIRE - Return a sprite set up with args, recycled when possible"""
+    if self.free:
+      sprite = self.free.pop()
+      sprite.reset(*args)
+      self.reused += 1
+      return sprite
+    self.created += 1
+    return self.sprite_class(self.GAME, *args)
+
+  def release(self, sprite):
+    """RELEASE - Keep a finished sprite for the next acquire()"""
+    if len(self.free) < self.max_free:
+      self.free.append(sprite)
+
+  def clear(self):
+    """Drop every idle sprite."""
+    self.free.clear()
@@ -0,0 +1,209 @@
+#This is profiler.py - frame timing instrumentation for the Bomberman game
+import csv
+import json
+import time
+from collections import deque
+import pygame
+import gamesetting as gs
+
+# ============================================================================
+# FILE: profiler.py - FRAME-TIME PROFILER AND OVERLAY
+# ============================================================================
+# PURPOSE:
+#   Measures how long each part of a frame takes. Handles:
+#   - Named timing sections (input, update, draw.background, draw.<group>,
+#     display, ...) accumulated per frame
+#   - Rolling history of the last gs.PROFILE_HISTORY frames with p50/p95/p99
+#   - Toggleable on-screen overlay (F3 in the game window)
+#   - Dumping every recorded frame to CSV or JSON on exit
+#
+# USAGE:
+#   profiler.begin_frame()
+#   with profiler.section("update"):
+#     game.update()
+#   profiler.end_frame()
+#
+# DEPENDENCIES:
+#   - time.perf_counter: High resolution timer
+#   - pygame: Font rendering for the overlay
+#   - gamesetting: History length and trace path
+# ============================================================================
+
+
+# ============================================================================
+# CLASS: _Section - Reusable context manager that times one named section
+# ============================================================================
+class _Section:
+  __slots__ = ("profiler", "name", "start")
+
+  def __init__(self, profiler, name):
+    self.profiler = profiler
+    self.name = name
+    self.start = 0.0
+
+  def __enter__(self):
+    self.start = time.perf_counter()
+    return self
+
+  def __exit__(self, *exc):
+    elapsed_ms = (time.perf_counter() - self.start) * 1000.0
+    current = self.profiler.current
+    current[self.name] = current.get(self.name, 0.0) + elapsed_ms
+    return False
+
+
+# ============================================================================
+# CLASS: FrameProfiler - Per-frame section timings with rolling statistics
+# ============================================================================
+class FrameProfiler:
+  def __init__(self, history=gs.PROFILE_HISTORY, trace_path=gs.PROFILE_TRACE_PATH):
+    """
+    CONSTRUCTOR - Create an empty profiler
+
+    PARAMETERS:
+    - history: Number of recent frames kept for the overlay percentiles
+    - trace_path: File (.csv or .json) written by dump() on exit; when empty
+      only the rolling history is kept, so memory stays flat
+    """
+    self.frames = deque(maxlen=history)   # Recent frames: {section: ms}
+    self.trace = [] if trace_path else None
+    self.trace_path = trace_path
+    self.current = {}                     # Section times of the frame in progress
+    self.sections = {}                    # name -> reusable _Section
+    self.frame_start = 0.0
+    self.overlay_visible = False
+    self.font = None
+
+  # ----------------------------------------------------------------------
+  # RECORDING
+  # ----------------------------------------------------------------------
+  def section(self, name):
+    """Return a context manager that adds its elapsed time to section 'name'."""
+    section = self.sections.get(name)
+    if section is None:
+      section = self.sections[name] = _Section(self, name)
+    return section
+
+  def begin_frame(self):
+    """Start timing a new frame."""
+    self.current = {}
+    self.frame_start = time.perf_counter()
+
+  def end_frame(self):
+    """Finish the frame: store its total time and section times."""
+    self.current["frame"] = (time.perf_counter() - self.frame_start) * 1000.0
+    self.frames.append(self.current)
+    if self.trace is not None:
+      self.trace.append(self.current)
+
+  # ----------------------------------------------------------------------
+  # STATISTICS
+  # ----------------------------------------------------------------------
+  def section_names(self):
+    """Every section seen in the rolling history, 'frame' first."""
+    names = []
+    for frame in self.frames:
+      for name in frame:
+        if name not in names:
+          names.append(name)
+    names.sort(key=lambda name: (name != "frame", name))
+    return names
+
+  def percentiles(self, name, points=(50, 95, 99)):
+    """Return the requested percentiles (ms) of section 'name' over the history."""
+    samples = sorted(frame.get(name, 0.0) for frame in self.frames)
+    if not samples:
+      return tuple(0.0 for _ in points)
+    last = len(samples) - 1
+    return tuple(samples[min(last, int(round(point / 100.0 * last)))] for point in points)
+
+  # ----------------------------------------------------------------------
+  # OVERLAY
+  # ----------------------------------------------------------------------
+  def toggle_overlay(self):
+    """Show/hide the on-screen statistics."""
+    self.overlay_visible = not self.overlay_visible
+
+  def draw_overlay(self, window):
+    """
+    DRAW_OVERLAY - Draw a p50/p95/p99 table of every section in the top-left corner
+
+    RETURNS:
+    - The screen Rect covered by the overlay (None when hidden)
+    """
+    if not self.overlay_visible or not self.frames:
+      return None
+    if self.font is None:
+      self.font = pygame.font.SysFont("monospace", 14)
+
+    lines = ["%-18s %6s %6s %6s" % ("section (ms)", "p50", "p95", "p99")]
+    for name in self.section_names():
+      p50, p95, p99 = self.percentiles(name)
+      lines.append("%-18s %6.2f %6.2f %6.2f" % (name, p50, p95, p99))
+
+    line_h = self.font.get_linesize()
+    width = max(self.font.size(line)[0] for line in lines) + 12
+    box = pygame.Rect(0, 0, width, line_h * len(lines) + 8)
+    background = pygame.Surface(box.size, pygame.SRCALPHA)
+    background.fill((0, 0, 0, 170))
+    window.blit(background, box.topleft)
+    for index, line in enumerate(lines):
+      window.blit(self.font.render(line, True, gs.WHITE), (6, 4 + index * line_h))
+    return box
+
+  # ----------------------------------------------------------------------
+  # TRACE DUMP
+  # ----------------------------------------------------------------------
+  def dump(self, path=None):
+    """
+    DUMP - Write every recorded frame to CSV or JSON (chosen by file extension)
+
+    NOTES:
+    - Uses the full trace when a trace path was configured, otherwise the
+      rolling history
+    """
+    path = path or self.trace_path
+    if not path:
+      return
+    frames = self.trace if self.trace is not None else list(self.frames)
+    names = []
+    for frame in frames:
+      for name in frame:
+        if name not in names:
+          names.append(name)
+
+    if path.endswith(".json"):
+      with open(path, "w") as file:
+        json.dump({"sections": names, "frames": frames}, file)
+    else:
+      with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["frame_index"] + names)
+        for index, frame in enumerate(frames):
+          writer.writerow([index] + ["%.4f" % frame.get(name, 0.0) for name in names])
+
+
+# ============================================================================
+# CLASS: NullProfiler - Does nothing (default when no profiling is wanted)
+# ============================================================================
+class _NullSection:
+  __slots__ = ()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    return False
+
+
+class NullProfiler:
+  _section = _NullSection()
+
+  def section(self, name):
+    return self._section
+
+  def begin_frame(self):
+    pass
+
+  def end_frame(self):
+    pass
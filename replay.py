@@ -0,0 +1,248 @@
+#This is replay.py - records the player's input per logic tick and plays it back headlessly
+import argparse
+import hashlib
+import os
+import struct
+import sys
+import time
+import pygame
+from headless import HeadlessGame
+from gameinput import key_event
+from profiler import FrameProfiler
+import snapshot
+
+# ============================================================================
+# FILE: replay.py - INPUT RECORDING AND DETERMINISTIC REPLAY
+# ============================================================================
+# PURPOSE:
+#   The game logic only sees two inputs per tick: the events passed to
+#   Game.input and the keys held on Game.input_source. Recording exactly
+#   those, tick by tick, reproduces a whole session:
+#   - ReplayWriter: Streams input frames to a compact log while playing
+#   - read_replay(): Reads the log back (header + one input frame per tick)
+#   - play(): Re-simulates a log on a HeadlessGame as fast as the CPU allows,
+#     optionally timing every tick into a FrameProfiler trace
+#
+# FORMAT (little endian):
+#   HEADER: magic, version, seed, level, rows, cols, screen w/h, tick ms
+#   then runs of identical ticks, each RUN + one u32 key per KEYDOWN event:
+#     held  - bit i set while RECORDED_KEYS[i] is held
+#     ticks - number of consecutive ticks with these keys
+#     events - KEYDOWN events on the first tick of the run (0 for most runs)
+#   Walking in one direction for a second is one 5 byte run, not 60 frames.
+#
+# USAGE:
+#   gs.REPLAY_RECORD_PATH = "session.bmr"        # main.py records while playing
+#   python replay.py session.bmr                  # replay, print speed + digest
+#   python replay.py session.bmr --trace t.csv    # + per-tick frame-time trace
+#
+# NOTES:
+#   - Only KEYDOWN events are stored (Character ignores everything else but
+#     QUIT, which just ends the session)
+#   - Window resizes are not recorded; the replay uses the starting screen
+#     size, which only matters to the camera
+#
+# DEPENDENCIES:
+#   - struct: Log format
+#   - HeadlessGame, key_event: Display-less re-simulation
+#   - FrameProfiler: Frame-time trace of the replay
+#   - snapshot: State digest to check two replays ended identically
+# ============================================================================
+
+MAGIC = b"BMREPLAY"
+VERSION = 1
+
+# Keys Character polls every tick; their order is the bit order of 'held'
+RECORDED_KEYS = (pygame.K_RIGHT, pygame.K_LEFT, pygame.K_UP, pygame.K_DOWN,
+                 pygame.K_d, pygame.K_a, pygame.K_w, pygame.K_s)
+
+# magic, version, seed, level, rows, cols, screen width, screen height, tick ms
+HEADER = struct.Struct("<8sHQIIIHHd")
+# held keys, ticks, event count
+RUN = struct.Struct("<HHB")
+EVENT = struct.Struct("<I")
+MAX_RUN_TICKS = 0xFFFF
+MAX_RUN_EVENTS = 0xFF
+
+
+def held_mask(pressed):
+  """Bit mask of the RECORDED_KEYS held in a get_pressed() style key state."""
+  mask = 0
+  for bit, key in enumerate(RECORDED_KEYS):
+    if pressed[key]:
+      mask |= 1 << bit
+  return mask
+
+
+def held_keys(mask):
+  """Set of key constants encoded in a held-key mask."""
+  return {key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit)}
+
+
+# ============================================================================
+# CLASS: ReplayWriter - Streams one input frame per logic tick to a file
+# ============================================================================
+class ReplayWriter:
+  def __init__(self, stream, game, tick_ms):
+    """
+    CONSTRUCTOR - Write the replay header for 'game' to a binary stream
+
+    PARAMETERS:
+    - stream: File object opened for binary writing (closed by close())
+    - game: Game being recorded (seed, level, map size, screen size)
+    - tick_ms: Milliseconds per logic tick
+
+    NOTES:
+    - Start recording before the first logic tick: the level layout is
+      regenerated from the seed, not stored
+    """
+    self.stream = stream
+    width, height = game.MAIN.screen.get_size()
+    matrix = game.level_matrix
+    stream.write(HEADER.pack(MAGIC, VERSION, game.seed, game.level, matrix.rows, matrix.cols,
+                             width, height, tick_ms))
+    self.held = None      # Held mask of the run being collected
+    self.ticks = 0        # Ticks in that run
+    self.events = []      # KEYDOWN keys on the run's first tick
+    self.recorded = 0     # Total ticks recorded
+
+  @classmethod
+  def open(cls, path, game, tick_ms):
+    """Create 'path' and start recording 'game' into it."""
+    return cls(open(path, "wb"), game, tick_ms)
+
+  def record(self, pressed, events):
+    """
+    RECORD - Add one logic tick
+
+    PARAMETERS:
+    - pressed: Key state the tick polled (Game.input_source.get_pressed())
+    - events: Event list the tick passed to Game.input
+    """
+    held = held_mask(pressed)
+    keys = [event.key for event in events if event.type == pygame.KEYDOWN]
+    if keys or held != self.held or self.ticks == MAX_RUN_TICKS:
+      self.flush()
+      self.held = held
+      self.events = keys[:MAX_RUN_EVENTS]
+    self.ticks += 1
+    self.recorded += 1
+
+  def flush(self):
+    """Write the run collected so far."""
+    if self.ticks:
+      self.stream.write(RUN.pack(self.held, self.ticks, len(self.events)))
+      for key in self.events:
+        self.stream.write(EVENT.pack(key))
+    self.ticks = 0
+    self.events = []
+
+  def close(self):
+    """Write the last run and close the stream."""
+    self.flush()
+    self.stream.close()
+
+
+def read_replay(stream):
+  """
+  READ_REPLAY - Parse a replay log
+
+  RETURNS:
+  - (header dict, generator of (held keys, KEYDOWN events) per tick)
+
+  NOTES:
+  - Raises ValueError for files of another format version
+  - Ticks are produced lazily, so long logs are never fully in memory
+  """
+  data = stream.read(HEADER.size)
+  if len(data) < HEADER.size:
+    raise ValueError("replay file is truncated")
+  magic, version, seed, level, rows, cols, width, height, tick_ms = HEADER.unpack(data)
+  if magic != MAGIC or version != VERSION:
+    raise ValueError("not a version %d replay file" % VERSION)
+  header = {"seed": seed, "level": level, "rows": rows, "cols": cols,
+            "size": (width, height), "tick_ms": tick_ms}
+
+  def ticks():
+    while True:
+      data = stream.read(RUN.size)
+      if len(data) < RUN.size:
+        return
+      held, count, event_count = RUN.unpack(data)
+      keys = held_keys(held)
+      events = [key_event(EVENT.unpack(stream.read(EVENT.size))[0]) for _ in range(event_count)]
+      yield keys, events
+      for _ in range(count - 1):
+        yield keys, ()
+
+  return header, ticks()
+
+
+def play(path, assets=None, profiler=None, render=False):
+  """
+  PLAY - Re-simulate a recorded session on a HeadlessGame
+
+  PARAMETERS:
+  - path: Replay file written by ReplayWriter
+  - assets: Optional shared Assets instance
+  - profiler: Optional FrameProfiler; every tick becomes one traced frame
+    (sections "game.input", "game.update", and "draw" with the Game's
+    draw.* sections when render is set)
+  - render: Also draw every tick into the off-screen surface
+
+  RETURNS:
+  - The HeadlessGame in its final state (sim.ticks = ticks replayed)
+  """
+  with open(path, "rb") as stream:
+    header, ticks = read_replay(stream)
+    sim = HeadlessGame(seed=header["seed"], size=header["size"], tick_ms=header["tick_ms"],
+                       assets=assets, rows=header["rows"], cols=header["cols"],
+                       profiler=profiler)
+    if header["level"] != sim.GAME.level:
+      sim.GAME.load_level(header["level"])
+    # Every tick is one profiler frame, timed like the real game loop
+    profiler = sim.profiler
+    for keys, events in ticks:
+      if not sim.MAIN.running:
+        break
+      profiler.begin_frame()
+      sim.step(keys, events)
+      if render:
+        with profiler.section("draw"):
+          sim.render()
+      profiler.end_frame()
+  return sim
+
+
+def state_digest(game):
+  """Short hash of the game state, equal for two identical replays."""
+  return hashlib.sha1(snapshot.save(game)).hexdigest()[:16]
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Replay a recorded Bomberman session headlessly.")
+  parser.add_argument("path", help="replay file (see gs.REPLAY_RECORD_PATH)")
+  parser.add_argument("--trace", help="write a per-tick frame-time trace (.csv or .json)")
+  parser.add_argument("--render", action="store_true", help="also draw every tick off-screen")
+  args = parser.parse_args(argv)
+  path = os.path.abspath(args.path)
+  trace = os.path.abspath(args.trace) if args.trace else ""
+
+  # Assets are loaded with paths relative to the project folder
+  os.chdir(os.path.dirname(os.path.abspath(__file__)))
+  profiler = FrameProfiler(trace_path=trace) if trace else None
+  start = time.perf_counter()
+  sim = play(path, profiler=profiler, render=args.render)
+  elapsed = time.perf_counter() - start
+
+  print("%d ticks in %.2fs (%.0f ticks/s, %.1fx real time)  state %s" % (
+    sim.ticks, elapsed, sim.ticks / elapsed if elapsed else 0.0,
+    sim.ticks * sim.tick_ms / 1000.0 / elapsed if elapsed else 0.0, state_digest(sim.GAME)))
+  if profiler is not None:
+    profiler.dump()
+    print("Trace written to", trace)
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
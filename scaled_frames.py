@@ -0,0 +1,101 @@
+#This is scaled_frames.py - per-tile-size copies of every sprite frame
+from collections import OrderedDict
+import pygame
+import gamesetting as gs
+
+# ============================================================================
+# FILE: scaled_frames.py - SCALE-AWARE FRAME CACHE
+# ============================================================================
+# PURPOSE:
+#   Sprites keep their frames at the logical tile size gs.SIZE. When the
+#   window is resized the on-screen tile size changes, so every frame has to
+#   be shown at a different size. This cache:
+#   - Builds ONE scaled copy of all known frames per distinct tile size
+#     (the first time that size is used, never per frame)
+#   - Keeps the most recently used gs.SCALED_FRAME_SETS sizes and evicts the
+#     rest (e.g. windowed + fullscreen stay cached, old drag sizes go away)
+#   - Returns the original surfaces untouched at the native size
+#
+# DEPENDENCIES:
+#   - pygame: transform.scale (nearest neighbour keeps pixel art crisp)
+#   - gamesetting: Native tile size and how many sizes to keep
+# ============================================================================
+
+# ============================================================================
+# CLASS: ScaledFrameCache - {tile size: {base frame: scaled frame}}
+# ============================================================================
+class ScaledFrameCache:
+  def __init__(self, frame_sets, max_sizes=gs.SCALED_FRAME_SETS):
+    """
+    CONSTRUCTOR - Create an empty cache
+
+    PARAMETERS:
+    - frame_sets: Callable returning the frame collections to pre-scale
+      (lists / dicts of lists of Surfaces, e.g. the Assets sprite sets)
+    - max_sizes: Number of distinct tile sizes kept at once
+    """
+    self.frame_sets = frame_sets
+    self.max_sizes = max_sizes
+    self.sizes = OrderedDict()    # tile size -> {id(base): (base, scaled)}
+    self.tile_size = gs.SIZE
+    self.current = None           # Mapping for self.tile_size (None = native)
+
+  def use(self, tile_size):
+    """
+    USE - Make 'tile_size' the active size, building its frame set if needed
+
+    NOTES:
+    - Called once per draw, but only does work when the size changes
+    """
+    if tile_size == self.tile_size and (self.current is not None or tile_size == gs.SIZE):
+      return
+    self.tile_size = tile_size
+    if tile_size == gs.SIZE:
+      self.current = None
+      return
+    mapping = self.sizes.get(tile_size)
+    if mapping is None:
+      mapping = self.build(tile_size)
+      self.sizes[tile_size] = mapping
+      while len(self.sizes) > self.max_sizes:
+        self.sizes.popitem(last=False)
+    self.sizes.move_to_end(tile_size)
+    self.current = mapping
+
+  def build(self, tile_size):
+    """Scale every frame of every known frame set to 'tile_size' in one pass."""
+    mapping = {}
+    stack = list(self.frame_sets())
+    while stack:
+      item = stack.pop()
+      if isinstance(item, dict):
+        stack.extend(item.values())
+      elif isinstance(item, (list, tuple)):
+        stack.extend(item)
+      elif id(item) not in mapping:
+        mapping[id(item)] = (item, self.scale(item, tile_size))
+    return mapping
+
+  def scale(self, surface, tile_size):
+    """Scale one surface by tile_size / gs.SIZE."""
+    width, height = surface.get_size()
+    return pygame.transform.scale(surface, (max(1, width * tile_size // gs.SIZE),
+                                            max(1, height * tile_size // gs.SIZE)))
+
+  def get(self, surface):
+    """
+    GET - Return 'surface' at the active tile size
+
+    NOTES:
+    - Frames that were not known when the size was built (lazily loaded
+      sets) are scaled on first use and remembered
+    - The base surface is stored next to its copy so a recycled id() can
+      never return the wrong image
+    """
+    mapping = self.current
+    if mapping is None:
+      return surface
+    entry = mapping.get(id(surface))
+    if entry is None or entry[0] is not surface:
+      entry = mapping[id(surface)] = (surface, self.scale(surface, self.tile_size))
+    return entry[1]
@@ -0,0 +1,92 @@
+#This is scheduler.py - timed game events (bomb frames, fuses, chain reactions)
+import heapq
+import itertools
+
+# ============================================================================
+# FILE: scheduler.py - EVENT SCHEDULER
+# ============================================================================
+# PURPOSE:
+#   Lets game objects ask to be called back at a given game time instead of
+#   checking the clock every logic tick:
+#   - schedule(time, callback, *args): run callback(*args) once game time
+#     reaches 'time' (milliseconds on Game.clock)
+#   - cancel(timer): forget a pending callback (e.g. a bomb that exploded early)
+#   - run_due(now): called once per logic tick by Game.update
+#
+#   Pending timers live in a binary heap ordered by (fire time, insertion
+#   order), so a tick with nothing due costs one comparison, no matter how
+#   many bombs are waiting.
+#
+# DEPENDENCIES:
+#   - heapq: Priority queue
+#   - itertools: Tie-break counter (same-time events run in scheduling order)
+# ============================================================================
+
+
+# Pending timers are [fire time, seq, callback, args] lists: the heap then
+# compares them natively (time first, seq breaks ties and is unique)
+TIME, SEQ, CALLBACK, ARGS = range(4)
+
+
+# ============================================================================
+# CLASS: Scheduler - Min-heap of timers keyed by fire time
+# ============================================================================
+class Scheduler:
+  def __init__(self):
+    """CONSTRUCTOR - Start with no pending timers"""
+    self.queue = []
+    self.counter = itertools.count()
+    self.cancelled = 0    # Cancelled timers still sitting in the heap
+
+  def __len__(self):
+    return len(self.queue) - self.cancelled
+
+  def schedule(self, time, callback, *args):
+    """
+    SCHEDULE - Call callback(*args) once game time reaches 'time'
+
+    RETURNS:
+    - The timer entry, which can be passed to cancel()
+    """
+    timer = [time, next(self.counter), callback, args]
+    heapq.heappush(self.queue, timer)
+    return timer
+
+  def cancel(self, timer):
+    """
+    CANCEL - Drop a pending timer (no-op if it already fired)
+
+    NOTES:
+    - The timer is only marked; it is skipped when it reaches the top of
+      the heap (removing from the middle of a heap would be O(n))
+    """
+    if timer is not None and timer[CALLBACK] is not None:
+      timer[CALLBACK] = None
+      timer[ARGS] = ()
+      self.cancelled += 1
+
+  def run_due(self, now):
+    """
+    RUN_DUE - Fire every timer whose time is <= now, in time order
+
+    NOTES:
+    - Callbacks may schedule new timers; ones already due fire in this call
+    - Returns the number of callbacks run
+    """
+    queue = self.queue
+    fired = 0
+    while queue and queue[0][TIME] <= now:
+      timer = heapq.heappop(queue)
+      callback = timer[CALLBACK]
+      if callback is None:
+        self.cancelled -= 1
+        continue
+      timer[CALLBACK] = None
+      callback(*timer[ARGS])
+      fired += 1
+    return fired
+
+  def clear(self):
+    """Forget every pending timer."""
+    self.queue.clear()
+    self.cancelled = 0
@@ -0,0 +1,282 @@
+#This is snapshot.py - compact binary save/restore of the whole game state
+import struct
+import numpy as np
+import gamesetting as gs
+from level_grid import LevelGrid, HEADER
+from scheduler import TIME, SEQ
+from enemy import Enemy
+
+# ============================================================================
+# FILE: snapshot.py - GAME STATE SNAPSHOTS
+# ============================================================================
+# PURPOSE:
+#   save(game) packs everything that changes during play into one small
+#   bytes object; restore(game, data) puts a Game back into that state.
+#   Cheap enough to take every tick (rewind, rollback, crash recovery).
+#   Captured state:
+#   - Game time (VirtualClock), seed, level, camera
+#   - Level matrix cell codes
+#   - Player position, animation and bomb counters
+#   - Every bomb and flame, including when its next scheduled event fires
+#   - Every enemy (position, tile it walks to, heading, animation)
+#
+# FORMAT (little endian, see the Structs below):
+#   GAME_STATE | PLAYER_STATE + action name | level grid (LevelGrid.to_bytes)
+#   | bomb count + BOMB_STATE * n | flame count + FLAME_STATE * n
+#   | enemy count + ENEMY_STATE * n
+#
+# NOTES:
+#   - Snapshots are taken between logic ticks (no explosion is half-done)
+#   - Only the player Character is stored (the game has no other characters)
+#   - Bump VERSION whenever a Struct below changes
+#
+# DEPENDENCIES:
+#   - struct, numpy: Packing
+#   - level_grid: Grid (de)serialisation
+#   - scheduler: Timer layout (fire time of pending events)
+#   - enemy: Enemy sprites created on restore when too few are left
+# ============================================================================
+
+MAGIC = b"BMSNAP"
+VERSION = 2
+
+# magic, version, seed, level, clock ms, camera x/y, previous camera x/y, camera target x/y
+GAME_STATE = struct.Struct("<6sHQId6d")
+# x, y, prev x, prev y, frame index, last frame switch (ms), bombs planted,
+# bomb limit, bomb range, remote, alive, action name length
+PLAYER_STATE = struct.Struct("<4dHdHHH??B")
+COUNT = struct.Struct("<I")
+# row, col, fuse counter, frame index, last frame switch (ms), next frame (ms), passable, remote, range
+BOMB_STATE = struct.Struct("<IIHHdd??H")
+# row, col, frame index, next frame (ms)
+FLAME_STATE = struct.Struct("<IIHd")
+# x, y, prev x, prev y, row, col, target row, target col, heading, frame index,
+# last frame switch (ms), serial
+ENEMY_STATE = struct.Struct("<4dIIIIBHdI")
+
+
+def timer_time(timer, default):
+  """Fire time of a pending scheduler timer (default if there is none)."""
+  return timer[TIME] if timer is not None else default
+
+
+def clock_time(clock):
+  """
+  Current game time in ms: the exact VirtualClock value, or get_ticks() for
+  other clocks (a snapshot of a real-time game can be saved, but only
+  restored into a game on a VirtualClock).
+  """
+  ticks = getattr(clock, "ticks", None)
+  return float(ticks) if ticks is not None else float(clock.get_ticks())
+
+
+def in_timer_order(group):
+  """
+  Sprites of a group ordered by their pending timer (fire time, then seq).
+
+  NOTES:
+  - restore() reschedules in this order, so events due at the same time
+    keep firing in the same order after a rewind
+  """
+  return sorted(group, key=lambda sprite: sprite.frame_timer[TIME:SEQ + 1]
+                if sprite.frame_timer is not None else (float("inf"), 0))
+
+
+def save(game):
+  """
+  SAVE - Pack the game state into bytes
+
+  RETURNS:
+  - bytes accepted by restore()
+  """
+  player = game.PLAYER
+  action = player.action.encode("ascii")
+  now = clock_time(game.clock)
+  parts = [
+    GAME_STATE.pack(MAGIC, VERSION, game.seed, game.level, now,
+                    game.x_camera_offset, game.y_camera_offset,
+                    game.prev_x_camera_offset, game.prev_y_camera_offset,
+                    game.cam_target_x, game.cam_target_y),
+    PLAYER_STATE.pack(player.x, player.y, getattr(player, "prev_x", player.x),
+                      getattr(player, "prev_y", player.y), player.index, player.anim_time_set,
+                      player.bomb_planted, player.bomb_limit, player.bomb_range,
+                      player.remote, player.alive, len(action)),
+    action,
+    game.level_matrix.to_bytes(),
+  ]
+
+  bombs = game.groups["bomb"]
+  parts.append(COUNT.pack(len(bombs)))
+  for bomb in in_timer_order(bombs):
+    parts.append(BOMB_STATE.pack(bomb.row, bomb.col, bomb.bomb_counter, bomb.index, bomb.anim_timer,
+                                 timer_time(bomb.frame_timer, bomb.anim_timer + bomb.anim_frame_time),
+                                 bomb.passable, bomb.remote, bomb.blast_range))
+
+  flames = game.groups["flame"]
+  parts.append(COUNT.pack(len(flames)))
+  for flame in in_timer_order(flames):
+    parts.append(FLAME_STATE.pack(flame.row, flame.col, flame.index,
+                                  timer_time(flame.frame_timer, now)))
+
+  enemies = game.groups["enemy"]
+  parts.append(COUNT.pack(len(enemies)))
+  for enemy in enemies:
+    parts.append(ENEMY_STATE.pack(enemy.x, enemy.y, enemy.prev_x, enemy.prev_y, enemy.row, enemy.col,
+                                  enemy.target_row, enemy.target_col, enemy.heading, enemy.index,
+                                  enemy.anim_time_set, enemy.serial))
+  return b"".join(parts)
+
+
+def restore(game, data):
+  """
+  RESTORE - Put 'game' back into the state stored in 'data'
+
+  STEPS:
+  1. Check the header, set the clock, seed, level and camera
+  2. Load the level cells (listeners only hear about cells that differ)
+  3. Move the player back
+  4. Return current bombs/flames to their pools and re-create the saved
+     ones, rescheduling their next event at the saved time
+  5. Move the enemies back (existing sprites are reused); the distance
+     field is rebuilt on the next tick
+
+  NOTES:
+  - Raises ValueError for data from another format version
+  - The game must run on a VirtualClock (time has to be set back)
+  """
+  (magic, version, seed, level, ticks, cam_x, cam_y, prev_cam_x, prev_cam_y,
+   target_x, target_y) = GAME_STATE.unpack_from(data)
+  if magic != MAGIC or version != VERSION:
+    raise ValueError("not a version %d game snapshot" % VERSION)
+  if not hasattr(game.clock, "ticks"):
+    raise ValueError("restoring a snapshot needs a VirtualClock")
+  offset = GAME_STATE.size
+
+  # 1. Time, level identity, camera
+  game.clock.ticks = ticks
+  game.seed = seed
+  game.level = level
+  game.x_camera_offset = cam_x
+  game.y_camera_offset = cam_y
+  game.prev_x_camera_offset = prev_cam_x
+  game.prev_y_camera_offset = prev_cam_y
+  game.cam_target_x = target_x
+  game.cam_target_y = target_y
+
+  # Drop everything that is about to be replaced
+  game.scheduler.clear()
+  game.explosions.pending = []
+  game.passable_bombs.clear()
+  for name, pool in (("bomb", game.bomb_pool), ("flame", game.flame_pool)):
+    for sprite in game.groups[name].sprites():
+      sprite.frame_timer = None
+      sprite.kill()
+      game.entities.remove(sprite)
+      pool.release(sprite)
+  game.danger.clear()
+
+  (x, y, prev_x, prev_y, index, anim_time_set, bomb_planted, bomb_limit, bomb_range,
+   remote, alive, action_len) = PLAYER_STATE.unpack_from(data, offset)
+  offset += PLAYER_STATE.size
+  action = data[offset:offset + action_len].decode("ascii")
+  offset += action_len
+
+  # 2. Level cells
+  rows, cols = HEADER.unpack_from(data, offset)
+  cells = np.frombuffer(data, dtype=np.uint8, count=rows * cols,
+                        offset=offset + HEADER.size).reshape(rows, cols)
+  offset += HEADER.size + rows * cols
+  matrix = game.level_matrix
+  if (matrix.rows, matrix.cols) == (rows, cols):
+    matrix.load_cells(cells)
+  else:
+    game.set_level_matrix(LevelGrid(rows, cols, cells.copy()))
+
+  # 3. Player
+  player = game.PLAYER
+  player.x = x
+  player.y = y
+  player.prev_x = prev_x
+  player.prev_y = prev_y
+  player.action = action
+  player.index = index
+  player.anim_time_set = anim_time_set
+  player.image = player.image_dict[action][index]
+  player.rect.x = int(x + player.offset)
+  player.rect.y = int(y + player.offset)
+  game.entities.move(player)
+  player.bomb_limit = bomb_limit
+  player.bomb_range = bomb_range
+  player.remote = remote
+  player.alive = alive
+
+  # 4. Bombs and flames (re-armed through the pools, then adjusted)
+  (count,) = COUNT.unpack_from(data, offset)
+  offset += COUNT.size
+  bomb_images = game.ASSETS.bomb["bomb"]
+  for _ in range(count):
+    (row, col, counter, frame, anim_timer, fire_time, passable, bomb_remote,
+     blast_range) = BOMB_STATE.unpack_from(data, offset)
+    offset += BOMB_STATE.size
+    bomb = game.bomb_pool.acquire(bomb_images, game.groups["bomb"], row, col, gs.SIZE,
+                                  bomb_remote, blast_range)
+    bomb.bomb_counter = counter
+    bomb.index = frame
+    bomb.image = bomb.image_list[frame]
+    bomb.anim_timer = anim_timer
+    bomb.passable = passable
+    if not passable:
+      game.passable_bombs.discard(bomb)
+    game.scheduler.cancel(bomb.frame_timer)
+    bomb.frame_timer = game.scheduler.schedule(fire_time, bomb.animation)
+  # Bombs count themselves as they are placed; the saved counter wins
+  player.bomb_planted = bomb_planted
+  # Blast times were marked with fresh fuses: redo them with the saved ones
+  game.danger.clear()
+  for bomb in game.groups["bomb"]:
+    game.danger.add_bomb(bomb)
+
+  (count,) = COUNT.unpack_from(data, offset)
+  offset += COUNT.size
+  flame_images = game.ASSETS.flame["flame"]
+  for _ in range(count):
+    row, col, frame, fire_time = FLAME_STATE.unpack_from(data, offset)
+    offset += FLAME_STATE.size
+    flame = game.flame_pool.acquire(flame_images, game.groups["flame"], row, col, gs.SIZE)
+    flame.index = frame
+    flame.image = flame.image_list[frame]
+    game.scheduler.cancel(flame.frame_timer)
+    flame.frame_timer = game.scheduler.schedule(fire_time, flame.animation)
+
+  # 5. Enemies (the current sprites are reused, extra ones created or killed)
+  group = game.groups["enemy"]
+  current = group.sprites()
+  (count,) = COUNT.unpack_from(data, offset)
+  offset += COUNT.size
+  for number in range(count):
+    (x, y, prev_x, prev_y, row, col, target_row, target_col, heading, frame, anim_time_set,
+     serial) = ENEMY_STATE.unpack_from(data, offset)
+    offset += ENEMY_STATE.size
+    if number < len(current):
+      enemy = current[number]
+      enemy.serial = serial
+    else:
+      enemy = Enemy(game, game.ASSETS.enemy, group, row, col, gs.SIZE, serial)
+    enemy.row = row
+    enemy.col = col
+    enemy.x = x
+    enemy.y = y
+    enemy.rect.topleft = (int(x), int(y))
+    game.entities.move(enemy)
+    enemy.prev_x = prev_x
+    enemy.prev_y = prev_y
+    enemy.set_target(target_row, target_col)
+    enemy.heading = heading
+    enemy.index = frame
+    enemy.image = enemy.image_dict[enemy.action][frame]
+    enemy.anim_time_set = anim_time_set
+  for enemy in current[count:]:
+    enemy.kill()
+  game.paths.invalidate()
+
+  game.request_full_update()
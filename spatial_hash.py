@@ -0,0 +1,155 @@
+#This is spatial_hash.py - uniform grid of moving entities for fast collision lookups
+import gamesetting as gs
+
+# ============================================================================
+# FILE: spatial_hash.py - SPATIAL HASH FOR DYNAMIC ENTITIES
+# ============================================================================
+# PURPOSE:
+#   Entity-vs-entity checks (player vs bomb, enemy vs flame, later pickups
+#   and more players) without testing every pair:
+#   - The world is cut into square buckets of gs.SPATIAL_CELL_SIZE pixels
+#   - Every entity is listed in the buckets its rect overlaps (1 to 4 for
+#     tile-sized sprites), re-bucketed only when it crosses a bucket edge
+#   - query(rect) looks at the buckets under rect only; pairs() only pairs
+#     entities sharing a bucket, so the cost follows local crowding, not the
+#     total number of entities
+#
+# CONTRACT:
+#   - Entities have a pygame Rect in .rect (world pixels)
+#   - Call insert() when an entity appears, move() after its rect changed
+#     (Character.move, Enemy.update) and remove() when it goes away
+#   - Buckets are insertion-ordered dicts, so results come out in the same
+#     order on every run (replays stay deterministic)
+#
+# DEPENDENCIES:
+#   - pygame Rects of the entities: Overlap tests
+#   - gamesetting: Bucket size
+# ============================================================================
+
+
+# ============================================================================
+# CLASS: SpatialHash - Buckets of entities keyed by grid cell
+# ============================================================================
+class SpatialHash:
+  def __init__(self, cell_size=gs.SPATIAL_CELL_SIZE):
+    """
+    CONSTRUCTOR - Create an empty hash
+
+    PARAMETERS:
+    - cell_size: Bucket edge length in world pixels
+    """
+    self.cell_size = cell_size
+    self.buckets = {}     # (cell x, cell y) -> {entity: None} (ordered set)
+    self.bounds = {}      # entity -> (first x, first y, last x, last y) cells it is listed in
+
+  def __len__(self):
+    return len(self.bounds)
+
+  def __contains__(self, entity):
+    return entity in self.bounds
+
+  def cell_bounds(self, rect):
+    """(first x, first y, last x, last y) bucket coordinates covered by a rect."""
+    size = self.cell_size
+    return (rect.left // size, rect.top // size,
+            (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+  def insert(self, entity):
+    """INSERT - Start tracking an entity at its current rect"""
+    bounds = self.cell_bounds(entity.rect)
+    self.bounds[entity] = bounds
+    buckets = self.buckets
+    first_x, first_y, last_x, last_y = bounds
+    for cell_y in range(first_y, last_y + 1):
+      for cell_x in range(first_x, last_x + 1):
+        bucket = buckets.get((cell_x, cell_y))
+        if bucket is None:
+          bucket = buckets[(cell_x, cell_y)] = {}
+        bucket[entity] = None
+
+  def remove(self, entity):
+    """REMOVE - Stop tracking an entity (no-op if it is not tracked)"""
+    bounds = self.bounds.pop(entity, None)
+    if bounds is None:
+      return
+    buckets = self.buckets
+    first_x, first_y, last_x, last_y = bounds
+    for cell_y in range(first_y, last_y + 1):
+      for cell_x in range(first_x, last_x + 1):
+        bucket = buckets[(cell_x, cell_y)]
+        del bucket[entity]
+        if not bucket:
+          del buckets[(cell_x, cell_y)]
+
+  def move(self, entity):
+    """
+    MOVE - Re-bucket an entity after its rect changed
+
+    NOTES:
+    - Costs four divisions and a compare unless a bucket edge was crossed
+    - Inserts entities that are not tracked yet
+    """
+    old = self.bounds.get(entity)
+    if old is not None:
+      if old == self.cell_bounds(entity.rect):
+        return
+      self.remove(entity)
+    self.insert(entity)
+
+  def clear(self):
+    """Forget every entity."""
+    self.buckets.clear()
+    self.bounds.clear()
+
+  def candidates(self, rect):
+    """Entities listed in the buckets under 'rect' (broad phase, no overlap test)."""
+    first_x, first_y, last_x, last_y = self.cell_bounds(rect)
+    buckets = self.buckets
+    if first_x == last_x and first_y == last_y:
+      return list(buckets.get((first_x, first_y), ()))
+    found = {}
+    for cell_y in range(first_y, last_y + 1):
+      for cell_x in range(first_x, last_x + 1):
+        bucket = buckets.get((cell_x, cell_y))
+        if bucket:
+          found.update(bucket)
+    return list(found)
+
+  def query(self, rect, group=None):
+    """
+    QUERY - Entities whose rect overlaps 'rect'
+
+    PARAMETERS:
+    - rect: pygame.Rect (world pixels)
+    - group: Optional sprite group; only its members are returned
+    """
+    return [entity for entity in self.candidates(rect)
+            if entity.rect.colliderect(rect) and (group is None or entity in group)]
+
+  def neighbours(self, entity, group=None):
+    """Other entities overlapping 'entity' (optionally only members of 'group')."""
+    return [other for other in self.query(entity.rect, group) if other is not entity]
+
+  def pairs(self):
+    """
+    PAIRS - Every pair of overlapping entities, each reported once
+
+    RETURNS:
+    - List of (a, b) in a stable order
+    """
+    seen = set()
+    found = []
+    for bucket in self.buckets.values():
+      if len(bucket) < 2:
+        continue
+      members = list(bucket)
+      for index, first in enumerate(members):
+        rect = first.rect
+        for second in members[index + 1:]:
+          key = (id(first), id(second))
+          if key in seen or not rect.colliderect(second.rect):
+            continue
+          seen.add(key)
+          seen.add((id(second), id(first)))
+          found.append((first, second))
+    return found
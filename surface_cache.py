@@ -0,0 +1,91 @@
+#This is surface_cache.py - size-bounded LRU cache for decoded images
+import threading
+from collections import OrderedDict
+
+# ============================================================================
+# FILE: surface_cache.py - LRU SURFACE CACHE
+# ============================================================================
+# PURPOSE:
+#   Keeps decoded sheets and sliced/scaled frame sets in memory up to a byte
+#   budget. When the budget is exceeded the least recently used entries are
+#   dropped (they are simply reloaded on the next access).
+#   - Entries can be a Surface, a list of Surfaces, or {name: [Surface, ...]}
+#   - Thread-safe, so a background prefetch thread can fill it
+#
+# DEPENDENCIES:
+#   - threading: Lock shared with the prefetch thread
+# ============================================================================
+
+
+def surface_bytes(value):
+  """Approximate pixel memory of a Surface / list / dict of Surfaces."""
+  if isinstance(value, dict):
+    return sum(surface_bytes(item) for item in value.values())
+  if isinstance(value, (list, tuple)):
+    return sum(surface_bytes(item) for item in value)
+  width, height = value.get_size()
+  return width * height * value.get_bytesize()
+
+
+# ============================================================================
+# CLASS: LRUSurfaceCache - Least-recently-used cache with a byte budget
+# ============================================================================
+class LRUSurfaceCache:
+  def __init__(self, max_bytes):
+    """
+    CONSTRUCTOR - Create an empty cache
+
+    PARAMETERS:
+    - max_bytes: Pixel memory budget; older entries are evicted above it
+    """
+    self.max_bytes = max_bytes
+    self.entries = OrderedDict()   # key -> (value, size in bytes)
+    self.total_bytes = 0
+    self.lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def get(self, key):
+    """Return the cached value (marking it as recently used), or None."""
+    with self.lock:
+      entry = self.entries.get(key)
+      if entry is None:
+        self.misses += 1
+        return None
+      self.entries.move_to_end(key)
+      self.hits += 1
+      return entry[0]
+
+  def __contains__(self, key):
+    with self.lock:
+      return key in self.entries
+
+  def put(self, key, value):
+    """Store a value and evict the least recently used entries over budget."""
+    size = surface_bytes(value)
+    with self.lock:
+      old = self.entries.pop(key, None)
+      if old is not None:
+        self.total_bytes -= old[1]
+      self.entries[key] = (value, size)
+      self.total_bytes += size
+      # Never evict the entry that was just added, even if it alone is too big
+      while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+        _, (_, evicted_size) = self.entries.popitem(last=False)
+        self.total_bytes -= evicted_size
+        self.evictions += 1
+    return value
+
+  def discard(self, key):
+    """Drop one entry if present."""
+    with self.lock:
+      entry = self.entries.pop(key, None)
+      if entry is not None:
+        self.total_bytes -= entry[1]
+
+  def clear(self):
+    """Drop everything."""
+    with self.lock:
+      self.entries.clear()
+      self.total_bytes = 0
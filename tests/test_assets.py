@@ -0,0 +1,53 @@
+#This is test_assets.py - tests for lazy asset loading and the LRU surface cache
+import pygame
+from assets import Assets
+from surface_cache import LRUSurfaceCache, surface_bytes
+
+
+def surface(size):
+  return pygame.Surface((size, size), pygame.SRCALPHA)
+
+
+def test_lru_evicts_least_recently_used_over_budget():
+  cache = LRUSurfaceCache(max_bytes=3 * surface_bytes(surface(10)))
+  for key in "abc":
+    cache.put(key, surface(10))
+  cache.get("a")
+  cache.put("d", surface(10))
+  assert "b" not in cache
+  assert all(key in cache for key in "acd")
+  assert cache.total_bytes <= cache.max_bytes
+  assert cache.evictions == 1
+
+
+def test_entry_bigger_than_the_budget_is_still_kept():
+  cache = LRUSurfaceCache(max_bytes=10)
+  cache.put("small", surface(1))
+  big = cache.put("big", {"walk": [surface(10), surface(10)]})
+  assert cache.get("big") is big
+  assert "small" not in cache
+
+
+def test_sprite_sets_load_on_first_use_and_are_cached():
+  assets = Assets()
+  assert assets.atlas is None                   # nothing decoded yet
+  assets.register_sprite_set("extra", Assets.SPRITE_SPECS["bomb"])
+  frames = assets.sprite_set("extra")
+  assert frames["bomb"]
+  assert assets.sprite_set("extra") is frames
+  assert assets.atlas is None                   # extra sets never touch the atlas
+
+  assert assets.bomb["bomb"]
+  assert assets.atlas is not None
+
+
+def test_prefetched_sheet_goes_into_the_cache_budget():
+  assets = Assets()
+  assets.register_sprite_set("extra", Assets.SPRITE_SPECS["bomb"])
+  assets.prefetch(["extra"]).join()
+  key = ("sheet", Assets.SPRITE_SPECS["bomb"][0])
+  assert key in assets.cache
+  assert assets.cache.total_bytes == surface_bytes(assets.cache.get(key))
+  frames = assets.sprite_set("extra")
+  assert frames["bomb"]
+  assert assets.prefetch(["extra"]) is None     # sheet is cached now
@@ -0,0 +1,50 @@
+#This is test_atlas.py - tests for the cached sprite atlas
+import pygame
+import gamesetting as gs
+from assets import Assets
+from atlas import MAGIC, atlas_key, load_or_build
+
+
+def pixels(surface):
+  return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_atlas_file_loads_back_the_built_frames(tmp_path):
+  assets = Assets()
+  built = load_or_build(Assets.SPRITE_SPECS, "images", assets, str(tmp_path))
+  files = list(tmp_path.glob("atlas_*.bin"))
+  assert len(files) == 1
+
+  loaded = load_or_build(Assets.SPRITE_SPECS, "images", assets, str(tmp_path))
+  assert loaded.index["sets"] == built.index["sets"]
+  for name in Assets.SPRITE_SPECS:
+    for animation, frames in built.sprite_set(name).items():
+      again = loaded.sprite_set(name)[animation]
+      assert [frame.get_size() for frame in again] == [(gs.SIZE, gs.SIZE)] * len(frames)
+      assert [pixels(frame) for frame in again] == [pixels(frame) for frame in frames]
+
+
+def test_key_changes_with_the_specs():
+  specs = dict(Assets.SPRITE_SPECS)
+  key = atlas_key(specs, "images")
+  assert atlas_key(dict(specs), "images") == key
+  sheet, coords, row, col, width, height = specs["bomb"]
+  specs["bomb"] = (sheet, coords, row, col, width - 1, height)
+  assert atlas_key(specs, "images") != key
+
+
+def test_unreadable_cache_file_is_rebuilt(tmp_path):
+  assets = Assets()
+  path = tmp_path / ("atlas_%s.bin" % atlas_key(Assets.SPRITE_SPECS, "images"))
+  path.write_bytes(b"not an atlas")
+  atlas = load_or_build(Assets.SPRITE_SPECS, "images", assets, str(tmp_path))
+  assert atlas.sprite_set("bomb")["bomb"]
+  assert path.read_bytes().startswith(MAGIC)
+
+
+def test_writing_a_new_atlas_removes_stale_ones(tmp_path):
+  (tmp_path / "atlas_0123456789abcdef0123.bin").write_bytes(b"old")
+  (tmp_path / "notes.txt").write_text("kept")
+  load_or_build(Assets.SPRITE_SPECS, "images", Assets(), str(tmp_path))
+  files = sorted(path.name for path in tmp_path.iterdir())
+  assert files == ["atlas_%s.bin" % atlas_key(Assets.SPRITE_SPECS, "images"), "notes.txt"]
@@ -0,0 +1,14 @@
+#This is test_batch.py - tests for the headless match runner
+import batch
+
+
+def test_matches_are_reproducible_from_their_spec():
+  specs = [(0, 3, "square", 300, 13, 21), (1, 3, "random", 300, 13, 21)]
+  first = list(batch.run_batch(specs, workers=1))
+  again = list(batch.run_batch(specs, workers=1))
+  for result, repeat in zip(first, again):
+    assert result["state"] == repeat["state"]
+    assert result["ticks"] == 300
+    assert result["game_ms"] == 5000
+  assert first[0]["bombs_placed"] > 0
+  assert first[0]["state"] != first[1]["state"]
@@ -0,0 +1,105 @@
+#This is test_character.py - tests for player movement against walls
+import types
+import numpy as np
+import pygame
+import gamesetting as gs
+from character import Character
+from gameclock import VirtualClock
+from level_grid import LevelGrid, SYMBOLS
+from spatial_hash import SpatialHash
+
+
+def make_player(layout):
+  """
+  Player 'P' on a hand-drawn level (LevelGrid symbols), owned by a bare
+  stand-in for Game that only has what Character.move() uses.
+  """
+  lines = layout.replace("P", "_").split()
+  codes = {symbol: code for code, symbol in SYMBOLS.items()}
+  cells = np.array([[codes[symbol] for symbol in line] for line in lines], dtype=np.uint8)
+  game = types.SimpleNamespace(camera_calls=[], clock=VirtualClock(), entities=SpatialHash(),
+                               level_matrix=LevelGrid(len(lines), len(lines[0]), cells))
+  game.update_camera = lambda x, y: game.camera_calls.append((x, y))
+  row, col = next((row, line.index("P")) for row, line in enumerate(layout.split()) if "P" in line)
+  frames = {action: [pygame.Surface((gs.SIZE, gs.SIZE))]
+            for action in ("walk_left", "walk_right", "walk_up", "walk_down")}
+  game.PLAYER = Character(game, frames, pygame.sprite.Group(), row, col, gs.SIZE)
+  return game.PLAYER
+
+
+def test_blocked_axis_is_undone():
+  player = make_player("""
+####
+#P_#
+####
+""")
+  for _ in range(20):
+    player.move("walk_left")
+    assert not player.check_collision()
+  # Stopped on the last step that still fits: 1 px off the wall, rect and x in step
+  assert player.rect.left == gs.SIZE + 1
+  assert player.rect.x == int(player.x + player.offset)
+
+
+def test_player_slides_along_a_wall():
+  player = make_player("""
+#####
+#P__#
+#####
+""")
+  wall_top = 2 * gs.SIZE + gs.Y_OFFSET
+  start_y = player.y
+  for _ in range(10):
+    player.move("walk_down")
+  # Pressed into the wall below: moved until one more step would overlap it
+  assert player.y > start_y
+  assert wall_top - player.speed < player.rect.bottom <= wall_top
+  stopped = player.rect.bottom
+
+  start_x = player.x
+  for _ in range(10):
+    player.move("walk_right")
+  # Still against the wall, yet free to move along it
+  assert player.x == start_x + 10 * player.speed
+  assert player.rect.bottom == stopped
+
+
+def test_check_collision_only_looks_at_overlapped_cells():
+  player = make_player("""
+#_#
+_P_
+#_#
+""")
+  # Corner walls are diagonal neighbours: the hitbox never reaches them
+  assert not player.check_collision()
+  player.rect.move_ip(-11, -11)
+  assert player.check_collision()
+
+
+def test_only_hard_blocks_stop_the_player():
+  player = make_player("""
+#####
+#P@!#
+#####
+""")
+  for _ in range(40):
+    player.move("walk_right")
+  # Soft blocks and bombs are walked through (their 'passable' flag), the wall is not
+  assert player.rect.right <= 4 * gs.SIZE
+  assert player.rect.left > 2 * gs.SIZE
+
+
+def test_only_the_player_moves_the_camera():
+  player = make_player("""
+#####
+#P__#
+#__##
+#####
+""")
+  game = player.GAME
+  player.move("walk_right")
+  assert game.camera_calls == [player.rect.center]
+
+  bot = Character(game, player.image_dict, pygame.sprite.Group(), 1, 2, gs.SIZE)
+  bot.move("walk_down")
+  assert len(game.camera_calls) == 1
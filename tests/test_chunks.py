@@ -0,0 +1,47 @@
+#This is test_chunks.py - tests for chunked rendering of oversized maps
+import gamesetting as gs
+from headless import HeadlessGame
+
+
+def chunked_game():
+  """Headless game on a map too large for one world layer surface."""
+  sim = HeadlessGame(seed=1, rows=100, cols=100)
+  assert not sim.GAME.world_layer.cached
+  return sim.GAME, sim.MAIN.screen
+
+
+def visible_keys(chunks, cam_x, cam_y):
+  first_row, last_row, first_col, last_col = chunks.chunk_range(cam_x, cam_y)
+  return {(row, col) for row in range(first_row, last_row + 1)
+          for col in range(first_col, last_col + 1)}
+
+
+def test_prefetch_never_evicts_chunks_on_screen():
+  game, window = chunked_game()
+  chunks = game.world_layer.chunks
+  game.draw(window)
+  visible = visible_keys(chunks, 0, 0)
+  # One spare slot, while the camera heads far away (a whole ring to prefetch)
+  chunks.max_chunks = len(visible) + 1
+  game.cam_target_x = 40 * gs.SIZE
+  game.cam_target_y = 40 * gs.SIZE
+  builds = chunks.builds
+  for _ in range(3):
+    game.draw(window)
+    assert visible <= set(chunks.surfaces)
+    assert len(chunks.surfaces) <= chunks.max_chunks
+  # The spare slot is used for prefetching; visible chunks are never rebuilt
+  assert chunks.builds > builds
+  assert chunks.builds - builds <= 3
+
+
+def test_full_cache_of_visible_chunks_skips_prefetch():
+  game, window = chunked_game()
+  chunks = game.world_layer.chunks
+  chunks.max_chunks = 1
+  game.cam_target_x = 40 * gs.SIZE
+  game.draw(window)
+  builds = chunks.builds
+  game.draw(window)
+  assert set(chunks.surfaces) == visible_keys(chunks, 0, 0)
+  assert chunks.builds == builds and chunks.evictions == 0
@@ -0,0 +1,115 @@
+#This is test_danger.py - tests for the per-tile blast time map
+import types
+import numpy as np
+import pygame
+import gamesetting as gs
+from character import Bomb
+from danger import DangerMap, SAFE
+from explosion import ExplosionEngine, Flame
+from gameclock import VirtualClock
+from headless import HeadlessGame
+from level_grid import LevelGrid, SYMBOLS, EMPTY
+from pool import SpritePool
+from scheduler import Scheduler
+from spatial_hash import SpatialHash
+
+LEVEL = """
+#########
+#_______#
+#_#@#_#_#
+#_______#
+#########
+"""
+
+
+def level_grid():
+  codes = {symbol: code for code, symbol in SYMBOLS.items()}
+  lines = LEVEL.split()
+  cells = np.array([[codes[symbol] for symbol in line] for line in lines], dtype=np.uint8)
+  return LevelGrid(len(lines), len(lines[0]), cells)
+
+
+def make_game():
+  """Bare stand-in for Game with what bombs and the danger map use."""
+  image = [pygame.Surface((gs.SIZE, gs.SIZE))]
+  game = types.SimpleNamespace(
+    level_matrix=level_grid(), clock=VirtualClock(), scheduler=Scheduler(), entities=SpatialHash(),
+    PLAYER=types.SimpleNamespace(bomb_planted=0), passable_bombs=set(),
+    ASSETS=types.SimpleNamespace(bomb={"bomb": image * 4}, flame={"flame": image}),
+    groups={"bomb": pygame.sprite.Group(), "flame": pygame.sprite.Group()})
+  game.destroy_soft_block = game.level_matrix.clear
+  game.danger = DangerMap(game)
+  game.danger.attach(game.level_matrix)
+  game.explosions = ExplosionEngine(game)
+  game.bomb_pool = SpritePool(Bomb, game)
+  game.flame_pool = SpritePool(Flame, game)
+  return game
+
+
+def plant(game, row, col, blast_range=2, remote=False):
+  return game.bomb_pool.acquire(game.ASSETS.bomb["bomb"], game.groups["bomb"], row, col,
+                                gs.SIZE, remote, blast_range)
+
+
+def test_blast_tiles_get_the_fuse_time():
+  game = make_game()
+  bomb = plant(game, 1, 3)
+  danger = game.danger
+  fuse = danger.fuse_time(bomb)
+
+  for cell in ((1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (2, 3)):
+    assert danger.detonation_time(*cell) == fuse
+  assert danger.detonation_time(1, 6) == SAFE     # out of range
+  assert danger.detonation_time(3, 3) == SAFE     # behind the soft block
+  assert danger.detonation_time(0, 3) == SAFE     # hard block
+  assert not danger.is_safe(1, 2, margin=fuse)
+  assert danger.is_safe(3, 3, margin=fuse)
+
+  danger.remove_bomb(bomb)
+  assert danger.detonation_time(1, 3) == SAFE
+
+
+def test_chained_bomb_inherits_the_earlier_time():
+  game = make_game()
+  plant(game, 1, 1)
+  game.clock.advance(500)
+  game.scheduler.run_due(game.clock.get_ticks())
+  second = plant(game, 1, 3)
+  danger = game.danger
+
+  first_time = danger.detonation_time(1, 1)
+  assert first_time < danger.fuse_time(second)
+  # (1, 5) and (2, 3) are only in the second bomb's blast
+  assert danger.detonation_time(1, 5) == first_time
+  assert danger.detonation_time(2, 3) == first_time
+
+
+def test_destroyed_soft_block_opens_the_ray():
+  game = make_game()
+  bomb = plant(game, 1, 3)
+  assert game.danger.detonation_time(3, 3) == SAFE
+  game.level_matrix.set(2, 3, EMPTY)
+  assert game.danger.detonation_time(3, 3) == game.danger.fuse_time(bomb)
+
+
+def test_remote_bombs_are_dangerous_right_away():
+  game = make_game()
+  plant(game, 1, 5, remote=True)
+  assert game.danger.time_to_blast(1, 5) == 0
+
+
+def test_prediction_matches_the_real_explosion():
+  # The full game loop decides when the fuse really runs out
+  sim = HeadlessGame(seed=7)
+  game = sim.GAME
+  for enemy in game.groups["enemy"].sprites():
+    enemy.kill()
+  game.set_level_matrix(level_grid())
+  bomb = plant(game, 1, 5)
+  predicted = game.danger.detonation_time(1, 5)
+  while bomb.alive():
+    sim.step()
+  # The tick that set the bomb off started at most one tick after the prediction
+  exploded = game.clock.get_ticks() - sim.tick_ms
+  assert predicted <= exploded < predicted + sim.tick_ms + 1e-6
+  assert game.danger.detonation_time(1, 5) == SAFE
@@ -0,0 +1,52 @@
+#This is test_dirty_rects.py - tests for the partial display updates of Game.draw
+import pygame
+import gamesetting as gs
+from headless import HeadlessGame
+
+
+def settled_game():
+  """Headless game drawn twice, so the next draw only reports changes."""
+  sim = HeadlessGame(seed=1)
+  window = pygame.Surface((gs.SCREENWIDTH, gs.SCREENHEIGHT))
+  sim.GAME.draw(window)
+  sim.GAME.draw(window)
+  return sim.GAME, window
+
+
+def test_first_draw_and_idle_frames():
+  sim = HeadlessGame(seed=1)
+  window = pygame.Surface((gs.SCREENWIDTH, gs.SCREENHEIGHT))
+  assert sim.GAME.draw(window) is None
+  assert sim.GAME.draw(window) == []
+
+
+def test_camera_scroll_pushes_the_whole_window():
+  game, window = settled_game()
+  game.x_camera_offset += gs.SIZE
+  game.prev_x_camera_offset = game.x_camera_offset
+  assert game.draw(window) is None
+  # Once the new view has been pushed, an idle frame is empty again
+  assert game.draw(window) == []
+
+
+def test_moved_sprite_covers_old_and_new_position():
+  game, window = settled_game()
+  player = game.PLAYER
+  old = game.sprite_screen_rect(player, player.x - game.x_camera_offset,
+                                player.y - game.y_camera_offset)
+  player.x += 8
+  player.prev_x = player.x
+  new = game.sprite_screen_rect(player, player.x - game.x_camera_offset,
+                                player.y - game.y_camera_offset)
+  rects = game.draw(window)
+  assert rects == [old.union(new)]
+  assert new.left == old.left + 8
+
+
+def test_changed_tile_is_pushed():
+  game, window = settled_game()
+  game.tile_changed(3, 4)
+  tile = game.tile_size
+  cam_x, origin_y = game.world_layer.screen_origin(int(round(game.x_camera_offset)),
+                                                   int(round(game.y_camera_offset)))
+  assert game.draw(window) == [pygame.Rect(4 * tile - cam_x, 3 * tile + origin_y, tile, tile)]
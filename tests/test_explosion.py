@@ -0,0 +1,98 @@
+#This is test_explosion.py - tests for blast rays and chain reactions
+import types
+import numpy as np
+import pygame
+import gamesetting as gs
+from character import Bomb
+from danger import DangerMap
+from explosion import ExplosionEngine, Flame
+from gameclock import VirtualClock
+from level_grid import LevelGrid, SYMBOLS, EMPTY, HARD, SOFT
+from pool import SpritePool
+from scheduler import Scheduler
+from spatial_hash import SpatialHash
+
+LEVEL = """
+#########
+#_______#
+#_#@#_#_#
+#_______#
+#_#_#_#_#
+#__@____#
+#########
+"""
+
+
+def make_game(layout):
+  """Bare stand-in for Game with what bombs and the explosion engine use."""
+  codes = {symbol: code for code, symbol in SYMBOLS.items()}
+  lines = layout.split()
+  cells = np.array([[codes[symbol] for symbol in line] for line in lines], dtype=np.uint8)
+  matrix = LevelGrid(len(lines), len(lines[0]), cells)
+  image = [pygame.Surface((gs.SIZE, gs.SIZE))]
+  game = types.SimpleNamespace(
+    level_matrix=matrix, clock=VirtualClock(), scheduler=Scheduler(), entities=SpatialHash(),
+    PLAYER=types.SimpleNamespace(bomb_planted=0), passable_bombs=set(),
+    ASSETS=types.SimpleNamespace(flame={"flame": image}),
+    groups={"bomb": pygame.sprite.Group(), "flame": pygame.sprite.Group()},
+    destroy_soft_block=matrix.clear)
+  game.danger = DangerMap(game)
+  game.danger.attach(matrix)
+  game.explosions = ExplosionEngine(game)
+  game.bomb_pool = SpritePool(Bomb, game)
+  game.flame_pool = SpritePool(Flame, game)
+  return game
+
+
+def plant(game, row, col, blast_range=2):
+  image = [pygame.Surface((gs.SIZE, gs.SIZE))]
+  return game.bomb_pool.acquire(image, game.groups["bomb"], row, col, gs.SIZE, True, blast_range)
+
+
+def test_rays_stop_at_hard_blocks_and_burn_soft_blocks():
+  game = make_game(LEVEL)
+  matrix = game.level_matrix
+  bomb = plant(game, 1, 3)
+
+  game.explosions.detonate(bomb)
+  burning = game.explosions.process()
+
+  assert burning == {(1, 3), (1, 1), (1, 2), (1, 4), (1, 5), (2, 3)}
+  assert matrix.get(2, 3) == EMPTY          # soft block destroyed
+  assert matrix.get(0, 3) == HARD           # border untouched
+  assert matrix.get(1, 3) == EMPTY          # bomb left the grid
+  assert not bomb.alive()
+  assert {(flame.row, flame.col) for flame in game.groups["flame"]} == burning
+
+
+def test_chain_reaction_resolves_every_bomb_once():
+  game = make_game(LEVEL)
+  first = plant(game, 3, 1)
+  second = plant(game, 3, 3)
+  third = plant(game, 3, 5)
+  far = plant(game, 1, 7)
+
+  game.explosions.detonate(first)
+  game.explosions.detonate(first)            # duplicates are ignored
+  burning = game.explosions.process()
+
+  assert not first.alive() and not second.alive() and not third.alive()
+  assert far.alive()
+  assert (3, 7) in burning and (1, 7) not in burning
+  assert len(game.groups["flame"]) == len(burning)
+  assert game.explosions.process() == set()
+
+
+def test_ray_stops_at_first_soft_block():
+  game = make_game("""
+#######
+#_@@__#
+#######
+""")
+  bomb = plant(game, 1, 1, blast_range=4)
+  game.explosions.detonate(bomb)
+  burning = game.explosions.process()
+
+  assert burning == {(1, 1), (1, 2)}
+  assert game.level_matrix.get(1, 2) == EMPTY
+  assert game.level_matrix.get(1, 3) == SOFT
@@ -0,0 +1,17 @@
+#This is test_gameclock.py - tests for the virtual game clock
+from gameclock import VirtualClock
+
+
+def test_float_steps_add_up_to_whole_milliseconds():
+  clock = VirtualClock()
+  for _ in range(600):
+    clock.advance(1000 / 60)
+  assert clock.get_ticks() == 10000
+
+
+def test_time_only_moves_when_advanced():
+  clock = VirtualClock(start=250)
+  assert clock.get_ticks() == 250
+  clock.advance(16)
+  clock.advance(17)
+  assert clock.get_ticks() == 283
@@ -0,0 +1,55 @@
+#This is test_level_cache.py - tests for the (seed, level) layout cache
+import numpy as np
+from level_cache import LevelCache
+from level_grid import generate_level, EMPTY
+
+
+def test_same_key_gives_same_layout_from_memory_then_disk(tmp_path):
+  cache = LevelCache(cache_dir=str(tmp_path))
+  first = cache.load(5, 1, 13, 21)
+  assert cache.generated == 1
+  again = cache.load(5, 1, 13, 21)
+  assert cache.memory_hits == 1
+  assert np.array_equal(first.cells, again.cells)
+  assert np.array_equal(first.cells, generate_level(5, 1, 13, 21).cells)
+
+  # A new cache on the same folder reads the file instead of generating
+  reopened = LevelCache(cache_dir=str(tmp_path))
+  from_disk = reopened.load(5, 1, 13, 21)
+  assert (reopened.disk_hits, reopened.generated) == (1, 0)
+  assert np.array_equal(first.cells, from_disk.cells)
+
+
+def test_every_key_part_selects_its_own_layout():
+  cache = LevelCache(cache_dir=None)
+  base = cache.load(5, 1, 13, 21)
+  assert not np.array_equal(base.cells, cache.load(6, 1, 13, 21).cells)
+  assert not np.array_equal(base.cells, cache.load(5, 2, 13, 21).cells)
+  assert cache.load(5, 1, 15, 21).cells.shape == (15, 21)
+  assert cache.generated == 4
+
+
+def test_loaded_grids_do_not_share_cells():
+  cache = LevelCache(cache_dir=None)
+  played = cache.load(5, 1, 13, 21)
+  played.cells[...] = EMPTY
+  assert cache.load(5, 1, 13, 21).cells.any()
+
+
+def test_memory_entries_are_bounded_and_files_pruned(tmp_path):
+  cache = LevelCache(cache_dir=str(tmp_path), max_entries=2, max_files=3)
+  for level in range(5):
+    cache.load(1, level, 13, 21)
+  assert len(cache.entries) == 2
+  assert len(list(tmp_path.glob("level_*.bin"))) == 3
+
+
+def test_corrupt_file_is_regenerated(tmp_path):
+  cache = LevelCache(cache_dir=str(tmp_path))
+  expected = cache.load(3, 1, 13, 21).cells.copy()
+  path = cache.path(cache.key(3, 1, 13, 21))
+  with open(path, "wb") as file:
+    file.write(b"garbage")
+  fresh = LevelCache(cache_dir=str(tmp_path))
+  assert np.array_equal(fresh.load(3, 1, 13, 21).cells, expected)
+  assert fresh.generated == 1
@@ -0,0 +1,74 @@
+#This is test_main_loop.py - tests for the fixed-timestep game loop
+import pygame
+import pytest
+import gamesetting as gs
+
+
+class FrameClock:
+  """Stands in for pygame.time.Clock: tick() returns the given frame times (ms)."""
+  def __init__(self, *frames):
+    self.frames = list(frames)
+
+  def tick(self, fps=0):
+    return self.frames.pop(0)
+
+
+@pytest.fixture
+def bomberman(monkeypatch):
+  pygame.init()
+  # main.py shows the home menu when imported; close it like a player would
+  pygame.event.post(pygame.event.Event(pygame.QUIT))
+  import main
+  game = main.Bomberman()
+  delivered = []
+  game_input = game.GAME.input
+
+  def record_input(events):
+    delivered.append(list(events))
+    game_input(events)
+
+  monkeypatch.setattr(game.GAME, "input", record_input)
+  game.delivered = delivered
+  yield game
+  pygame.quit()
+
+
+def test_long_frame_runs_exactly_max_ticks(bomberman):
+  bomberman.FPS = FrameClock(10000)
+  bomberman.update()
+  assert len(bomberman.delivered) == gs.MAX_TICKS_PER_FRAME
+  # The stall is dropped, not carried into the next frames
+  assert bomberman.accumulator == 0
+
+
+def test_whole_ms_frames_add_up_to_exact_ticks(bomberman):
+  # One second of 17/17/16 ms frames is exactly gs.TICK_RATE ticks
+  frames = [17, 17, 16] * (gs.TICK_RATE // 3)
+  bomberman.FPS = FrameClock(*frames)
+  for _ in frames:
+    bomberman.update()
+  assert len(bomberman.delivered) == gs.TICK_RATE
+  assert bomberman.accumulator == 0
+  assert bomberman.game_clock.get_ticks() == 1000
+
+
+def test_events_reach_exactly_one_tick(bomberman):
+  tick = bomberman.tick_ms
+  events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_b)]
+  bomberman.pending_events = list(events)
+  bomberman.FPS = FrameClock(3.5 * tick, 0.25 * tick, 0.25 * tick)
+
+  bomberman.update()
+  assert [len(batch) for batch in bomberman.delivered] == [2, 0, 0]
+  assert bomberman.delivered[0] == events
+  assert bomberman.render_alpha() == pytest.approx(0.5)
+
+  # Events that arrive while no tick is due wait for the next tick
+  late = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c)
+  bomberman.pending_events.append(late)
+  bomberman.update()
+  assert len(bomberman.delivered) == 3
+  bomberman.update()
+  assert bomberman.delivered[3] == [late]
+  assert bomberman.pending_events == []
@@ -0,0 +1,100 @@
+#This is test_pathfinding.py - tests for the shared distance field and enemy steering
+import types
+import numpy as np
+import pygame
+import gamesetting as gs
+from danger import DangerMap
+from enemy import Enemy
+from gameclock import VirtualClock
+from level_grid import LevelGrid, SYMBOLS, BOMB, EMPTY
+from pathfinding import DistanceField, UNREACHED
+from spatial_hash import SpatialHash
+
+LEVEL = """
+#########
+#_______#
+#_#####_#
+#_#___#_#
+#_#_#_#_#
+#___#___#
+#########
+"""
+
+
+def make_game(max_distance=gs.PATH_MAX_DISTANCE):
+  """Bare stand-in for Game: LEVEL, a player hitbox, distance field and danger map."""
+  codes = {symbol: code for code, symbol in SYMBOLS.items()}
+  lines = LEVEL.split()
+  cells = np.array([[codes[symbol] for symbol in line] for line in lines], dtype=np.uint8)
+  game = types.SimpleNamespace(level_matrix=LevelGrid(len(lines), len(lines[0]), cells),
+                               PLAYER=types.SimpleNamespace(rect=pygame.Rect(0, 0, gs.SIZE, gs.SIZE)),
+                               clock=VirtualClock(), entities=SpatialHash())
+  game.paths = DistanceField(game, max_distance)
+  game.paths.attach(game.level_matrix)
+  game.danger = DangerMap(game)
+  game.danger.attach(game.level_matrix)
+  return game
+
+
+def put_player(game, row, col):
+  game.PLAYER.rect.center = (col * gs.SIZE + gs.SIZE // 2, row * gs.SIZE + gs.Y_OFFSET + gs.SIZE // 2)
+
+
+def test_distances_follow_walkable_cells():
+  game = make_game()
+  put_player(game, 1, 1)
+  game.paths.update()
+  paths = game.paths
+
+  assert paths.distance(1, 1) == 0
+  assert paths.distance(1, 7) == 6
+  assert paths.distance(5, 1) == 4
+  assert paths.distance(3, 3) == 8           # down the left side, in from below
+  assert paths.distance(2, 2) == UNREACHED   # hard block
+  assert paths.distance(-1, 0) == UNREACHED
+  step = paths.next_step(5, 3)
+  assert paths.distance(*step) == paths.distance(5, 3) - 1
+  assert paths.next_step(1, 1) is None
+
+
+def test_search_stops_at_max_distance():
+  game = make_game(max_distance=3)
+  put_player(game, 1, 1)
+  game.paths.update()
+  assert game.paths.distance(1, 4) == 3
+  assert game.paths.distance(1, 5) == UNREACHED
+
+
+def test_rebuilds_only_when_the_field_can_change():
+  game = make_game(max_distance=2)
+  matrix = game.level_matrix
+  paths = game.paths
+  put_player(game, 1, 1)
+  paths.update()
+  rebuilds = paths.rebuilds
+
+  paths.update()
+  matrix.set(5, 7, BOMB)                      # far outside the field
+  paths.update()
+  assert paths.rebuilds == rebuilds
+
+  matrix.set(1, 2, BOMB)                      # inside: path to (1, 3) is cut
+  paths.update()
+  assert paths.rebuilds == rebuilds + 1
+  assert paths.distance(1, 3) == UNREACHED
+  matrix.set(1, 2, EMPTY)
+  put_player(game, 1, 2)
+  paths.update()
+  assert paths.rebuilds == rebuilds + 2
+  assert paths.distance(1, 3) == 1
+
+
+def test_enemy_walks_to_the_player():
+  game = make_game()
+  put_player(game, 1, 1)
+  frames = {"walk": [pygame.Surface((gs.SIZE, gs.SIZE))]}
+  enemy = Enemy(game, frames, pygame.sprite.Group(), 5, 7, gs.SIZE)
+  for _ in range(10 * gs.SIZE // gs.ENEMY_SPEED + 5):
+    game.paths.update()
+    enemy.update()
+  assert (enemy.row, enemy.col) == (1, 1)
@@ -0,0 +1,40 @@
+#This is test_pool.py - tests for the bomb/flame sprite pool
+from pool import SpritePool
+
+
+class Token:
+  """Minimal pooled class: remembers its constructor/reset arguments."""
+  def __init__(self, game, *args):
+    self.GAME = game
+    self.reset(*args)
+
+  def reset(self, *args):
+    self.args = args
+
+
+def test_released_sprite_is_reused_and_reset():
+  pool = SpritePool(Token, "game")
+  first = pool.acquire(1, 2)
+  pool.release(first)
+  again = pool.acquire(3, 4)
+
+  assert again is first
+  assert again.args == (3, 4)
+  assert again.GAME == "game"
+  assert (pool.created, pool.reused) == (1, 1)
+  # Empty pool: a new sprite is built
+  assert pool.acquire(5) is not first
+  assert (pool.created, pool.reused) == (2, 1)
+
+
+def test_free_list_is_capped_at_max_free():
+  pool = SpritePool(Token, None, max_free=2)
+  sprites = [pool.acquire(n) for n in range(4)]
+  for sprite in sprites:
+    pool.release(sprite)
+  assert pool.free == sprites[:2]
+
+  pool.clear()
+  assert pool.free == []
+  pool.acquire(0)
+  assert pool.created == 5
@@ -0,0 +1,75 @@
+#This is test_replay.py - tests for input recording and headless replays
+import io
+import pygame
+import pytest
+from gameinput import ScriptedInput, key_event
+from headless import HeadlessGame
+from profiler import FrameProfiler
+from replay import ReplayWriter, read_replay, play, state_digest, RUN, HEADER
+
+WALK = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP]
+
+
+def walk_and_bomb(tick):
+  """Walk a square, changing direction every 17 ticks; plant a bomb every 25."""
+  events = [key_event(pygame.K_SPACE)] if tick % 25 == 0 else []
+  return {WALK[(tick // 17) % len(WALK)]}, events
+
+
+def record_ticks(game, ticks):
+  """Record (held keys, events) ticks into a buffer; returns its bytes."""
+  stream = io.BytesIO()
+  writer = ReplayWriter(stream, game, 1000 / 60)
+  state = ScriptedInput()
+  for keys, events in ticks:
+    state.set_pressed(keys)
+    writer.record(state.get_pressed(), events)
+  writer.flush()
+  return stream.getvalue()
+
+
+def test_runs_are_length_encoded_and_decode_tick_by_tick():
+  game = HeadlessGame(seed=7).GAME
+  ticks = ([({pygame.K_RIGHT}, [])] * 100 +
+           [({pygame.K_RIGHT}, [key_event(pygame.K_SPACE)])] +
+           [({pygame.K_UP, pygame.K_a}, [])] * 50 +
+           [(set(), [key_event(pygame.K_LCTRL), key_event(pygame.K_SPACE)])])
+  data = record_ticks(game, ticks)
+
+  # Four runs: RIGHT, RIGHT + SPACE, UP + A, nothing + two events
+  assert len(data) == HEADER.size + 4 * RUN.size + 3 * 4
+
+  header, decoded = read_replay(io.BytesIO(data))
+  assert header["seed"] == game.seed and header["level"] == game.level
+  decoded = [(keys, [event.key for event in events]) for keys, events in decoded]
+  assert decoded == [(keys, [event.key for event in events]) for keys, events in ticks]
+
+
+def test_replay_reaches_the_recorded_state(tmp_path):
+  sim = HeadlessGame(seed=7)
+  path = str(tmp_path / "session.bmr")
+  writer = ReplayWriter.open(path, sim.GAME, sim.tick_ms)
+  for tick in range(600):
+    keys, events = walk_and_bomb(tick)
+    sim.input_source.set_pressed(keys)
+    writer.record(sim.input_source.get_pressed(), events)
+    sim.step(None, events)
+  writer.close()
+
+  replayed = play(path, assets=sim.ASSETS)
+  assert replayed.ticks == 600
+  assert state_digest(replayed.GAME) == state_digest(sim.GAME)
+
+  # Profiling times the same steps and does not change the outcome
+  profiler = FrameProfiler(trace_path="")
+  profiled = play(path, assets=sim.ASSETS, profiler=profiler, render=True)
+  assert state_digest(profiled.GAME) == state_digest(sim.GAME)
+  assert len(profiler.frames) == min(600, profiler.frames.maxlen)
+  assert {"frame", "game.input", "game.update", "draw", "draw.background"} <= set(profiler.section_names())
+
+
+def test_other_files_are_rejected():
+  with pytest.raises(ValueError):
+    read_replay(io.BytesIO(b"BMSNAP"))
+  with pytest.raises(ValueError):
+    read_replay(io.BytesIO(b"X" * HEADER.size))
@@ -0,0 +1,63 @@
+#This is test_scheduler.py - tests for the timed event scheduler
+from scheduler import Scheduler
+
+
+def test_due_timers_fire_in_time_then_scheduling_order():
+  scheduler = Scheduler()
+  fired = []
+  scheduler.schedule(30, fired.append, "c")
+  scheduler.schedule(10, fired.append, "a")
+  scheduler.schedule(10, fired.append, "b")
+  scheduler.schedule(50, fired.append, "late")
+
+  assert scheduler.run_due(5) == 0
+  assert scheduler.run_due(30) == 3
+  assert fired == ["a", "b", "c"]
+  assert len(scheduler) == 1
+
+
+def test_cancelled_timer_is_skipped_and_not_counted():
+  scheduler = Scheduler()
+  fired = []
+  keep = scheduler.schedule(10, fired.append, "keep")
+  drop = scheduler.schedule(10, fired.append, "drop")
+  scheduler.cancel(drop)
+
+  # Lazy cancel: still in the heap, but no longer pending
+  assert len(scheduler.queue) == 2
+  assert len(scheduler) == 1
+  assert scheduler.run_due(10) == 1
+  assert fired == ["keep"]
+  assert scheduler.cancelled == 0
+  assert len(scheduler) == 0
+
+  # Cancelling a timer that already fired changes nothing
+  scheduler.cancel(keep)
+  scheduler.cancel(None)
+  assert scheduler.cancelled == 0
+  assert len(scheduler) == 0
+
+
+def test_callbacks_can_schedule_timers_that_are_already_due():
+  scheduler = Scheduler()
+  fired = []
+
+  def chain(depth):
+    fired.append(depth)
+    if depth < 3:
+      scheduler.schedule(20, chain, depth + 1)
+
+  scheduler.schedule(20, chain, 0)
+  assert scheduler.run_due(20) == 4
+  assert fired == [0, 1, 2, 3]
+
+
+def test_clear_forgets_pending_and_cancelled_timers():
+  scheduler = Scheduler()
+  fired = []
+  scheduler.cancel(scheduler.schedule(10, fired.append, 1))
+  scheduler.schedule(10, fired.append, 2)
+  scheduler.clear()
+  assert len(scheduler) == 0
+  assert scheduler.run_due(100) == 0
+  assert fired == []
@@ -0,0 +1,82 @@
+#This is test_snapshot.py - tests for binary game state snapshots
+import pygame
+import pytest
+import snapshot
+from gameclock import WallClock
+from gameinput import key_event
+from headless import HeadlessGame
+
+WALK = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP]
+
+
+def walk_and_bomb(tick):
+  """Walk a square, changing direction every 17 ticks; plant a bomb every 25."""
+  events = [key_event(pygame.K_SPACE)] if tick % 25 == 0 else []
+  return {WALK[(tick // 17) % len(WALK)]}, events
+
+
+def test_save_restore_save_round_trips():
+  sim = HeadlessGame(seed=7)
+  sim.run(300, walk_and_bomb)
+  data = snapshot.save(sim.GAME)
+  sim.run(200, walk_and_bomb)
+  snapshot.restore(sim.GAME, data)
+  assert snapshot.save(sim.GAME) == data
+
+
+def test_restore_then_resimulate_gives_same_state():
+  sim = HeadlessGame(seed=7)
+  sim.run(300, walk_and_bomb)
+  data = snapshot.save(sim.GAME)
+  assert sim.GAME.groups["bomb"]
+  sim.run(400, walk_and_bomb)
+  expected = snapshot.save(sim.GAME)
+
+  snapshot.restore(sim.GAME, data)
+  sim.ticks = 300
+  sim.run(400, walk_and_bomb)
+  assert snapshot.save(sim.GAME) == expected
+
+  # Also into a game that never saw this level
+  other = HeadlessGame(seed=99)
+  snapshot.restore(other.GAME, data)
+  other.ticks = 300
+  other.run(400, walk_and_bomb)
+  assert snapshot.save(other.GAME) == expected
+
+
+def test_other_version_is_rejected():
+  sim = HeadlessGame(seed=7)
+  data = bytearray(snapshot.save(sim.GAME))
+  data[len(snapshot.MAGIC)] ^= 0xFF
+  with pytest.raises(ValueError):
+    snapshot.restore(sim.GAME, bytes(data))
+
+
+def test_real_time_game_can_be_saved_but_not_restored_into():
+  sim = HeadlessGame(seed=7)
+  sim.run(100, walk_and_bomb)
+  sim.GAME.clock = WallClock()
+  data = snapshot.save(sim.GAME)
+  with pytest.raises(ValueError):
+    snapshot.restore(sim.GAME, data)
+
+  # A game on virtual time takes it, starting at the saved wall time
+  other = HeadlessGame(seed=7)
+  snapshot.restore(other.GAME, data)
+  assert other.clock.ticks == snapshot.GAME_STATE.unpack_from(data)[4]
+  assert snapshot.save(other.GAME)[snapshot.GAME_STATE.size:] == data[snapshot.GAME_STATE.size:]
+
+
+def test_restore_reuses_enemies_and_keeps_the_spatial_hash():
+  sim = HeadlessGame(seed=7)
+  game = sim.GAME
+  data = snapshot.save(game)
+  enemies = game.groups["enemy"].sprites()
+  sim.run(300, walk_and_bomb)
+  snapshot.restore(game, data)
+  assert game.groups["enemy"].sprites() == enemies
+  tracked = 1 + len(game.groups["enemy"]) + len(game.groups["bomb"])
+  assert len(game.entities) == tracked
+  for entity, bounds in game.entities.bounds.items():
+    assert bounds == game.entities.cell_bounds(entity.rect)
@@ -0,0 +1,101 @@
+#This is test_spatial_hash.py - tests for the entity spatial hash
+import itertools
+import numpy as np
+import pygame
+from gameinput import key_event
+from headless import HeadlessGame
+from level_grid import LevelGrid, SYMBOLS
+from spatial_hash import SpatialHash
+
+WALK = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP]
+
+
+class Box:
+  def __init__(self, x, y, size=20):
+    self.rect = pygame.Rect(x, y, size, size)
+
+
+def test_query_and_move_follow_the_rect():
+  entities = SpatialHash(cell_size=32)
+  box = Box(10, 10)
+  entities.insert(box)
+  assert entities.query(pygame.Rect(0, 0, 16, 16)) == [box]
+  assert entities.query(pygame.Rect(100, 100, 16, 16)) == []
+
+  box.rect.topleft = (300, 40)
+  entities.move(box)
+  assert entities.query(pygame.Rect(0, 0, 16, 16)) == []
+  assert entities.query(pygame.Rect(305, 45, 4, 4)) == [box]
+  assert entities.bounds[box] == entities.cell_bounds(box.rect)
+
+  entities.remove(box)
+  entities.remove(box)                  # already gone: no-op
+  assert len(entities) == 0 and not entities.buckets
+
+
+def test_query_filters_by_group():
+  entities = SpatialHash(cell_size=32)
+  inside = pygame.sprite.Sprite()
+  inside.rect = pygame.Rect(0, 0, 20, 20)
+  outside = Box(5, 5)
+  group = pygame.sprite.Group(inside)
+  entities.insert(inside)
+  entities.insert(outside)
+  assert entities.query(pygame.Rect(0, 0, 10, 10), group) == [inside]
+  assert entities.neighbours(outside) == [inside]
+
+
+def test_pairs_match_brute_force():
+  rng = np.random.default_rng(4)
+  boxes = [Box(int(x), int(y), int(size)) for x, y, size in
+           zip(rng.integers(-50, 400, 120), rng.integers(-50, 400, 120), rng.integers(4, 60, 120))]
+  entities = SpatialHash(cell_size=32)
+  for box in boxes:
+    entities.insert(box)
+  for box in boxes[::3]:
+    box.rect.move_ip(int(rng.integers(-40, 40)), int(rng.integers(-40, 40)))
+    entities.move(box)
+
+  found = {frozenset((id(a), id(b))) for a, b in entities.pairs()}
+  expected = {frozenset((id(a), id(b))) for a, b in itertools.combinations(boxes, 2)
+              if a.rect.colliderect(b.rect)}
+  assert found == expected
+  assert len(entities.pairs()) == len(expected)
+
+
+def walk_and_bomb(tick):
+  """Walk a square, changing direction every 17 ticks; plant a bomb every 25."""
+  events = [key_event(pygame.K_SPACE)] if tick % 25 == 0 else []
+  return {WALK[(tick // 17) % len(WALK)]}, events
+
+
+def test_game_tracks_characters_enemies_and_bombs():
+  sim = HeadlessGame(seed=7)
+  sim.run(400, walk_and_bomb)
+  game = sim.GAME
+  tracked = [game.PLAYER] + list(game.groups["enemy"]) + list(game.groups["bomb"])
+  assert len(game.entities) == len(tracked)
+  for entity in tracked:
+    assert game.entities.bounds[entity] == game.entities.cell_bounds(entity.rect)
+
+
+def test_bomb_stays_passable_until_the_player_leaves_it():
+  sim = HeadlessGame(seed=7)
+  game = sim.GAME
+  for enemy in game.groups["enemy"].sprites():
+    enemy.kill()
+  # The player starts on row 3: a corridor to walk along
+  lines = ["#" * 12] * 3 + ["#" + "_" * 10 + "#", "#" * 12]
+  codes = {symbol: code for code, symbol in SYMBOLS.items()}
+  cells = np.array([[codes[symbol] for symbol in line] for line in lines], dtype=np.uint8)
+  game.set_level_matrix(LevelGrid(len(lines), len(lines[0]), cells))
+  sim.step({pygame.K_RIGHT}, [key_event(pygame.K_SPACE)])
+  (bomb,) = game.groups["bomb"]
+  for _ in range(60):
+    if not game.PLAYER.rect.colliderect(bomb.rect):
+      break
+    assert bomb.passable and bomb in game.passable_bombs
+    sim.step()
+  sim.step()
+  assert not game.PLAYER.rect.colliderect(bomb.rect)
+  assert not bomb.passable and not game.passable_bombs
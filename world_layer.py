@@ -0,0 +1,154 @@
+#This is world_layer.py - caches the static world (background + blocks) for Bomberman
+import pygame
+import gamesetting as gs
+from chunks import ChunkCache
+
+# ============================================================================
+# FILE: world_layer.py - PRE-RENDERED STATIC TILE LAYER
+# ============================================================================
+# PURPOSE:
+#   Bakes everything that never moves (background tiles, hard blocks and
+#   soft blocks) into one off-screen surface so Game.draw can show the whole
+#   visible world with a single sub-rect blit instead of one blit per tile.
+#   - Built once, the first time the world is drawn
+#   - Only the tiles marked dirty are re-rendered (soft block destroyed,
+#     bomb placed/removed in the level matrix)
+#   - Maps too large to bake (gs.WORLD_LAYER_MAX_PIXELS) are streamed in
+#     chunks around the camera instead (see chunks.py)
+#   - The layer is baked at the on-screen tile size (Game.tile_size), so a
+#     resized window costs one rebuild instead of scaling every frame
+#
+# DEPENDENCIES:
+#   - pygame: Surfaces and rects
+#   - Game.block_types: Shared block image per cell code
+#   - ChunkCache: Chunked rendering of oversized maps
+#   - gamesetting: Y offset and cache budget
+#   - Game.frames: Tile images scaled to the on-screen tile size
+# ============================================================================
+
+# ============================================================================
+# CLASS: WorldLayer - Cached surface of the static level
+# ============================================================================
+class WorldLayer:
+  def __init__(self, game):
+    """
+    CONSTRUCTOR - Prepare an (unbuilt) cache for the game's level matrix
+
+    PARAMETERS:
+    - game: Game object that owns the level matrix and the assets
+
+    NOTES:
+    - The surface is created lazily in build() so the cache can be made
+      before the display mode exists
+    """
+    self.GAME = game
+    self.surface = None     # Baked world at the on-screen tile size
+    self.dirty = set()      # (row, col) tiles waiting to be re-rendered
+
+    # One shared image per block cell code, taken from the game's flyweight
+    # block types (bombs are drawn as sprites)
+    self.tile_images = {code: block.image for code, block in self.GAME.block_types.items()}
+
+    self.cached = self.fits_budget()
+    # Oversized maps: rendered chunks near the camera
+    self.chunks = ChunkCache(self)
+
+  def fits_budget(self):
+    """True when the whole map, at the current tile size, fits in the cache budget."""
+    matrix = self.GAME.level_matrix
+    tile = self.GAME.tile_size
+    return (matrix.rows * tile) * (matrix.cols * tile) <= gs.WORLD_LAYER_MAX_PIXELS
+
+  def resize(self):
+    """RESIZE - The on-screen tile size changed: drop the layer, rebuild on the next draw"""
+    self.surface = None
+    self.dirty.clear()
+    self.chunks.clear()
+    self.cached = self.fits_budget()
+
+  def build(self):
+    """BUILD - Render every tile of the level matrix into a fresh surface"""
+    matrix = self.GAME.level_matrix
+    rows = matrix.rows
+    cols = matrix.cols
+    tile = self.GAME.tile_size
+    self.surface = pygame.Surface((cols * tile, rows * tile))
+    # Match the display pixel format so the per-frame blit is a plain copy
+    if pygame.display.get_surface() is not None:
+      self.surface = self.surface.convert()
+
+    for row_num in range(rows):
+      for col_num in range(cols):
+        self.render_tile(row_num, col_num)
+    self.dirty.clear()
+
+  def mark_dirty(self, row, col):
+    """MARK_DIRTY - Queue a single tile to be re-rendered before the next draw"""
+    if self.cached:
+      self.dirty.add((row, col))
+    else:
+      self.chunks.mark_dirty(row, col)
+
+  def render_tile(self, row, col, target=None, pos=None):
+    """
+    RENDER_TILE - Paint one tile: background first, then its block (if any)
+
+    PARAMETERS:
+    - row, col: Tile to paint
+    - target: Surface to paint on (defaults to the cached layer)
+    - pos: Pixel position on target (defaults to the tile's layer position)
+    """
+    if target is None:
+      target = self.surface
+    if pos is None:
+      pos = (col * self.GAME.tile_size, row * self.GAME.tile_size)
+    frames = self.GAME.frames
+    target.blit(frames.get(self.GAME.ASSETS.background["background"][0]), pos)
+    image = self.tile_images.get(self.GAME.level_matrix.get(row, col))
+    # Bombs live in the matrix too but are animated, so they are drawn as sprites
+    if image is not None:
+      target.blit(frames.get(image), pos)
+
+  def refresh(self):
+    """REFRESH - Re-render only the tiles that changed since the last draw"""
+    if self.surface is None:
+      self.build()
+      return
+    for row, col in self.dirty:
+      self.render_tile(row, col)
+    self.dirty.clear()
+
+  def draw(self, window, cam_x, cam_y):
+    """
+    DRAW - Copy the visible part of the cached world onto the window
+
+    PARAMETERS:
+    - window: pygame.Surface to draw on
+    - cam_x, cam_y: Integer camera offsets (world pixels)
+
+    NOTES:
+    - The layer's top-left corner sits at world (0, Y_OFFSET), so on screen
+      it is at (-cam_x, Y_OFFSET - cam_y), multiplied by the render scale
+    - Only the window-sized area is blitted, clipped to the layer bounds
+    - Oversized maps are drawn from the chunk cache instead
+    """
+    if not self.cached:
+      self.chunks.draw(window, cam_x, cam_y)
+      return
+    self.refresh()
+    cam_px, origin_y = self.screen_origin(cam_x, cam_y)
+    area = pygame.Rect(cam_px, -origin_y, window.get_width(), window.get_height())
+    area = area.clip(self.surface.get_rect())
+    if area.width and area.height:
+      window.blit(self.surface, (area.x - cam_px, area.y + origin_y), area)
+
+  def screen_origin(self, cam_x, cam_y):
+    """
+    SCREEN_ORIGIN - Screen pixels of the camera x and of the layer's top edge
+
+    NOTES:
+    - Rounded the same way as Game.blit_sprite, so sprites on the grid line
+      up exactly with the baked tiles at any scale
+    """
+    scale = self.GAME.scale
+    return round(cam_x * scale), round((gs.Y_OFFSET - cam_y) * scale)